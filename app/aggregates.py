@@ -0,0 +1,361 @@
+"""Precomputed aggregation cube for the filtered KPIs.
+
+Most metrics on the Interactive Visualizations page are aggregations over
+the same filter dimensions. ``AggregateCube`` groups the frame once by
+Departamento × Sexo × Categoría laboral × age band and keeps, per cell, the
+row count and the sum, sum of squares, min and max of each measure (plus
+the cross products needed for correlations). A filter selection is then a
+roll-up of the matching cells instead of a scan of every row.
+
+Age bands are ``band_width`` years wide. The default of one year matches
+the integer age slider, so every slider range maps to whole bands and the
+roll-ups are exact. Order statistics (quartiles) cannot be rolled up and
+still come from the rows.
+
+The cube also keeps fine-bin counts per cell for the histogram columns (see
+``histograms``), so filtered histograms and their KDE curves are roll-ups too.
+
+Everything but min and max is additive, so ``add_rows`` and ``remove_rows``
+update the cube in place for an incremental refresh. Removing a row that
+held a cell's min or max marks the cell stale until ``refresh_extrema`` is
+given that cell's remaining rows.
+"""
+import numpy as np
+import pandas as pd
+
+from histograms import HISTOGRAM_BINS, BinGrid
+
+CUBE_DIMENSIONS = ["Departamento", "Sexo", "Categoría laboral"]
+BAND_COLUMN = "Edad"
+
+CUBE_MEASURES = [
+    "Edad",
+    "Salario Anual Actual 2020",
+    "Antigüedad Años",
+    "Evaluación Desempeño",
+    "Horas de formación recibidas",
+    "Rotación Externa",
+    "Rotación Interna",
+]
+
+CUBE_CROSS_PRODUCTS = [("Horas de formación recibidas", "Evaluación Desempeño")]
+
+
+class AggregateCube:
+    """Count, sum, sum of squares, min and max per dimension cell."""
+
+    def __init__(self, df, dimensions=CUBE_DIMENSIONS, measures=CUBE_MEASURES,
+                 band_column=BAND_COLUMN, band_width=1, cross_products=CUBE_CROSS_PRODUCTS,
+                 histogram_bins=HISTOGRAM_BINS):
+        self.dimensions = [column for column in dimensions if column in df.columns]
+        self.measures = [column for column in measures if column in df.columns]
+        self.cross_products = [pair for pair in cross_products if set(pair) <= set(self.measures)]
+        self.band_column = band_column
+        self.band_width = band_width
+
+        keys = {}
+        self.categories = {}
+        for column in self.dimensions:
+            codes, uniques = pd.factorize(df[column], sort=True)
+            keys[column] = codes
+            self.categories[column] = list(uniques)
+        keys["band"] = (df[band_column].to_numpy() // band_width).astype(np.int64)
+
+        values = {column: df[column].to_numpy(dtype=float) for column in self.measures}
+        work = pd.DataFrame({**keys, **values})
+        for column in self.measures:
+            work[f"{column}²"] = values[column] ** 2
+        for x, y in self.cross_products:
+            work[f"{x}×{y}"] = values[x] * values[y]
+
+        grouped = work.groupby(list(keys), sort=False)
+        sums = grouped.sum()
+        minima = grouped[self.measures].min()
+        maxima = grouped[self.measures].max()
+
+        # Owned copies: pandas hands out read-only views and add_rows/remove_rows write in place
+        cells = sums.index.to_frame(index=False)
+        self.cell_codes = {column: cells[column].to_numpy() for column in keys}
+        self.count = grouped.size().to_numpy(copy=True)
+        self.sum = {column: sums[column].to_numpy(copy=True) for column in self.measures}
+        self.sumsq = {column: sums[f"{column}²"].to_numpy(copy=True) for column in self.measures}
+        self.min = {column: minima[column].to_numpy(copy=True) for column in self.measures}
+        self.max = {column: maxima[column].to_numpy(copy=True) for column in self.measures}
+        self.cross = {pair: sums[f"{pair[0]}×{pair[1]}"].to_numpy(copy=True) for pair in self.cross_products}
+        self.stale_cells = set()
+        self._cell_lookup = None
+
+        # Fine-bin counts and in-bin position sums per cell: {column: (n_cells, n_fine) array}
+        cell_of_row = grouped.ngroup().to_numpy()
+        self.bin_grids = {}
+        self.histogram_counts = {}
+        self.histogram_fractions = {}
+        for column, bins in histogram_bins.items():
+            if column not in df.columns:
+                continue
+            values = df[column].to_numpy(dtype=float)
+            grid = BinGrid(values, bins)
+            index, fraction = grid.bin_index(values)
+            valid = index >= 0
+            flat = cell_of_row[valid] * grid.n_fine + index[valid]
+            size = self.n_cells * grid.n_fine
+            self.bin_grids[column] = grid
+            self.histogram_counts[column] = np.bincount(flat, minlength=size).reshape(self.n_cells, grid.n_fine)
+            self.histogram_fractions[column] = np.bincount(
+                flat, weights=fraction[valid], minlength=size
+            ).reshape(self.n_cells, grid.n_fine)
+
+    @property
+    def n_cells(self):
+        return len(self.count)
+
+    @property
+    def columns(self):
+        """Frame columns the cube reads."""
+        return list(dict.fromkeys([*self.dimensions, self.band_column, *self.measures, *self.bin_grids]))
+
+    def _key_codes(self, rows, create):
+        """Cell key codes of ``rows``; unknown categories get new codes when ``create``."""
+        keys = {}
+        for column in self.dimensions:
+            categories = self.categories[column]
+            # Match the distinct values only, then spread the codes to the rows
+            row_codes, values = pd.factorize(rows[column])
+            if create:
+                known = pd.Index(categories, dtype=object)
+                categories.extend(value for value in values if value not in known)
+            value_codes = pd.Index(categories, dtype=object).get_indexer(values)
+            # Missing values keep code -1 as in the build, unknown values get -2 (no cell)
+            lookup = np.append(np.where(value_codes < 0, -2, value_codes), -1)
+            codes = lookup[row_codes]
+            keys[column] = codes.astype(np.int64)
+        keys["band"] = (rows[self.band_column].to_numpy() // self.band_width).astype(np.int64)
+        return keys
+
+    def _cells_for(self, rows, create=False):
+        """Cell of each row (-1 if it has no cell), appending empty cells when ``create``."""
+        if self._cell_lookup is None:
+            self._cell_lookup = pd.MultiIndex.from_arrays(list(self.cell_codes.values()))
+        keys = self._key_codes(rows, create)
+        cells = self._cell_lookup.get_indexer(pd.MultiIndex.from_arrays(list(keys.values())))
+        missing = cells < 0
+        if create and missing.any():
+            new_keys = pd.MultiIndex.from_arrays([codes[missing] for codes in keys.values()]).unique()
+            self._append_cells(np.column_stack([new_keys.get_level_values(i) for i in range(new_keys.nlevels)]))
+            self._cell_lookup = pd.MultiIndex.from_arrays(list(self.cell_codes.values()))
+            cells = self._cell_lookup.get_indexer(pd.MultiIndex.from_arrays(list(keys.values())))
+        return cells.astype(np.int64)
+
+    def _append_cells(self, keys):
+        n_new = len(keys)
+        for position, column in enumerate(self.cell_codes):
+            self.cell_codes[column] = np.concatenate([self.cell_codes[column], keys[:, position]])
+        self.count = np.concatenate([self.count, np.zeros(n_new, dtype=self.count.dtype)])
+        for table, fill in ((self.sum, 0.0), (self.sumsq, 0.0), (self.cross, 0.0), (self.min, np.nan), (self.max, np.nan)):
+            for column in table:
+                table[column] = np.concatenate([table[column], np.full(n_new, fill)])
+        for table in (self.histogram_counts, self.histogram_fractions):
+            for column, counts in table.items():
+                table[column] = np.concatenate([counts, np.zeros((n_new, counts.shape[1]), dtype=counts.dtype)])
+
+    def covers(self, rows):
+        """Whether ``rows`` fall inside the fixed histogram grids (otherwise rebuild the cube)."""
+        for column, grid in self.bin_grids.items():
+            values = rows[column].to_numpy(dtype=float)
+            values = values[np.isfinite(values)]
+            if len(values) and (values.min() < grid.low or values.max() > grid.low + grid.n_fine * grid.width):
+                return False
+        return True
+
+    def _apply(self, rows, cells, sign):
+        np.add.at(self.count, cells, sign)
+        values = {column: rows[column].to_numpy(dtype=float) for column in self.measures}
+        for column, column_values in values.items():
+            np.add.at(self.sum[column], cells, sign * np.nan_to_num(column_values))
+            np.add.at(self.sumsq[column], cells, sign * np.nan_to_num(column_values) ** 2)
+        for pair in self.cross_products:
+            np.add.at(self.cross[pair], cells, sign * np.nan_to_num(values[pair[0]] * values[pair[1]]))
+        for column, grid in self.bin_grids.items():
+            index, fraction = grid.bin_index(rows[column].to_numpy(dtype=float))
+            valid = index >= 0
+            np.add.at(self.histogram_counts[column], (cells[valid], index[valid]), sign)
+            np.add.at(self.histogram_fractions[column], (cells[valid], index[valid]), sign * fraction[valid])
+        return values
+
+    def add_rows(self, rows):
+        """Add the contributions of new (or updated) rows."""
+        cells = self._cells_for(rows, create=True)
+        values = self._apply(rows, cells, 1)
+        for column, column_values in values.items():
+            np.fmin.at(self.min[column], cells, column_values)
+            np.fmax.at(self.max[column], cells, column_values)
+
+    def remove_rows(self, rows):
+        """Subtract the contributions of removed rows (or of updated rows' old values)."""
+        cells = self._cells_for(rows)
+        values = self._apply(rows, cells, -1)
+        for column, column_values in values.items():
+            # A removed extreme leaves the cell's true min/max unknown
+            at_extreme = (column_values == self.min[column][cells]) | (column_values == self.max[column][cells])
+            self.stale_cells.update(cells[at_extreme].tolist())
+
+    def _selectable(self, cells):
+        # Cells keyed on a missing value (a negative code) have no selection that locates their rows
+        selectable = np.ones(len(cells), dtype=bool)
+        for column in self.cell_codes:
+            selectable &= self.cell_codes[column][cells] >= 0
+        return selectable
+
+    def stale_selections(self):
+        """(selections, value_range) of each stale cell, to locate its rows with ``FilterIndex``.
+
+        Cells keyed on a missing value (a negative code) cannot be selected
+        and are skipped; ``refresh_extrema`` keeps their min/max as they were.
+        """
+        stale = np.array(sorted(self.stale_cells), dtype=np.int64)
+        for cell in stale[self._selectable(stale)]:
+            selections = {column: [self.categories[column][self.cell_codes[column][cell]]]
+                          for column in self.dimensions}
+            low = int(self.cell_codes["band"][cell]) * self.band_width
+            yield selections, (low, low + self.band_width - 1)
+
+    def refresh_extrema(self, rows):
+        """Recompute min/max of the stale cells from ``rows``, which must hold all their rows."""
+        stale = np.array(sorted(self.stale_cells), dtype=np.int64)
+        if not len(stale):
+            return
+        cells = self._cells_for(rows)
+        # Cells skipped by stale_selections have no rows here
+        stale = stale[self._selectable(stale)]
+        in_stale = np.isin(cells, stale)
+        for column in self.measures:
+            self.min[column][stale] = np.nan
+            self.max[column][stale] = np.nan
+            column_values = rows[column].to_numpy(dtype=float)[in_stale]
+            np.fmin.at(self.min[column], cells[in_stale], column_values)
+            np.fmax.at(self.max[column], cells[in_stale], column_values)
+        self.stale_cells.clear()
+
+    def rollup(self, selections=None, value_range=None):
+        """Return a ``CubeSelection`` over the cells matching the filters.
+
+        Selections follow ``FilterIndex``: an empty selection does not filter
+        that dimension. ``value_range`` is an inclusive age range and must
+        cover whole bands.
+        """
+        # Cells emptied by an incremental refresh are skipped
+        mask = self.count > 0
+        for column, selected in (selections or {}).items():
+            if selected and column in self.categories:
+                selected = set(selected)
+                positions = [i for i, value in enumerate(self.categories[column]) if value in selected]
+                mask &= np.isin(self.cell_codes[column], positions)
+        if value_range is not None:
+            low, high = value_range
+            if low % self.band_width or (high + 1) % self.band_width:
+                raise ValueError(f"Range {value_range} does not align with {self.band_width}-year bands")
+            bands = self.cell_codes["band"]
+            mask &= (bands >= low // self.band_width) & (bands <= high // self.band_width)
+        return CubeSelection(self, np.flatnonzero(mask))
+
+
+class CubeSelection:
+    """Roll-ups over a subset of cube cells."""
+
+    def __init__(self, cube, cells):
+        self.cube = cube
+        self.cells = cells
+
+    def count(self):
+        return int(self.cube.count[self.cells].sum())
+
+    def sum(self, column):
+        return float(self.cube.sum[column][self.cells].sum())
+
+    def mean(self, column):
+        n = self.count()
+        return self.sum(column) / n if n else np.nan
+
+    def min(self, column):
+        values = self.cube.min[column][self.cells]
+        return values.min() if len(values) else np.nan
+
+    def max(self, column):
+        values = self.cube.max[column][self.cells]
+        return values.max() if len(values) else np.nan
+
+    def std(self, column):
+        # Sample standard deviation (ddof=1), like pandas
+        n = self.count()
+        if n < 2:
+            return np.nan
+        total = self.sum(column)
+        sumsq = float(self.cube.sumsq[column][self.cells].sum())
+        return float(np.sqrt(max(0.0, (sumsq - total * total / n) / (n - 1))))
+
+    def corr(self, x, y):
+        """Pearson correlation of two measures with a stored cross product."""
+        n = self.count()
+        if n < 2:
+            return np.nan
+        sum_x, sum_y = self.sum(x), self.sum(y)
+        sum_xy = float(self.cube.cross[(x, y)][self.cells].sum())
+        sumsq_x = float(self.cube.sumsq[x][self.cells].sum())
+        sumsq_y = float(self.cube.sumsq[y][self.cells].sum())
+        covariance = sum_xy - sum_x * sum_y / n
+        variance_x = sumsq_x - sum_x * sum_x / n
+        variance_y = sumsq_y - sum_y * sum_y / n
+        if variance_x <= 0 or variance_y <= 0:
+            return np.nan
+        return covariance / np.sqrt(variance_x * variance_y)
+
+    def _group_totals(self, dimension, weights):
+        codes = self.cube.cell_codes[dimension][self.cells]
+        # Cells of a missing value (code -1) are left out, as groupby and value_counts drop NaN
+        known = codes >= 0
+        codes = codes[known]
+        if weights is not None:
+            weights = weights[known]
+        totals = np.bincount(codes, weights=weights, minlength=len(self.cube.categories[dimension]))
+        counts = np.bincount(codes, weights=self.cube.count[self.cells][known],
+                             minlength=len(self.cube.categories[dimension]))
+        index = pd.Index(self.cube.categories[dimension], name=dimension)
+        present = counts > 0
+        return pd.Series(totals, index=index)[present], pd.Series(counts, index=index)[present]
+
+    def value_counts(self, dimension, normalize=False):
+        """Counts per dimension value, shaped like ``Series.value_counts``."""
+        _, counts = self._group_totals(dimension, None)
+        counts = counts.astype(int).sort_values(ascending=False, kind="stable")
+        if normalize:
+            return (counts / counts.sum()).rename("proportion")
+        return counts.rename("count")
+
+    def group_mean(self, column, dimension):
+        """Mean of ``column`` per dimension value, like ``groupby(dimension)[column].mean()``."""
+        totals, counts = self._group_totals(dimension, self.cube.sum[column][self.cells])
+        return (totals / counts).rename(column)
+
+    def binary_counts(self, column):
+        """``value_counts`` of a 0/1 measure, without the zero-count values."""
+        n = self.count()
+        ones = int(round(self.sum(column)))
+        counts = pd.Series({0: n - ones, 1: ones}, name="count")
+        counts.index.name = column
+        return counts[counts > 0].sort_values(ascending=False, kind="stable")
+
+    def histogram(self, column, bins=None):
+        """Display bins and KDE curve of ``column`` (see ``BinGrid.summarize``)."""
+        counts = self.cube.histogram_counts[column][self.cells].sum(axis=0)
+        fractions = self.cube.histogram_fractions[column][self.cells].sum(axis=0)
+        return self.cube.bin_grids[column].summarize(counts, fractions, bins)
+
+    def describe(self, column):
+        """The moment statistics of ``Series.describe`` (no quartiles)."""
+        return pd.Series({
+            "count": float(self.count()),
+            "mean": self.mean(column),
+            "std": self.std(column),
+            "min": self.min(column),
+            "max": self.max(column),
+        }, name=column)
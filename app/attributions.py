@@ -0,0 +1,112 @@
+"""Per-employee explanations of the RandomForest turnover risk.
+
+The rule engine explains itself through its weighted factors. For the
+RandomForest, ``AttributionCache`` splits each employee's probability of
+leaving into a bias (the share of leavers in the balanced training data the
+trees start from) plus one contribution per model feature, the path
+decomposition of ``ForestEngine.path_contributions``: a whole batch is
+explained in the same level-by-level NumPy walk that scores it.
+
+Explanations are cached per employee ID together with the employee's model
+input, so a "why" view over thousands of employees only computes the ones it
+has not seen, and a refreshed record is explained again. The cache is a
+bounded LRU shared by every session.
+"""
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from dataset_store import ID_COLUMN
+from forest_artifact import FlatForest
+
+DEFAULT_MAX_ENTRIES = 200_000
+
+RISK_SCORE_COLUMN = "risk_score"
+
+
+class AttributionCache:
+    """Feature contributions to the risk score, cached per employee ID.
+
+    Raises ``ValueError`` when the session's model is not a forest (the
+    GradientBoosting package ``training`` may pick).
+    """
+
+    def __init__(self, session, max_entries=DEFAULT_MAX_ENTRIES):
+        model = session.model
+        forest = model if isinstance(model, FlatForest) else FlatForest.from_sklearn(model)
+        self.session = session
+        self.engine = forest.engine
+        self.leave_column = list(model.classes_).index(1)
+        self.bias = float(self.engine.value[self.engine.roots, self.leave_column].mean())
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def explain(self, df, id_column=ID_COLUMN):
+        """Contributions per feature and ``risk_score`` for every row of ``df``, indexed by employee ID.
+
+        The contributions of a row add up to its risk score minus ``bias``.
+        With ``id_column=None`` (e.g. the prediction form) nothing is cached
+        and the result keeps the index of ``df``.
+        """
+        matrix = np.asarray(self.session.feature_matrix(df), dtype=np.float64)
+        if id_column is None:
+            _, contributions = self.engine.path_contributions(matrix, self.leave_column, matrix.shape[1])
+            return self._frame(contributions, df.index)
+
+        ids = df[id_column].tolist()
+        contributions = np.empty_like(matrix)
+        missing = []
+        with self._lock:
+            for position, (employee, row) in enumerate(zip(ids, matrix)):
+                entry = self._entries.get(employee)
+                # The stored input tells whether the record changed since it was explained
+                if entry is not None and np.array_equal(entry[0], row):
+                    self._entries.move_to_end(employee)
+                    contributions[position] = entry[1]
+                else:
+                    missing.append(position)
+            self.hits += len(ids) - len(missing)
+            self.misses += len(missing)
+
+        if missing:
+            _, computed = self.engine.path_contributions(matrix[missing], self.leave_column, matrix.shape[1])
+            contributions[missing] = computed
+            with self._lock:
+                for position, values in zip(missing, computed):
+                    self._entries[ids[position]] = (matrix[position], values)
+                    self._entries.move_to_end(ids[position])
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+        return self._frame(contributions, pd.Index(ids, name=id_column))
+
+    def _frame(self, contributions, index):
+        result = pd.DataFrame(contributions, index=index, columns=self.session.features)
+        result[RISK_SCORE_COLUMN] = self.bias + contributions.sum(axis=1)
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+def top_factors(contributions, n=3):
+    """The ``n`` features raising each employee's risk the most, as a ``"feature (+x.x pp)"`` text column."""
+    features = contributions.drop(columns=[RISK_SCORE_COLUMN])
+    values = features.to_numpy()
+    order = np.argsort(-values, axis=1, kind="stable")[:, :n]
+    names = np.asarray(features.columns)
+    return pd.Series([
+        ", ".join(f"{names[index]} ({values[row, index] * 100:+.1f} pp)" for index in indices
+                  if values[row, index] > 0)
+        for row, indices in enumerate(order)
+    ], index=contributions.index, name="Top risk factors")
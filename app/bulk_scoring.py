@@ -0,0 +1,118 @@
+"""Chunked bulk scoring of employee files.
+
+Reads CSV or Parquet files with the columns of ``notebook/data_cleaned.csv``
+in fixed-size chunks, scores each chunk (rule engine or saved model) and streams the
+result to disk, so memory use depends on the chunk size and not on the file.
+"""
+import os
+
+import pandas as pd
+
+from turnover_scoring import INPUT_COLUMNS, score_turnover
+
+DEFAULT_CHUNK_SIZE = 50_000
+
+# Columns appended to every scored row
+OUTPUT_COLUMNS = ["risk_score", "prediction"]
+
+
+def _file_size(source):
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.getsize(source)
+    position = source.tell()
+    source.seek(0, os.SEEK_END)
+    size = source.tell()
+    source.seek(position)
+    return size
+
+
+def iter_chunks(source, file_name, chunk_size=DEFAULT_CHUNK_SIZE, dtype=None):
+    """Yield ``(chunk, progress)`` pairs from a CSV or Parquet file.
+
+    ``source`` is a path or a binary file object (e.g. a Streamlit upload) and
+    ``file_name`` decides the format. ``progress`` is the fraction of the
+    file consumed so far, in [0, 1]. ``dtype`` is passed to ``pd.read_csv``.
+    """
+    extension = os.path.splitext(file_name)[1].lower()
+
+    if extension == ".parquet":
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(source)
+        total_rows = max(1, parquet_file.metadata.num_rows)
+        rows_read = 0
+        for batch in parquet_file.iter_batches(batch_size=chunk_size):
+            rows_read += batch.num_rows
+            yield batch.to_pandas(), rows_read / total_rows
+
+    elif extension == ".csv":
+        handle = open(source, "rb") if isinstance(source, (str, os.PathLike)) else source
+        try:
+            total_bytes = max(1, _file_size(handle))
+            with pd.read_csv(handle, chunksize=chunk_size, dtype=dtype) as reader:
+                for chunk in reader:
+                    # The parser reads ahead in blocks, so the byte position is approximate
+                    yield chunk, min(1.0, handle.tell() / total_bytes)
+        finally:
+            if handle is not source:
+                handle.close()
+
+    else:
+        raise ValueError(f"Unsupported file type '{extension}'. Upload a .csv or .parquet file.")
+
+
+def score_chunk(chunk, scorer=score_turnover):
+    """Return ``chunk`` with the scorer outputs appended.
+
+    ``scorer`` takes a frame and returns ``risk_score`` and ``prediction``
+    columns, e.g. ``score_turnover`` or ``InferenceSession.score``.
+    """
+    scores = scorer(chunk)
+    scored = chunk.copy()
+    for column in OUTPUT_COLUMNS:
+        scored[column] = scores[column]
+    return scored
+
+
+def score_file(source, file_name, output_path, chunk_size=DEFAULT_CHUNK_SIZE, progress_callback=None,
+               scorer=score_turnover, chunk_callback=None):
+    """Score ``source`` chunk by chunk and write the result as CSV to ``output_path``.
+
+    ``chunk_callback``, when given, is called with every scored chunk (e.g.
+    to feed ``DriftMonitor``). Returns a summary dict with the number of
+    scored rows, predicted leavers and the mean risk score.
+    """
+    rows = 0
+    leavers = 0
+    risk_total = 0.0
+    # Set by the first chunk, even an empty one, so the header is written once
+    header_written = False
+
+    with open(output_path, "w", encoding="utf-8", newline="") as output:
+        for chunk, progress in iter_chunks(source, file_name, chunk_size):
+            scored = score_chunk(chunk, scorer)
+            scored.to_csv(output, header=not header_written, index=False)
+            header_written = True
+            if chunk_callback is not None:
+                chunk_callback(scored)
+
+            rows += len(scored)
+            leavers += int(scored["prediction"].sum())
+            risk_total += float(scored["risk_score"].sum())
+
+            if progress_callback is not None:
+                progress_callback(progress, rows)
+
+    if rows == 0:
+        raise ValueError("The uploaded file does not contain any rows.")
+
+    return {
+        "rows": rows,
+        "predicted_leavers": leavers,
+        "mean_risk": risk_total / rows,
+    }
+
+
+def required_columns(features=None):
+    """Columns the upload must contain: the rule engine inputs or the model ``features``."""
+    return list(features) if features is not None else list(INPUT_COLUMNS.values())
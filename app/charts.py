@@ -0,0 +1,197 @@
+"""Chart drawing functions for the Interactive Visualizations page.
+
+Each function draws one chart on a matplotlib ``ax``, so ``create_figure``
+in ``views/visualizations.py`` can render it once and cache the image. Box
+and scatter charts take the filtered rows (scatters possibly sampled, see
+``scatter``) and the ``*_density`` variants a ``scatter.Density``;
+histograms take a ``histograms.Histogram`` and count and rate charts take
+the aggregated series, both rolled up from the ``AggregateCube``.
+"""
+import matplotlib.pyplot as plt
+import numpy as np
+import seaborn as sns
+
+# Thousands separator for salary axes
+thousands_formatter = plt.FuncFormatter(lambda x, loc: "{:,}".format(int(x)))
+
+
+def _rotate_xticks(ax):
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+
+
+def _histogram(ax, histogram, title, xlabel):
+    # Pre-binned counts and KDE curve, drawn like sns.histplot(kde=True)
+    color = sns.color_palette()[0]
+    ax.bar(histogram.edges[:-1], histogram.counts, width=np.diff(histogram.edges), align='edge',
+           color=(*color, 0.5), edgecolor='black', linewidth=1)
+    ax.plot(histogram.kde_x, histogram.kde_y, color=color, linewidth=1.5)
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel('Count')
+
+
+def age_distribution(ax, histogram):
+    _histogram(ax, histogram, 'Age Distribution', 'Age')
+
+
+def gender_distribution(ax, gender_counts):
+    colors = sns.color_palette("pastel")[0:len(gender_counts)]
+    gender_counts.plot.pie(autopct='%1.1f%%', startangle=90, colors=colors, ax=ax)
+    ax.set_title('Gender Distribution')
+    ax.set_ylabel('')
+
+
+def department_distribution(ax, dept_counts):
+    dept_counts = dept_counts.sort_values(ascending=True)
+
+    sns.barplot(x=dept_counts.values, y=dept_counts.index, palette='viridis', ax=ax)
+    ax.set_title('Department Distribution')
+    ax.set_xlabel('Number of Employees')
+    ax.set_ylabel('Department')
+
+
+def salary_distribution(ax, histogram):
+    _histogram(ax, histogram, 'Salary Distribution (2020)', 'Annual Salary')
+    ax.get_xaxis().set_major_formatter(thousands_formatter)
+
+
+def salary_by_department(ax, data):
+    sns.boxplot(x='Departamento', y='Salario Anual Actual 2020', data=data, ax=ax)
+    ax.set_title('Salary by Department')
+    ax.set_xlabel('Department')
+    ax.set_ylabel('Annual Salary')
+    _rotate_xticks(ax)
+    ax.get_yaxis().set_major_formatter(thousands_formatter)
+
+
+def tenure_distribution(ax, histogram):
+    _histogram(ax, histogram, 'Tenure Distribution (Years)', 'Years of Service')
+
+
+def age_vs_tenure(ax, data):
+    sns.scatterplot(x='Edad', y='Antigüedad Años', hue='Sexo', data=data, ax=ax)
+    ax.set_title('Age vs Tenure')
+    ax.set_xlabel('Age')
+    ax.set_ylabel('Years of Service')
+
+
+def _density(ax, density, title, xlabel, ylabel):
+    # 2D histogram in place of one marker per employee; empty cells stay blank
+    mesh = ax.pcolormesh(density.x_edges, density.y_edges, np.ma.masked_equal(density.counts.T, 0), cmap='viridis')
+    ax.figure.colorbar(mesh, ax=ax, label='Employees')
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+
+
+def age_vs_tenure_density(ax, density):
+    _density(ax, density, 'Age vs Tenure', 'Age', 'Years of Service')
+
+
+def tenure_by_department(ax, data):
+    sns.boxplot(x='Departamento', y='Antigüedad Años', data=data, ax=ax)
+    ax.set_title('Tenure by Department')
+    ax.set_xlabel('Department')
+    ax.set_ylabel('Years of Service')
+    _rotate_xticks(ax)
+
+
+def performance_distribution(ax, histogram):
+    _histogram(ax, histogram, 'Performance Evaluation Distribution', 'Performance Score')
+
+
+def performance_by_department(ax, data):
+    sns.boxplot(x='Departamento', y='Evaluación Desempeño', data=data, ax=ax)
+    ax.set_title('Performance by Department')
+    ax.set_xlabel('Department')
+    ax.set_ylabel('Performance Score')
+    _rotate_xticks(ax)
+
+
+def training_vs_performance(ax, data):
+    sns.scatterplot(
+        x='Horas de formación recibidas',
+        y='Evaluación Desempeño',
+        hue='Departamento',
+        size='Antigüedad Años',
+        sizes=(50, 200),
+        alpha=0.7,
+        data=data,
+        ax=ax
+    )
+    ax.set_title('Training Hours vs Performance')
+    ax.set_xlabel('Training Hours')
+    ax.set_ylabel('Performance Score')
+
+
+def training_vs_performance_density(ax, density):
+    _density(ax, density, 'Training Hours vs Performance', 'Training Hours', 'Performance Score')
+
+
+def _rotation_pie(ax, counts, colors, title):
+    ax.pie(
+        counts,
+        labels=['No', 'Yes'] if 1 in counts.index else ['No'],
+        autopct='%1.1f%%',
+        colors=colors,
+        startangle=90
+    )
+    ax.set_title(title)
+
+
+def external_rotation(ax, rotation_counts):
+    _rotation_pie(ax, rotation_counts, sns.color_palette('pastel')[0:2], 'External Rotation')
+
+
+def internal_rotation(ax, rotation_counts):
+    _rotation_pie(ax, rotation_counts, sns.color_palette('pastel')[2:4], 'Internal Rotation')
+
+
+def rotation_by_department(ax, dept_rotation):
+    # dept_rotation: external rotation % per department
+    dept_rotation = dept_rotation.sort_values(ascending=False)
+
+    sns.barplot(x=dept_rotation.index, y=dept_rotation.values, palette='viridis', ax=ax)
+    ax.set_title('External Rotation by Department (%)')
+    ax.set_xlabel('Department')
+    ax.set_ylabel('External Rotation %')
+    _rotate_xticks(ax)
+    ax.set_ylim(0, max(dept_rotation.values) * 1.2)
+
+    # Add percentage labels on bars
+    for i, v in enumerate(dept_rotation.values):
+        ax.text(i, v + 0.5, f"{v:.1f}%", ha='center')
+
+
+def training_distribution(ax, histogram):
+    _histogram(ax, histogram, 'Training Hours Distribution', 'Training Hours')
+
+
+def training_by_department(ax, data):
+    sns.boxplot(x='Departamento', y='Horas de formación recibidas', data=data, ax=ax)
+    ax.set_title('Training Hours by Department')
+    ax.set_xlabel('Department')
+    ax.set_ylabel('Training Hours')
+    _rotate_xticks(ax)
+
+
+def training_regression(ax, data):
+    sns.regplot(
+        x='Horas de formación recibidas',
+        y='Evaluación Desempeño',
+        data=data,
+        scatter_kws={'alpha': 0.5},
+        line_kws={'color': 'red'},
+        ax=ax
+    )
+    ax.set_title('Training Hours vs Performance Score')
+    ax.set_xlabel('Training Hours')
+    ax.set_ylabel('Performance Score')
+
+
+def training_regression_density(ax, density, fit):
+    _density(ax, density, 'Training Hours vs Performance Score', 'Training Hours', 'Performance Score')
+    if fit is not None:
+        slope, intercept = fit
+        ends = density.x_edges[[0, -1]]
+        ax.plot(ends, slope * ends + intercept, color='red')
@@ -0,0 +1,305 @@
+"""Chunked port of the cleaning steps of ``notebook/data_cleaning.ipynb``.
+
+The notebook loads ``data.xlsx`` in one go, drops the columns with more than
+50% missing values, fills the remaining gaps with the mode (text columns) or
+the mean (everything else) and saves ``data_cleaned.xlsx`` and
+``data_cleaned.csv``. ``clean_file`` does the same in two passes over the
+source, holding one chunk at a time:
+
+1. ``profile_source`` reads every chunk and collects per column the missing
+   count, the dtype pandas would infer for the whole file, the sum for the
+   mean and the value counts for the mode;
+2. the source is read again and each chunk is cast to the whole-file
+   dtypes, filled and appended to the outputs.
+
+On ``notebook/data.xlsx`` the CSV is byte-for-byte the notebook's. Means
+summed over several chunks can differ from a single pandas sum in the last
+bit. Mode counts are the only state that grows with the data (one entry per
+distinct value of the text columns). A text column that also has chunks of
+plain numbers with gaps to fill costs one more read of that column.
+
+Excel workbooks are read from their columnar cache (``excel_cache``, built
+on first use); CSV and Parquet are read with ``bulk_scoring.iter_chunks``.
+
+Run it with::
+
+    python app/cleaning.py notebook/data.xlsx
+"""
+import argparse
+import os
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from data_cache import atomic_write
+from excel_cache import dtype_kind, iter_excel_chunks, merge_dtypes
+
+MISSING_THRESHOLD = 0.5
+DEFAULT_CHUNK_SIZE = 50_000
+
+# Excel worksheet size limits (pandas refuses larger frames too)
+EXCEL_MAX_ROWS = 1_048_576
+EXCEL_MAX_COLUMNS = 16_384
+
+# Same header style and datetime format as DataFrame.to_excel
+EXCEL_SHEET_NAME = "Sheet1"
+EXCEL_DATETIME_FORMAT = "YYYY-MM-DD HH:MM:SS"
+
+# to_csv prints a datetime column with the coarsest of these formats that fits all its values
+DATE, SECONDS, MILLISECONDS, MICROSECONDS = range(4)
+DATETIME_FORMATS = ["%Y-%m-%d", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S.%f"]
+
+CleaningPlan = namedtuple("CleaningPlan", ["rows", "columns", "dropped", "dtypes", "fill_values",
+                                           "datetime_precision", "missing"])
+
+
+def iter_source_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE, dtype=None):
+    """Yield the frames of an .xlsx, .csv or .parquet file, ``chunk_size`` rows at a time."""
+    if os.path.splitext(path)[1].lower() == ".xlsx":
+        yield from iter_excel_chunks(path, chunk_size, dtype)
+        return
+    from bulk_scoring import iter_chunks
+
+    for chunk, _ in iter_chunks(path, path, chunk_size, dtype):
+        yield chunk
+
+
+def _is_text(dtype):
+    return dtype_kind(dtype) in ("str", "object")
+
+
+def _datetime_precision(values):
+    """Coarsest ``DATETIME_FORMATS`` index that prints ``values`` (datetime64) without loss."""
+    ticks = values.astype("datetime64[us]").view(np.int64)
+    for precision, unit in ((DATE, 86_400_000_000), (SECONDS, 1_000_000), (MILLISECONDS, 1_000)):
+        if not (ticks % unit).any():
+            return precision
+    return MICROSECONDS
+
+
+class _ColumnProfile:
+    """Statistics of one source column accumulated over the chunks."""
+
+    def __init__(self):
+        self.dtype = None
+        self.missing = 0
+        self.total = 0.0
+        self.count = 0
+        self.value_counts = {}
+        self.numbers = False
+        self.datetime_precision = DATE
+
+    def update(self, column):
+        null = column.isna().to_numpy()
+        self.missing += int(null.sum())
+        if null.all():
+            # An empty chunk tells nothing about the column's dtype
+            return
+        self.dtype = merge_dtypes(self.dtype, column.dtype)
+
+        if _is_text(column.dtype):
+            self.value_counts_update(column)
+        elif dtype_kind(column.dtype) in ("datetime", "timedelta"):
+            # nanmean sums the int64 ticks as float64
+            ticks = column.to_numpy().view(np.int64)
+            self.total += float(np.where(null, 0, ticks).sum(dtype=np.float64))
+            self.count += int((~null).sum())
+            if dtype_kind(column.dtype) == "datetime":
+                self.datetime_precision = max(self.datetime_precision,
+                                              _datetime_precision(column.to_numpy()[~null]))
+        else:
+            if dtype_kind(column.dtype) != "bool":
+                values = column.to_numpy(dtype=np.float64, na_value=np.nan)
+                self.total += float(np.where(null, 0, values).sum(dtype=np.float64))
+                self.count += int((~null).sum())
+            # Recounted as text in profile_source if the column turns out to be text
+            self.numbers = True
+
+    def value_counts_update(self, column):
+        # First-seen order, which pandas' mode keeps when the values cannot be sorted
+        for value, count in column.value_counts(sort=False).items():
+            self.value_counts[value] = self.value_counts.get(value, 0) + count
+
+    def mode(self):
+        if not self.value_counts:
+            return np.nan
+        top = max(self.value_counts.values())
+        modes = [value for value, count in self.value_counts.items() if count == top]
+        try:
+            return sorted(modes)[0]
+        except TypeError:
+            return modes[0]
+
+    def mean(self):
+        if not self.count:
+            return np.nan
+        mean = self.total / self.count
+        if dtype_kind(self.dtype) in ("datetime", "timedelta"):
+            return np.int64(mean).view(self.dtype)
+        return mean
+
+
+def profile_source(path, chunk_size=DEFAULT_CHUNK_SIZE, threshold=MISSING_THRESHOLD):
+    """First pass: read ``path`` and decide what the cleaning does to each column."""
+    profiles = {}
+    rows = 0
+    for chunk in iter_source_chunks(path, chunk_size):
+        rows += len(chunk)
+        for column in chunk.columns:
+            profiles.setdefault(column, _ColumnProfile()).update(chunk[column])
+
+    # Text columns with chunks of numbers only: count them again read as text, as pandas
+    # reads the whole column (one more pass over the file for these columns)
+    recount = [column for column, profile in profiles.items()
+               if _is_text(profile.dtype) and profile.numbers and 0 < profile.missing <= threshold * rows]
+    if recount:
+        for column in recount:
+            profiles[column].value_counts = {}
+        for chunk in iter_source_chunks(path, chunk_size, dtype={column: object for column in recount}):
+            for column in recount:
+                profiles[column].value_counts_update(chunk[column])
+
+    columns, dropped, dtypes, fill_values, precision = [], [], {}, {}, {}
+    for column, profile in profiles.items():
+        if rows and profile.missing / rows > threshold:
+            dropped.append(column)
+            continue
+        columns.append(column)
+        dtype = profile.dtype if profile.dtype is not None else np.dtype(np.float64)
+        if profile.missing and dtype_kind(dtype) in ("int", "bool"):
+            # Gaps turn whole-file int columns into float and bool columns into object
+            dtype = np.dtype(np.float64) if dtype_kind(dtype) == "int" else np.dtype(object)
+        dtypes[column] = dtype
+        if profile.missing:
+            fill_values[column] = profile.mode() if _is_text(dtype) else profile.mean()
+        if dtype_kind(dtype) == "datetime":
+            precision[column] = profile.datetime_precision
+            if column in fill_values and not pd.isna(fill_values[column]):
+                precision[column] = max(precision[column], _datetime_precision(
+                    np.array([fill_values[column]], dtype=dtype)))
+
+    return CleaningPlan(rows, columns, dropped, dtypes, fill_values, precision,
+                        {column: profile.missing for column, profile in profiles.items()})
+
+
+def clean_chunk(chunk, plan):
+    """Second pass: one chunk with the dropped columns removed, whole-file dtypes and gaps filled."""
+    cleaned = chunk[plan.columns].copy()
+    for column in plan.columns:
+        values = cleaned[column]
+        dtype = plan.dtypes[column]
+        if values.dtype != dtype:
+            if values.isna().all():
+                values = values.astype(object)
+            cleaned[column] = values = values.astype(dtype)
+        if column in plan.fill_values:
+            cleaned[column] = values.fillna(plan.fill_values[column])
+    return cleaned
+
+
+def _format_datetimes(chunk, plan):
+    formatted = chunk.copy(deep=False)
+    for column, precision in plan.datetime_precision.items():
+        text = chunk[column].dt.strftime(DATETIME_FORMATS[precision])
+        formatted[column] = text.str[:-3] if precision == MILLISECONDS else text
+    return formatted
+
+
+class _ExcelWriter:
+    """Streams rows into a write-only openpyxl workbook."""
+
+    def __init__(self, path, columns, datetime_columns):
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Alignment, Border, Font, Side
+
+        self.path = path
+        self.workbook = Workbook(write_only=True)
+        self.sheet = self.workbook.create_sheet(EXCEL_SHEET_NAME)
+        self._cell = WriteOnlyCell
+        self.datetime_positions = [position for position, column in enumerate(columns)
+                                   if column in datetime_columns]
+
+        thin = Side(style="thin")
+        header = []
+        for column in columns:
+            cell = WriteOnlyCell(self.sheet, value=column)
+            cell.font = Font(bold=True)
+            cell.border = Border(left=thin, right=thin, top=thin, bottom=thin)
+            cell.alignment = Alignment(horizontal="center", vertical="top")
+            header.append(cell)
+        self.sheet.append(header)
+
+    def append(self, chunk):
+        for row in chunk.itertuples(index=False, name=None):
+            row = list(row)
+            for position in self.datetime_positions:
+                cell = self._cell(self.sheet, value=row[position])
+                cell.number_format = EXCEL_DATETIME_FORMAT
+                row[position] = cell
+            self.sheet.append(row)
+
+    def close(self):
+        with atomic_write(self.path) as tmp_path:
+            self.workbook.save(tmp_path)
+
+
+def clean_file(path, csv_path=None, xlsx_path=None, chunk_size=DEFAULT_CHUNK_SIZE,
+               threshold=MISSING_THRESHOLD):
+    """Clean ``path`` into ``csv_path`` and/or ``xlsx_path`` chunk by chunk.
+
+    Returns the ``CleaningPlan`` of the first pass (dropped columns, fill
+    values, ...). Raises ``ValueError`` when the result does not fit in an
+    Excel sheet and ``xlsx_path`` is given.
+    """
+    plan = profile_source(path, chunk_size, threshold)
+    if xlsx_path and (plan.rows + 1 > EXCEL_MAX_ROWS or len(plan.columns) > EXCEL_MAX_COLUMNS):
+        raise ValueError(f"{plan.rows:,} rows × {len(plan.columns)} columns do not fit in an Excel sheet "
+                         f"({EXCEL_MAX_ROWS:,} × {EXCEL_MAX_COLUMNS:,}); write the CSV only.")
+
+    excel = _ExcelWriter(xlsx_path, plan.columns, plan.datetime_precision) if xlsx_path else None
+    csv_file = open(csv_path, "w", encoding="utf-8", newline="") if csv_path else None
+    try:
+        header = True
+        # Mixed text/number columns are read as objects, so chunks of numbers keep their values
+        text_columns = {column: object for column, dtype in plan.dtypes.items() if dtype_kind(dtype) == "object"}
+        for chunk in iter_source_chunks(path, chunk_size, dtype=text_columns or None):
+            cleaned = clean_chunk(chunk, plan)
+            if csv_file is not None:
+                _format_datetimes(cleaned, plan).to_csv(csv_file, header=header, index=False)
+            if excel is not None:
+                excel.append(cleaned)
+            header = False
+        if header and csv_file is not None:
+            pd.DataFrame(columns=plan.columns).to_csv(csv_file, index=False)
+    finally:
+        if csv_file is not None:
+            csv_file.close()
+    if excel is not None:
+        excel.close()
+    return plan
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Clean an HR export like notebook/data_cleaning.ipynb.")
+    parser.add_argument("source", help=".xlsx, .csv or .parquet file")
+    parser.add_argument("--csv", help="output CSV (default: <source>_cleaned.csv)")
+    parser.add_argument("--xlsx", help="output Excel file (default: <source>_cleaned.xlsx)")
+    parser.add_argument("--no-xlsx", action="store_true", help="only write the CSV")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    stem = os.path.splitext(args.source)[0]
+    csv_path = args.csv or f"{stem}_cleaned.csv"
+    xlsx_path = None if args.no_xlsx else args.xlsx or f"{stem}_cleaned.xlsx"
+    plan = clean_file(args.source, csv_path, xlsx_path, chunk_size=args.chunk_size)
+
+    print(f"The data has {plan.rows} rows and {len(plan.columns)} columns after cleaning")
+    print(f"Columns dropped: {plan.dropped}")
+    print(f"Filled: {', '.join(f'{column} ({plan.missing[column]})' for column in plan.fill_values)}")
+    print(f"Written to {', '.join(path for path in (csv_path, xlsx_path) if path)}")
+
+
+if __name__ == "__main__":
+    main()
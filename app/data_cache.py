@@ -0,0 +1,174 @@
+"""Columnar on-disk cache for the cleaned dataset.
+
+``data_cleaned.csv`` is parsed once into a typed Arrow IPC (Feather v2) file
+next to it, using the dtypes declared in ``schema.EMPLOYEE_SCHEMA``: text
+categories are stored as dictionary-encoded columns, dates are parsed to
+timestamps and numbers are downcast. The file is uncompressed, so it can be
+memory-mapped and shared by every process that loads it.
+
+The cache remembers the size, mtime and SHA-256 of the CSV it was built
+from (in the Arrow schema metadata) and is rebuilt when the CSV changes.
+
+Build it ahead of time with::
+
+    python app/data_cache.py notebook/data_cleaned.csv
+"""
+import hashlib
+import os
+import shutil
+import sys
+import threading
+from contextlib import contextmanager
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.ipc as ipc
+
+from schema import apply_schema
+
+CACHE_EXTENSION = ".arrow"
+
+# Bump when the way the cache is built changes, so old caches are rebuilt
+CACHE_VERSION = "2"
+
+
+@contextmanager
+def atomic_write(path):
+    """Yield a temporary path next to ``path`` and move what was written there onto ``path``.
+
+    Readers never see a half-written file (or directory): ``os.replace``
+    swaps it in whole once the block completes. The temporary name is unique
+    per process and thread, as Streamlit runs every session in its own
+    thread, and what is left at it is removed when the block or the move
+    fails.
+    """
+    temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        yield temporary
+        os.replace(temporary, path)
+    finally:
+        if os.path.isdir(temporary):
+            shutil.rmtree(temporary, ignore_errors=True)
+        elif os.path.exists(temporary):
+            os.remove(temporary)
+
+
+def cache_path_for(csv_path):
+    return os.path.splitext(csv_path)[0] + CACHE_EXTENSION
+
+
+def file_hash(path, block_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _source_stamp(csv_path):
+    stat = os.stat(csv_path)
+    return {"size": str(stat.st_size), "mtime_ns": str(stat.st_mtime_ns)}
+
+
+def _read_metadata(cache_path):
+    try:
+        with pa.memory_map(cache_path) as source:
+            metadata = ipc.open_file(source).schema.metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return None
+    return {key.decode(): value.decode() for key, value in metadata.items()}
+
+
+def read_csv_typed(csv_path):
+    """Parse the cleaned CSV and apply the employee schema."""
+    return apply_schema(pd.read_csv(csv_path))
+
+
+def source_metadata(source_path, version, source_hash=None):
+    """Arrow schema metadata tying a cache to its source file."""
+    return {
+        b"cache_version": version.encode(),
+        b"source_sha256": (source_hash or file_hash(source_path)).encode(),
+        **{f"source_{key}".encode(): value.encode() for key, value in _source_stamp(source_path).items()},
+    }
+
+
+def build_cache(csv_path, cache_path=None, source_hash=None):
+    """Convert ``csv_path`` into the columnar cache and return the cache path."""
+    cache_path = cache_path or cache_path_for(csv_path)
+    data = read_csv_typed(csv_path)
+
+    table = pa.Table.from_pandas(data, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata.update(source_metadata(csv_path, CACHE_VERSION, source_hash))
+    table = table.replace_schema_metadata(metadata)
+
+    with atomic_write(cache_path) as tmp_path:
+        feather.write_feather(table, tmp_path, compression="uncompressed")
+    return cache_path
+
+
+def ensure_cache(csv_path, cache_path=None, build=build_cache, version=CACHE_VERSION):
+    """Return a cache path that is up to date with ``csv_path``, rebuilding if needed.
+
+    ``build(source_path, cache_path, source_hash=None)`` writes the cache with
+    ``source_metadata`` for ``version``; other caches (e.g. ``excel_cache``)
+    plug in their own.
+    """
+    cache_path = cache_path or cache_path_for(csv_path)
+    metadata = _read_metadata(cache_path) if os.path.exists(cache_path) else None
+
+    if metadata is None or metadata.get("cache_version") != version:
+        return build(csv_path, cache_path)
+
+    stamp = _source_stamp(csv_path)
+    if all(metadata.get(f"source_{key}") == value for key, value in stamp.items()):
+        return cache_path
+
+    # The CSV was touched: only rebuild when the content really changed
+    source_hash = file_hash(csv_path)
+    if metadata.get("source_sha256") == source_hash:
+        _restamp(cache_path, stamp)
+        return cache_path
+    return build(csv_path, cache_path, source_hash=source_hash)
+
+
+def _restamp(cache_path, stamp):
+    # Record the new mtime so the hash is not recomputed on every load
+    table = feather.read_table(cache_path, memory_map=True)
+    metadata = dict(table.schema.metadata)
+    metadata.update({f"source_{key}".encode(): value.encode() for key, value in stamp.items()})
+    with atomic_write(cache_path) as tmp_path:
+        feather.write_feather(table.replace_schema_metadata(metadata), tmp_path, compression="uncompressed")
+
+
+def read_cache(cache_path):
+    """Memory-map the cache and convert it to a pandas frame with the employee schema."""
+    table = feather.read_table(cache_path, memory_map=True)
+    # The cache already carries the schema dtypes, so this is normally a no-op
+    return apply_schema(table.to_pandas())
+
+
+def load_cleaned_data(csv_path):
+    """Load the cleaned dataset, preferring the columnar cache.
+
+    ``data.attrs["version"]`` is the SHA-256 of the source CSV, so caches
+    built on top of the frame can key on the dataset version. Falls back to
+    parsing the CSV directly when the cache cannot be written (e.g. a
+    read-only deployment).
+    """
+    try:
+        cache_path = ensure_cache(csv_path)
+    except OSError:
+        data = read_csv_typed(csv_path)
+        data.attrs["version"] = file_hash(csv_path)
+        return data
+    data = read_cache(cache_path)
+    data.attrs["version"] = _read_metadata(cache_path)["source_sha256"]
+    return data
+
+
+if __name__ == "__main__":
+    source = sys.argv[1] if len(sys.argv) > 1 else os.path.join("notebook", "data_cleaned.csv")
+    print(f"Cache written to {build_cache(source)}")
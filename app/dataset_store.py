@@ -0,0 +1,239 @@
+"""Shared employee dataset with incremental refresh.
+
+``DatasetStore`` owns the frame the dashboard reads together with the
+structures derived from it (``FilterIndex`` and ``AggregateCube``).
+``apply_changes`` takes new or changed HR records keyed on ``ID Empleado``
+plus the IDs of leavers and:
+
+* overwrites changed rows in place and appends new ones;
+* removes leavers by moving the last rows into their slots, so no other
+  row changes position;
+* updates the filter bitmaps and the cube cells of exactly those rows.
+
+Apart from pandas appending to the frame (a column copy), the cost follows
+the size of the change, not the dataset. The cube is rebuilt only when a
+new value falls outside its histogram grids.
+
+Every applied change is appended to a journal next to the CSV
+(``data_cleaned.changes.csv``) and replayed on startup, as long as the CSV
+is the one the journal was written against. The dataset version
+(``df.attrs["version"]``) becomes a hash of the previous version and the
+change, so the chart caches key on it as before.
+
+Writers hold ``lock``. Readers take ``snapshot()``; a rerun that overlaps a
+refresh may see it half applied, and the next rerun sees the new version.
+"""
+import hashlib
+import os
+import threading
+import time
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from aggregates import AggregateCube
+from filters import FilterIndex
+from schema import apply_schema
+
+ID_COLUMN = "ID Empleado"
+JOURNAL_SUFFIX = ".changes.csv"
+
+# Journal bookkeeping columns
+BASE_COLUMN = "_base"
+VERSION_COLUMN = "_version"
+CHANGE_COLUMN = "_change"
+UPSERT = "upsert"
+LEAVE = "leave"
+
+RefreshSummary = namedtuple("RefreshSummary", ["inserted", "updated", "removed", "unknown_leavers", "seconds"])
+
+
+def journal_path_for(csv_path):
+    return os.path.splitext(csv_path)[0] + JOURNAL_SUFFIX
+
+
+def _change_digest(upserts, leavers):
+    digest = hashlib.sha256()
+    digest.update(pd.util.hash_pandas_object(upserts, index=False).to_numpy().tobytes())
+    digest.update(np.asarray(leavers, dtype=np.int64).tobytes())
+    return digest.hexdigest()
+
+
+class DatasetStore:
+    """The dataset, its filter index and aggregate cube, refreshed together."""
+
+    def __init__(self, df, journal_path=None):
+        self.lock = threading.Lock()
+        self.df = df
+        self.base_version = df.attrs.get("version")
+        self.version = self.base_version
+        self.filter_index = FilterIndex(df)
+        self.cube = AggregateCube(df)
+        self.journal_path = journal_path
+
+        # Sorted IDs and the row position of each, for O(log n) lookups
+        ids = df[ID_COLUMN].to_numpy(dtype=np.int64)
+        order = np.argsort(ids, kind="stable")
+        self._ids = ids[order]
+        self._positions = order.astype(np.int64)
+
+        if journal_path and os.path.exists(journal_path):
+            self._replay_journal()
+
+    def snapshot(self):
+        with self.lock:
+            return self.df, self.filter_index, self.cube
+
+    def _lookup(self, ids):
+        """Row position of each ID, -1 for IDs not in the dataset."""
+        ids = np.asarray(ids, dtype=np.int64)
+        if not len(self._ids):
+            return np.full(len(ids), -1, dtype=np.int64), np.zeros(len(ids), dtype=np.int64)
+        slots = np.minimum(np.searchsorted(self._ids, ids), len(self._ids) - 1)
+        return np.where(self._ids[slots] == ids, self._positions[slots], -1), slots
+
+    def _normalize(self, upserts):
+        if upserts is None or not len(upserts):
+            return self.df.iloc[:0]
+        missing = [column for column in self.df.columns if column not in upserts.columns]
+        if missing:
+            raise KeyError(f"Missing columns in the changed records: {', '.join(missing)}")
+        upserts = apply_schema(upserts[list(self.df.columns)].infer_objects())
+        upserts = upserts.drop_duplicates(ID_COLUMN, keep="last").reset_index(drop=True)
+
+        for column in self.df.columns:
+            current = self.df[column]
+            values = upserts[column]
+            if isinstance(current.dtype, pd.CategoricalDtype):
+                new = [value for value in values.dropna().unique() if value not in current.cat.categories]
+                if new:
+                    self.df[column] = current = current.cat.add_categories(new)
+                upserts[column] = values.astype(object).astype(current.dtype)
+            elif values.dtype != current.dtype:
+                common = np.result_type(current.dtype, values.dtype)
+                if common == object:
+                    raise ValueError(f"{column}: expected {current.dtype} values, got {values.dtype}")
+                if common != current.dtype:
+                    self.df[column] = current.astype(common)
+                upserts[column] = values.astype(common)
+        return upserts
+
+    def _write_rows(self, positions, rows):
+        for j, column in enumerate(self.df.columns):
+            self.df.iloc[positions, j] = rows[column].to_numpy()
+
+    def apply_changes(self, upserts=None, leavers=(), journal=True):
+        """Insert or update ``upserts`` by ID and remove the ``leavers`` IDs.
+
+        ``upserts`` must hold complete records (every dataset column).
+        Returns a ``RefreshSummary``.
+        """
+        start = time.perf_counter()
+        with self.lock:
+            upserts = self._normalize(upserts)
+            leavers = np.unique(np.asarray(list(leavers), dtype=np.int64))
+            rebuild_cube = not self.cube.covers(upserts)
+            index, cube = self.filter_index, self.cube
+
+            # Changed employees: swap their old values for the new ones in place
+            positions, _ = self._lookup(upserts[ID_COLUMN])
+            changed = positions >= 0
+            if changed.any():
+                rows = upserts[changed]
+                old_rows = self.df.iloc[positions[changed]]
+                index.remove_rows(positions[changed], old_rows)
+                cube.remove_rows(old_rows)
+                self._write_rows(positions[changed], rows)
+                index.add_rows(positions[changed], rows)
+                cube.add_rows(rows)
+
+            # New employees: appended at the end
+            inserted = upserts[~changed]
+            if len(inserted):
+                new_positions = np.arange(len(self.df), len(self.df) + len(inserted))
+                self.df = pd.concat([self.df, inserted], ignore_index=True)
+                index.add_rows(new_positions, inserted, n_rows=len(self.df))
+                cube.add_rows(inserted)
+                self._insert_ids(inserted[ID_COLUMN].to_numpy(dtype=np.int64), new_positions)
+
+            removed, unknown = self._remove(leavers)
+            index.finish_update(self.df)
+
+            if rebuild_cube:
+                self.cube = AggregateCube(self.df)
+            elif cube.stale_cells:
+                # Rows of the cells that lost their min or max, located with the index
+                mask = np.zeros(len(self.df), dtype=bool)
+                for selections, value_range in cube.stale_selections():
+                    mask |= index.mask(selections, value_range)
+                cube.refresh_extrema(self.df[cube.columns].take(np.flatnonzero(mask)))
+
+            if len(upserts) or removed:
+                digest = _change_digest(upserts, leavers)
+                self.version = hashlib.sha256(f"{self.version}:{digest}".encode()).hexdigest()
+                if journal and self.journal_path:
+                    self._append_journal(upserts, leavers)
+            self.df.attrs["version"] = self.version
+
+        return RefreshSummary(int((~changed).sum()), int(changed.sum()), removed, unknown,
+                              time.perf_counter() - start)
+
+    def _insert_ids(self, ids, positions):
+        # Sorted first, so IDs landing in the same slot keep their order
+        order = np.argsort(ids, kind="stable")
+        ids, positions = ids[order], positions[order]
+        slots = np.searchsorted(self._ids, ids)
+        self._ids = np.insert(self._ids, slots, ids)
+        self._positions = np.insert(self._positions, slots, positions)
+
+    def _remove(self, leavers):
+        positions, slots = self._lookup(leavers)
+        known = positions >= 0
+        holes = np.sort(positions[known])
+        if not len(holes):
+            return 0, int((~known).sum())
+
+        n_rows = len(self.df)
+        n_kept = n_rows - len(holes)
+        old_rows = self.df.iloc[holes]
+        self.filter_index.remove_rows(holes, old_rows)
+        self.cube.remove_rows(old_rows)
+
+        # Rows after the new end that are staying move into the holes before it
+        tail = np.setdiff1d(np.arange(n_kept, n_rows), holes)
+        targets = holes[holes < n_kept]
+        if len(tail):
+            moved = self.df.iloc[tail]
+            self.filter_index.remove_rows(tail, moved)
+            self._write_rows(targets, moved)
+            self.filter_index.add_rows(targets, moved)
+            _, moved_slots = self._lookup(moved[ID_COLUMN])
+            self._positions[moved_slots] = targets
+        self.df = self.df.iloc[:n_kept]
+
+        keep = np.ones(len(self._ids), dtype=bool)
+        keep[slots[known]] = False
+        self._ids, self._positions = self._ids[keep], self._positions[keep]
+        return len(holes), int((~known).sum())
+
+    def _append_journal(self, upserts, leavers):
+        changes = pd.concat([
+            upserts.assign(**{CHANGE_COLUMN: UPSERT}),
+            pd.DataFrame({ID_COLUMN: leavers, CHANGE_COLUMN: LEAVE}),
+        ], ignore_index=True)
+        changes.insert(0, VERSION_COLUMN, self.version)
+        changes.insert(0, BASE_COLUMN, self.base_version)
+        write_header = not os.path.exists(self.journal_path)
+        changes.to_csv(self.journal_path, mode="a", header=write_header, index=False)
+
+    def _replay_journal(self):
+        journal = pd.read_csv(self.journal_path)
+        journal = journal[journal[BASE_COLUMN] == self.base_version]
+        for version, changes in journal.groupby(VERSION_COLUMN, sort=False):
+            upserts = changes[changes[CHANGE_COLUMN] == UPSERT].drop(
+                columns=[BASE_COLUMN, VERSION_COLUMN, CHANGE_COLUMN])
+            leavers = changes.loc[changes[CHANGE_COLUMN] == LEAVE, ID_COLUMN]
+            self.apply_changes(upserts, leavers, journal=False)
+            self.version = version
+        self.df.attrs["version"] = self.version
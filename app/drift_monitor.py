@@ -0,0 +1,187 @@
+"""Streaming drift monitor for the model features and the model's risk score.
+
+``DriftMonitor`` compares every scored batch with the training distribution
+of ``data_cleaned.csv``. For each monitored column it fixes, once, the
+percentiles of the reference values as bin edges (``KS_QUANTILES`` bins,
+fewer for columns with few distinct values), plus a bin below the reference
+minimum, one at or above its maximum and one for missing values. A batch is
+reduced to counts over those bins, so the monitor holds the same few
+hundred counters per column whether it has seen a thousand rows or a
+hundred million, and every statistic is computed from counts:
+
+* PSI (population stability index) over the reference deciles, with the
+  usual 0.1 / 0.25 thresholds for moderate and significant shifts;
+* the two-sample Kolmogorov-Smirnov statistic, the largest gap between the
+  reference and batch CDFs at the bin edges (exact for discrete columns,
+  a slight underestimate otherwise), against its 5% critical value.
+
+``update`` bins one batch and adds it to the running totals; the per-batch
+results of the last ``HISTORY_LENGTH`` batches are kept for the dashboard.
+
+Text features (the dates) are monitored as the model sees them, i.e. as
+their position among the reference values (``FeatureEncoder``), but without
+the winsorizing, so drift in the tails stays visible.
+"""
+import math
+import threading
+from collections import deque, namedtuple
+
+import numpy as np
+
+# Percentile bins per column for the KS statistic, merged into deciles for PSI
+KS_QUANTILES = 100
+PSI_BINS = 10
+
+# Proportion used in place of empty bins, so PSI stays finite
+PSI_EPSILON = 1e-4
+PSI_MODERATE = 0.1
+PSI_SIGNIFICANT = 0.25
+
+# c(alpha) of the two-sample KS test at alpha = 0.05
+KS_CRITICAL_FACTOR = 1.358
+
+HISTORY_LENGTH = 200
+
+RISK_SCORE_COLUMN = "risk_score"
+
+STABLE = "Stable"
+MODERATE = "Moderate"
+DRIFT = "Drift"
+
+DriftStats = namedtuple("DriftStats", ["column", "rows", "psi", "ks", "ks_critical", "missing", "status"])
+BatchDrift = namedtuple("BatchDrift", ["batch", "rows", "stats"])
+
+
+def drift_status(psi, ks, ks_critical):
+    if psi >= PSI_SIGNIFICANT:
+        return DRIFT
+    if psi >= PSI_MODERATE or ks > ks_critical:
+        return MODERATE
+    return STABLE
+
+
+class ColumnProfile:
+    """Reference bins and bin counts of one monitored column."""
+
+    def __init__(self, column, reference_values, quantiles=KS_QUANTILES, psi_bins=PSI_BINS):
+        values = np.asarray(reference_values, dtype=float)
+        finite = values[np.isfinite(values)]
+        if not len(finite):
+            raise ValueError(f"Reference column {column!r} has no values")
+        self.column = column
+        # Percentiles are reference values, so those of discrete columns collapse into one bin per value
+        percentiles = np.quantile(finite, np.linspace(0, 1, quantiles + 1), method="lower")
+        self.edges = np.unique(percentiles)
+        # Decile edges are a subset of the percentile edges, so each fine bin maps to one decile bin
+        psi_edges = np.unique(percentiles[::quantiles // psi_bins])
+        lower_edges = np.concatenate([[-np.inf], self.edges])
+        self.psi_bin = np.searchsorted(psi_edges, lower_edges, side="right")
+        self.n_psi_bins = len(psi_edges) + 2
+        self.reference = self.bin_counts(values)
+
+    @property
+    def n_bins(self):
+        # Below the first edge, between edges, at or above the last edge, then missing values
+        return len(self.edges) + 2
+
+    def bin_counts(self, values):
+        values = np.asarray(values, dtype=float)
+        index = np.searchsorted(self.edges, values, side="right")
+        index[np.isnan(values)] = self.n_bins - 1
+        return np.bincount(index, minlength=self.n_bins)
+
+    def _psi_counts(self, counts):
+        psi_counts = np.bincount(self.psi_bin, weights=counts[:-1], minlength=self.n_psi_bins - 1)
+        return np.append(psi_counts, counts[-1])
+
+    def stats(self, counts):
+        """``DriftStats`` of bin ``counts`` against the reference."""
+        rows = int(counts.sum())
+        if rows == 0:
+            return DriftStats(self.column, 0, np.nan, np.nan, np.nan, np.nan, STABLE)
+
+        expected = self._psi_counts(self.reference) / self.reference.sum()
+        actual = self._psi_counts(counts) / rows
+        expected = np.maximum(expected, PSI_EPSILON)
+        actual = np.maximum(actual, PSI_EPSILON)
+        psi = float(np.sum((actual - expected) * np.log(actual / expected)))
+
+        # CDFs of the non-missing values at the bin edges
+        reference_present = self.reference[:-1]
+        present = counts[:-1]
+        n_reference, n_present = reference_present.sum(), present.sum()
+        if n_present:
+            gaps = np.cumsum(present) / n_present - np.cumsum(reference_present) / n_reference
+            ks = float(np.max(np.abs(gaps)))
+            ks_critical = KS_CRITICAL_FACTOR * math.sqrt((n_reference + n_present) / (n_reference * n_present))
+        else:
+            ks = ks_critical = np.nan
+
+        return DriftStats(self.column, rows, psi, ks, ks_critical, float(counts[-1] / rows),
+                          drift_status(psi, ks, ks_critical))
+
+
+class DriftMonitor:
+    """Running drift statistics of scored batches against reference columns.
+
+    Safe to share across Streamlit sessions: updates hold a lock.
+    """
+
+    def __init__(self, reference_columns, history_length=HISTORY_LENGTH):
+        self.profiles = {column: ColumnProfile(column, values) for column, values in reference_columns.items()}
+        self.history = deque(maxlen=history_length)
+        self._lock = threading.Lock()
+        self.reset()
+
+    @property
+    def columns(self):
+        return list(self.profiles)
+
+    def reset(self):
+        with self._lock:
+            self.totals = {column: np.zeros(profile.n_bins, dtype=np.int64)
+                           for column, profile in self.profiles.items()}
+            self.batches = 0
+            self.rows = 0
+            self.history.clear()
+
+    def update(self, columns):
+        """Add a batch (column name → values) and return its ``BatchDrift``.
+
+        Columns that are not monitored are ignored; monitored columns missing
+        from the batch are skipped for this batch.
+        """
+        counts = {column: profile.bin_counts(columns[column])
+                  for column, profile in self.profiles.items() if column in columns}
+        rows = max((int(values.sum()) for values in counts.values()), default=0)
+        stats = [self.profiles[column].stats(values) for column, values in counts.items()]
+        with self._lock:
+            for column, values in counts.items():
+                self.totals[column] += values
+            self.batches += 1
+            self.rows += rows
+            result = BatchDrift(self.batches, rows, stats)
+            self.history.append(result)
+        return result
+
+    def summary(self):
+        """``DriftStats`` of everything scored since the last reset, per column."""
+        with self._lock:
+            totals = {column: values.copy() for column, values in self.totals.items()}
+        return [self.profiles[column].stats(values) for column, values in totals.items()]
+
+
+def monitored_columns(session, df, risk_score=None):
+    """Model features of ``df`` as the model sees them (unclipped), plus ``risk_score`` when given."""
+    encoded = session.encoder.transform(df, session.features, clip=False)
+    # Missing text values are encoded as -1; count them as missing instead
+    columns = {column: np.where(df[column].isna().to_numpy(), np.nan, encoded[column].to_numpy(dtype=float))
+               for column in session.features}
+    if risk_score is not None:
+        columns[RISK_SCORE_COLUMN] = np.asarray(risk_score, dtype=float)
+    return columns
+
+
+def monitor_for_session(session, reference):
+    """A ``DriftMonitor`` of the session's features and risk score on ``reference``."""
+    return DriftMonitor(monitored_columns(session, reference, session.predict_proba(reference)))
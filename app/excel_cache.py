@@ -0,0 +1,318 @@
+"""Columnar cache for .xlsx HR exports such as ``notebook/data.xlsx``.
+
+``pd.read_excel`` with openpyxl parses every cell in Python and is by far
+the slowest step of the cleaning. ``ensure_excel_cache`` converts the first
+sheet once into an uncompressed Arrow IPC file next to it
+(``data.xlsx.arrow``) and reuses it while the workbook is unchanged (same
+size and mtime, or same SHA-256, as ``data_cache``). Readers then
+memory-map the cache instead of touching the workbook.
+
+The sheet is streamed in chunks from the fastest reader installed:
+
+* ``python-calamine`` (Rust; ``pip install python-calamine``), or
+* openpyxl in read-only mode, which never loads the whole workbook.
+
+Cells are converted and parsed exactly as ``pd.read_excel`` does with the
+same engine. Each chunk is written to a temporary Arrow file, and the cache is
+assembled from them with the dtypes pandas infers for the whole sheet.
+Arrow columns have a single type, so columns that mix text with numbers or
+dates are stored as text tagged with each value's type (``i2``, ``f0.33``,
+``sNo``) and decoded back to the same Python values on read.
+
+Build it ahead of time with::
+
+    python app/excel_cache.py notebook/data.xlsx
+"""
+import os
+import sys
+import json
+import tempfile
+import time
+from datetime import date, datetime, time as datetime_time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.ipc as ipc
+
+from data_cache import atomic_write, ensure_cache, file_hash, source_metadata
+
+CACHE_EXTENSION = ".arrow"
+DEFAULT_CHUNK_SIZE = 50_000
+
+# Cache format version, as data_cache.CACHE_VERSION for the CSV cache
+CACHE_VERSION = "excel-1"
+
+CALAMINE = "calamine"
+OPENPYXL = "openpyxl"
+
+
+def excel_cache_path_for(xlsx_path):
+    return xlsx_path + CACHE_EXTENSION
+
+
+def available_reader():
+    """``"calamine"`` when python-calamine is installed, else ``"openpyxl"``."""
+    try:
+        import python_calamine  # noqa: F401
+    except ImportError:
+        return OPENPYXL
+    return CALAMINE
+
+
+def _convert_openpyxl_cell(cell):
+    # As pandas' openpyxl reader: blanks are "", errors NaN, whole floats become ints
+    from openpyxl.cell.cell import TYPE_ERROR, TYPE_NUMERIC
+
+    if cell.value is None:
+        return ""
+    if cell.data_type == TYPE_ERROR:
+        return np.nan
+    if cell.data_type == TYPE_NUMERIC:
+        value = int(cell.value)
+        return value if value == cell.value else float(cell.value)
+    return cell.value
+
+
+def _convert_calamine_cell(value):
+    # As pandas' calamine reader: whole floats become ints, dates become datetimes
+    if isinstance(value, float):
+        whole = int(value)
+        return whole if whole == value else value
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return datetime(value.year, value.month, value.day)
+    return value
+
+
+def _openpyxl_rows(path):
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        for cells in workbook.worksheets[0].iter_rows():
+            yield [_convert_openpyxl_cell(cell) for cell in cells]
+    finally:
+        workbook.close()
+
+
+def _calamine_rows(path):
+    from python_calamine import CalamineWorkbook
+
+    sheet = CalamineWorkbook.from_path(path).get_sheet_by_index(0)
+    # iter_rows starts at the first used cell; pandas keeps the empty area before it
+    first_row, first_column = sheet.start or (0, 0)
+    for _ in range(first_row):
+        yield [""] * (first_column + sheet.width)
+    for row in sheet.iter_rows():
+        yield [""] * first_column + [_convert_calamine_cell(value) for value in row]
+
+
+def _parse_rows(header, rows, dtype=None):
+    from pandas.io.parsers import TextParser
+
+    return TextParser([header, *rows], header=0, dtype=dtype).read()
+
+
+def iter_sheet_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE, dtype=None, reader=None):
+    """Yield frames of ``chunk_size`` rows from the first sheet of an .xlsx file.
+
+    Each chunk is parsed like ``pd.read_excel`` parses the whole sheet
+    (header row, NA strings, type inference, ``dtype``), but dtypes are
+    inferred per chunk. Trailing blank rows are dropped as pandas does.
+    ``reader`` is ``"calamine"`` or ``"openpyxl"`` (default: the fastest
+    available).
+    """
+    rows = _calamine_rows(path) if (reader or available_reader()) == CALAMINE else _openpyxl_rows(path)
+    header = next(rows, None)
+    if not header:
+        return
+    batch, blank = [], []
+    for row in rows:
+        if all(value == "" for value in row):
+            # Kept only if a non-blank row follows
+            blank.append(row)
+            continue
+        batch.extend(blank)
+        blank = []
+        batch.append(row)
+        if len(batch) >= chunk_size:
+            yield _parse_rows(header, batch[:chunk_size], dtype)
+            batch = batch[chunk_size:]
+    if batch:
+        yield _parse_rows(header, batch, dtype)
+
+
+def dtype_kind(dtype):
+    """Coarse kind of a pandas dtype: int, float, bool, datetime, timedelta, str or object."""
+    if isinstance(dtype, pd.StringDtype):
+        return "str"
+    if dtype.kind in "iu":
+        return "int"
+    if dtype.kind in "fbMm":
+        return {"f": "float", "b": "bool", "M": "datetime", "m": "timedelta"}[dtype.kind]
+    return "object"
+
+
+def merge_dtypes(current, dtype):
+    """Dtype pandas infers for a column whose chunks have ``current`` and ``dtype``."""
+    if current is None or current == dtype:
+        return dtype
+    kinds = {dtype_kind(current), dtype_kind(dtype)}
+    if kinds == {"int", "float"}:
+        return np.dtype(np.float64)
+    if len(kinds) == 1 and kinds != {"object"}:
+        # Same kind at another resolution (e.g. datetime64[s] and [us])
+        return np.result_type(current, dtype)
+    return np.dtype(object)
+
+
+def _arrow_type(dtype):
+    kind = dtype_kind(dtype) if dtype is not None else "float"
+    if kind in ("str", "object"):
+        return pa.string()
+    if kind == "int":
+        return pa.int64()
+    if kind == "float":
+        return pa.float64()
+    return pa.from_numpy_dtype(dtype)
+
+
+def _encode_mixed(value):
+    if isinstance(value, (bool, np.bool_)):
+        return f"b{int(value)}"
+    if isinstance(value, (int, np.integer)):
+        return f"i{value}"
+    if isinstance(value, (float, np.floating)):
+        # Whole floats were ints in the sheet, only turned float by gaps in their chunk
+        return f"i{int(value)}" if float(value).is_integer() else f"f{float(value)!r}"
+    if isinstance(value, datetime):
+        return f"d{value.isoformat()}"
+    if isinstance(value, datetime_time):
+        return f"t{value.isoformat()}"
+    return f"s{value}"
+
+
+_DECODERS = {"b": lambda text: text == "1", "i": int, "f": float, "d": datetime.fromisoformat,
+             "t": datetime_time.fromisoformat, "s": str}
+
+
+def _decode_mixed(text):
+    return _DECODERS[text[0]](text[1:])
+
+
+def _tagged(values):
+    return pa.array(values.map(_encode_mixed, na_action="ignore").astype(object), type=pa.string(),
+                    from_pandas=True)
+
+
+def _chunk_table(chunk):
+    fields, arrays = [], []
+    for column in chunk.columns:
+        values = chunk[column]
+        if values.isna().all():
+            array = pa.nulls(len(values))
+        elif dtype_kind(values.dtype) == "object":
+            array = _tagged(values)
+        else:
+            array = pa.array(values, from_pandas=True)
+        tagged = {b"tagged": b"1"} if dtype_kind(values.dtype) == "object" else None
+        fields.append(pa.field(column, array.type, metadata=tagged))
+        arrays.append(array)
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+
+def _cast_spill(table, schema, mixed):
+    arrays = []
+    for field, target in zip(table.schema, schema):
+        array = table.column(field.name)
+        if field.name in mixed and field.type != pa.null() and not (field.metadata or {}).get(b"tagged"):
+            # A chunk of plain numbers, dates or text in a mixed column
+            array = _tagged(array.to_pandas())
+        arrays.append(array.cast(target.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def _restore_mixed(data, mixed):
+    for column in mixed:
+        data[column] = data[column].astype(object).map(_decode_mixed, na_action="ignore")
+    return data
+
+
+def build_excel_cache(xlsx_path, cache_path=None, source_hash=None, chunk_size=DEFAULT_CHUNK_SIZE, reader=None):
+    """Convert the first sheet of ``xlsx_path`` into the columnar cache and return its path."""
+    cache_path = cache_path or excel_cache_path_for(xlsx_path)
+    directory = os.path.dirname(os.path.abspath(cache_path))
+    with tempfile.TemporaryDirectory(dir=directory, prefix=".excel_cache_") as spill_dir:
+        # Pass over the sheet: spill each chunk with its own types, merge the dtypes
+        columns, dtypes, spills = None, {}, []
+        for number, chunk in enumerate(iter_sheet_chunks(xlsx_path, chunk_size, reader=reader)):
+            columns = list(chunk.columns)
+            for column in columns:
+                if not chunk[column].isna().all():
+                    dtypes[column] = merge_dtypes(dtypes.get(column), chunk[column].dtype)
+            spill_path = os.path.join(spill_dir, f"{number}.arrow")
+            feather.write_feather(_chunk_table(chunk), spill_path, compression="uncompressed")
+            spills.append(spill_path)
+
+        mixed = [column for column, dtype in dtypes.items() if dtype_kind(dtype) == "object"]
+        schema = pa.schema([(column, _arrow_type(dtypes.get(column))) for column in columns or []])
+        metadata = source_metadata(xlsx_path, CACHE_VERSION, source_hash)
+        metadata[b"mixed_columns"] = json.dumps(mixed).encode()
+
+        with atomic_write(cache_path) as tmp_path:
+            with pa.OSFile(tmp_path, "wb") as sink, ipc.new_file(sink, schema.with_metadata(metadata)) as writer:
+                for spill_path in spills:
+                    writer.write_table(_cast_spill(feather.read_table(spill_path, memory_map=True), schema, mixed))
+    return cache_path
+
+
+def ensure_excel_cache(xlsx_path, cache_path=None):
+    """Return a cache path that is up to date with ``xlsx_path``, converting it if needed."""
+    return ensure_cache(xlsx_path, cache_path or excel_cache_path_for(xlsx_path),
+                        build=build_excel_cache, version=CACHE_VERSION)
+
+
+def iter_excel_chunks(xlsx_path, chunk_size=DEFAULT_CHUNK_SIZE, dtype=None):
+    """Yield the first sheet of ``xlsx_path`` as frames of at most ``chunk_size`` rows.
+
+    Reads the columnar cache (converting the workbook first if needed), so
+    the dtypes are the whole-sheet ones and ``dtype`` is not needed. Streams
+    the workbook directly when the cache cannot be written.
+    """
+    try:
+        cache_path = ensure_excel_cache(xlsx_path)
+    except OSError:
+        yield from iter_sheet_chunks(xlsx_path, chunk_size, dtype)
+        return
+    with pa.memory_map(cache_path) as source:
+        reader = ipc.open_file(source)
+        mixed = json.loads(reader.schema.metadata[b"mixed_columns"])
+        for index in range(reader.num_record_batches):
+            batch = reader.get_batch(index)
+            for start in range(0, batch.num_rows, chunk_size):
+                yield _restore_mixed(batch.slice(start, chunk_size).to_pandas(), mixed)
+
+
+def read_excel_cached(xlsx_path):
+    """The first sheet of ``xlsx_path`` as ``pd.read_excel`` would return it, via the cache.
+
+    ``data.attrs["version"]`` is the SHA-256 of the workbook.
+    """
+    try:
+        cache_path = ensure_excel_cache(xlsx_path)
+    except OSError:
+        data = pd.read_excel(xlsx_path, engine=available_reader())
+        data.attrs["version"] = file_hash(xlsx_path)
+        return data
+    table = feather.read_table(cache_path, memory_map=True)
+    data = _restore_mixed(table.to_pandas(), json.loads(table.schema.metadata[b"mixed_columns"]))
+    data.attrs["version"] = table.schema.metadata[b"source_sha256"].decode()
+    return data
+
+
+if __name__ == "__main__":
+    source = sys.argv[1] if len(sys.argv) > 1 else os.path.join("notebook", "data.xlsx")
+    start = time.perf_counter()
+    path = build_excel_cache(source)
+    print(f"Cache written to {path} with {available_reader()} in {time.perf_counter() - start:.2f}s")
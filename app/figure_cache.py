@@ -0,0 +1,75 @@
+"""LRU cache of rendered chart images.
+
+The Interactive Visualizations page renders the same seaborn figures again
+on every rerun. ``FigureCache`` keeps the encoded PNG bytes keyed by
+(visualization, chart, filter state, dataset version), so a rerun with an
+unchanged selection never touches matplotlib. Entries are evicted least
+recently used first once the entry count or the total size cap is reached.
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_ENTRIES = 512
+
+
+def filter_state_key(selections, value_range=None):
+    """Canonical hash of a filter selection, independent of selection order."""
+    state = {
+        "selections": {column: sorted(str(value) for value in values or [])
+                       for column, values in sorted(selections.items())},
+        "range": [int(bound) for bound in value_range] if value_range is not None else None,
+    }
+    encoded = json.dumps(state, sort_keys=True, ensure_ascii=False).encode()
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+class FigureCache:
+    """Thread-safe LRU map from chart keys to image bytes, bounded by size."""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            image = self._entries.get(key)
+            if image is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return image
+
+    def put(self, key, image):
+        if len(image) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= len(self._entries.pop(key))
+            self._entries[key] = image
+            self._bytes += len(image)
+            while self._bytes > self.max_bytes or len(self._entries) > self.max_entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
@@ -0,0 +1,245 @@
+"""Copy-free filter engine for the Interactive Visualizations page.
+
+``FilterIndex`` is built once per dataset version:
+
+* every value of the categorical filter columns (Departamento, Sexo,
+  Categoría laboral) gets a packed bitmap of the rows holding it;
+* ``Edad`` gets a sorted index plus prefix bitmaps at each distinct age, so
+  any age range is ``prefix[hi] & ~prefix[lo]``.
+
+A filter selection is then a handful of 64-bit bitwise operations over
+``n / 64`` words, and only the columns a chart needs are materialized.
+
+``add_rows`` and ``remove_rows`` set and clear the bits of individual rows,
+so an incremental refresh (see ``dataset_store``) costs the size of the
+change rather than a rebuild.
+"""
+import numpy as np
+import pandas as pd
+
+CATEGORY_FILTER_COLUMNS = ["Departamento", "Sexo", "Categoría laboral"]
+RANGE_FILTER_COLUMN = "Edad"
+
+# Above this many distinct values the range column gets no prefix bitmaps
+MAX_PREFIX_BITMAPS = 512
+
+
+def _pack(mask):
+    """Pack a boolean mask into uint64 words (padded with zero bits)."""
+    packed = np.packbits(mask, bitorder="little")
+    padding = (-len(packed)) % 8
+    if padding:
+        packed = np.concatenate([packed, np.zeros(padding, dtype=np.uint8)])
+    return packed.view(np.uint64)
+
+
+def _grow(bitmaps, width):
+    return np.pad(bitmaps, ((0, 0), (0, width - bitmaps.shape[1])))
+
+
+def _update_bits(bitmaps, rows, positions, on):
+    """Set (or clear) bit ``positions[i]`` in ``bitmaps[rows[i]]``."""
+    positions = np.asarray(positions, dtype=np.uint64)
+    words = (positions >> np.uint64(6)).astype(np.intp)
+    bits = np.left_shift(np.uint64(1), positions & np.uint64(63))
+    if on:
+        np.bitwise_or.at(bitmaps, (rows, words), bits)
+    else:
+        np.bitwise_and.at(bitmaps, (rows, words), ~bits)
+
+
+class FilterIndex:
+    """Precomputed bitmaps and sorted index over the filter columns of a frame."""
+
+    def __init__(self, df, category_columns=CATEGORY_FILTER_COLUMNS, range_column=RANGE_FILTER_COLUMN):
+        self.df = df
+        self.n_rows = len(df)
+        self._all = _pack(np.ones(self.n_rows, dtype=bool))
+
+        # {column: (sorted values, stacked bitmaps with one row per value)}
+        self._bitmaps = {}
+        for column in category_columns:
+            if column in df.columns:
+                self._bitmaps[column] = self._build_bitmaps(df[column])
+
+        self.range_column = range_column if range_column in df.columns else None
+        self._range_dirty = False
+        if self.range_column is not None:
+            self._build_range_index(df[self.range_column].to_numpy())
+
+    def _build_bitmaps(self, series):
+        codes, uniques = pd.factorize(series, sort=True, use_na_sentinel=True)
+        values = list(uniques)
+        bitmaps = np.empty((len(values), len(self._all)), dtype=np.uint64)
+        for position in range(len(values)):
+            bitmaps[position] = _pack(codes == position)
+        # Rows per value, so values left without rows drop out of ``values``
+        counts = np.bincount(codes[codes >= 0], minlength=len(values))
+        return values, bitmaps, counts
+
+    def _build_range_index(self, values):
+        self._order = np.argsort(values, kind="stable")
+        self._sorted_values = values[self._order]
+        # Range lookups search the few distinct values, never the full column
+        self._distinct = np.unique(self._sorted_values)
+        self._boundaries = np.append(
+            np.searchsorted(self._sorted_values, self._distinct, side="left"), self.n_rows
+        )
+        self._range_counts = np.diff(self._boundaries)
+
+        self._prefix_bitmaps = None
+        if len(self._distinct) <= MAX_PREFIX_BITMAPS:
+            # prefix[j] holds the rows before the j-th distinct value in sorted order
+            self._prefix_bitmaps = np.empty((len(self._boundaries), len(self._all)), dtype=np.uint64)
+            mask = np.zeros(self.n_rows, dtype=bool)
+            start = 0
+            for j, end in enumerate(self._boundaries):
+                mask[self._order[start:end]] = True
+                self._prefix_bitmaps[j] = _pack(mask)
+                start = end
+
+    def values(self, column):
+        """Sorted distinct values of a categorical filter column."""
+        values, _, counts = self._bitmaps[column]
+        return [value for value, count in zip(values, counts) if count]
+
+    def range_bounds(self):
+        present = self._distinct[self._range_counts > 0]
+        return present[0], present[-1]
+
+    def _category_bitmap(self, column, selected):
+        values, bitmaps, _ = self._bitmaps[column]
+        positions = [values.index(value) for value in selected if value in values]
+        if not positions:
+            return np.zeros_like(self._all)
+        if len(positions) == 1:
+            return bitmaps[positions[0]]
+        return np.bitwise_or.reduce(bitmaps[positions], axis=0)
+
+    def _range_bitmap(self, low, high):
+        lo_index = np.searchsorted(self._distinct, low, side="left")
+        hi_index = np.searchsorted(self._distinct, high, side="right")
+        if self._prefix_bitmaps is not None:
+            return self._prefix_bitmaps[hi_index] & ~self._prefix_bitmaps[lo_index]
+        # As wide as the other bitmaps, which grow ahead of n_rows
+        mask = np.zeros(len(self._all) * 64, dtype=bool)
+        mask[self._order[self._boundaries[lo_index]:self._boundaries[hi_index]]] = True
+        return _pack(mask)
+
+    def bitmap(self, selections=None, value_range=None):
+        """Packed bitmap of the rows matching every selection.
+
+        ``selections`` maps a categorical column to the selected values; an
+        empty or missing selection does not filter that column, like the
+        original filter block. ``value_range`` is an inclusive (low, high)
+        range on the range column.
+        """
+        result = self._all
+        for column, selected in (selections or {}).items():
+            if selected and column in self._bitmaps:
+                result = result & self._category_bitmap(column, selected)
+        if value_range is not None and self.range_column is not None:
+            result = result & self._range_bitmap(*value_range)
+        return result
+
+    def mask(self, selections=None, value_range=None):
+        """Boolean row mask for the selections (see ``bitmap``)."""
+        packed = self.bitmap(selections, value_range).view(np.uint8)
+        return np.unpackbits(packed, count=self.n_rows, bitorder="little").view(bool)
+
+    def count(self, selections=None, value_range=None):
+        """Number of matching rows, computed on the packed bitmap."""
+        packed = self.bitmap(selections, value_range).view(np.uint8)
+        return int(np.unpackbits(packed, bitorder="little").sum())
+
+    def _resize(self, n_rows):
+        # Bitmaps grow by doubling, so appends rarely copy them
+        words = -(-n_rows // 64)
+        width = len(self._all)
+        if words > width:
+            width = max(words, 2 * width)
+            for column, (values, bitmaps, counts) in self._bitmaps.items():
+                self._bitmaps[column] = (values, _grow(bitmaps, width), counts)
+            if self.range_column is not None and self._prefix_bitmaps is not None:
+                self._prefix_bitmaps = _grow(self._prefix_bitmaps, width)
+        mask = np.zeros(width * 64, dtype=bool)
+        mask[:n_rows] = True
+        self._all = _pack(mask)
+        self.n_rows = n_rows
+
+    def _change_rows(self, positions, rows, on):
+        positions = np.asarray(positions, dtype=np.int64)
+        for column, (values, bitmaps, counts) in self._bitmaps.items():
+            if column not in rows.columns:
+                continue
+            column_values = rows[column].to_numpy(dtype=object)
+            present = pd.notna(column_values)
+            if on:
+                for value in dict.fromkeys(column_values[present]):
+                    if value not in values:
+                        # New value: insert an empty bitmap at its sorted place
+                        position = int(np.searchsorted(np.array(values, dtype=object), value))
+                        values.insert(position, value)
+                        bitmaps = np.insert(bitmaps, position, 0, axis=0)
+                        counts = np.insert(counts, position, 0)
+            lookup = {value: code for code, value in enumerate(values)}
+            codes = np.array([lookup[value] for value in column_values[present]], dtype=np.intp)
+            _update_bits(bitmaps, codes, positions[present], on)
+            np.add.at(counts, codes, 1 if on else -1)
+            self._bitmaps[column] = (values, bitmaps, counts)
+
+        if self.range_column is None or self.range_column not in rows.columns:
+            return
+        if self._prefix_bitmaps is None:
+            self._range_dirty = True
+            return
+        range_values = rows[self.range_column].to_numpy()
+        if on:
+            for value in np.setdiff1d(range_values, self._distinct):
+                # prefix[j] holds rows below distinct[j]; a new value starts with its successor's rows
+                position = int(np.searchsorted(self._distinct, value))
+                self._distinct = np.insert(self._distinct, position, value)
+                self._prefix_bitmaps = np.insert(self._prefix_bitmaps, position, self._prefix_bitmaps[position], axis=0)
+                self._range_counts = np.insert(self._range_counts, position, 0)
+        value_index = np.searchsorted(self._distinct, range_values)
+        np.add.at(self._range_counts, value_index, 1 if on else -1)
+        for j in range(1, len(self._prefix_bitmaps)):
+            below = value_index < j
+            if below.any():
+                _update_bits(self._prefix_bitmaps, np.full(below.sum(), j), positions[below], on)
+
+    def remove_rows(self, positions, rows):
+        """Clear the bits of ``rows`` (their current values) at ``positions``."""
+        self._change_rows(positions, rows, on=False)
+
+    def add_rows(self, positions, rows, n_rows=None):
+        """Set the bits of ``rows`` at ``positions``, growing to ``n_rows`` rows first."""
+        if n_rows is not None and n_rows != self.n_rows:
+            self._resize(n_rows)
+        self._change_rows(positions, rows, on=True)
+
+    def finish_update(self, df):
+        """Point the index at the updated frame after add/remove calls."""
+        self.df = df
+        if len(df) != self.n_rows:
+            self._resize(len(df))
+        if self._range_dirty:
+            # Without prefix bitmaps the sorted index is simply rebuilt
+            self._build_range_index(df[self.range_column].to_numpy())
+            self._range_dirty = False
+
+    def select(self, columns, selections=None, value_range=None):
+        """Materialize only ``columns`` for the matching rows.
+
+        Categorical columns lose the categories that were filtered out, so
+        counts and charts only show the selected groups.
+        """
+        rows = np.flatnonzero(self.mask(selections, value_range))
+        selected = {}
+        for column in dict.fromkeys(columns):
+            series = self.df[column]
+            values = series.array.take(rows)
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                values = values.remove_unused_categories()
+            selected[column] = values
+        return pd.DataFrame(selected, index=self.df.index.take(rows))
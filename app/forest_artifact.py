@@ -0,0 +1,237 @@
+"""Flat, memory-mappable export of the turnover RandomForest.
+
+``joblib.load`` of the pickled ``model_package`` rebuilds every tree object,
+so the load time grows with the number and depth of the trees, and every
+process holds its own copy. ``export_forest_package`` writes the forest as
+flat node arrays in one uncompressed Arrow IPC file instead:
+
+* ``feature``, ``threshold``, ``left``, ``right`` and ``missing_left``
+  (bytes, as Arrow packs booleans into bits) per node, with the nodes of all
+  trees one after another and child indices into the whole array, in the
+  layout ``forest_engine`` evaluates (breadth-first, siblings adjacent,
+  leaves pointing to themselves);
+* ``value``: the class probabilities of every node, normalized as
+  ``DecisionTreeClassifier.predict_proba`` normalizes its leaves;
+* the tree roots and depths, the classes, the feature importances, the
+  features and the scaler's mean and scale in the schema metadata.
+
+``load_forest_package`` memory-maps the file and views the columns as NumPy
+arrays without copying, so opening it costs the same for any forest and
+every process on the machine shares the same pages. It returns a
+``model_package``-like dict whose ``FlatForest`` (scored by
+``forest_engine.ForestEngine``) and ``FlatScaler`` give exactly the
+probabilities of the scikit-learn objects, so ``InferenceSession`` takes it
+as is.
+
+``ensure_forest_artifact`` keeps ``<package>.arrow`` next to the pickle up to
+date, like ``data_cache`` does for the CSV. Build it ahead of time with::
+
+    python app/forest_artifact.py models/modelo_rotacion_externa_random_forest.pkl
+"""
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from data_cache import atomic_write, ensure_cache, source_metadata
+from forest_engine import ForestEngine, compiled_kernel_available, sibling_order
+
+ARTIFACT_EXTENSION = ".arrow"
+
+# Artifact layout version, as data_cache.CACHE_VERSION for the CSV cache
+ARTIFACT_VERSION = "forest-2"
+
+
+def artifact_path_for(package_path):
+    return os.path.splitext(package_path)[0] + ARTIFACT_EXTENSION
+
+
+class FlatForest:
+    """RandomForest ``predict_proba`` over flat node arrays."""
+
+    def __init__(self, feature, threshold, left, right, missing_left, value, roots, depths, classes):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.missing_left = missing_left
+        self.value = value
+        self.roots = np.asarray(roots, dtype=np.intp)
+        self.depths = np.asarray(depths, dtype=np.intp)
+        self.classes_ = np.asarray(classes)
+        self.n_features_in_ = None
+        self.feature_importances_ = None
+        self.engine = ForestEngine(feature, threshold, left, missing_left, value, roots, max(depths, default=0))
+
+    @classmethod
+    def from_sklearn(cls, model):
+        """Flatten a fitted ``RandomForestClassifier`` (or ``ExtraTreesClassifier``)."""
+        estimators = getattr(model, "estimators_", None)
+        # GradientBoosting keeps a 2-D array of regression trees instead
+        if (not isinstance(estimators, list) or not estimators or getattr(model, "n_outputs_", 1) != 1
+                or not hasattr(estimators[0], "predict_proba")):
+            raise ValueError(f"Only single-output forest classifiers can be flattened, not {type(model).__name__}")
+
+        n_classes = len(model.classes_)
+        arrays = {name: [] for name in ("feature", "threshold", "left", "right", "missing_left", "value")}
+        roots, depths, offset = [], [], 0
+        for estimator in estimators:
+            tree = estimator.tree_
+            order = sibling_order(tree.children_left, tree.children_right)
+            position = np.empty(tree.node_count, dtype=np.intp)
+            position[order] = np.arange(tree.node_count)
+            leaf = tree.children_left[order] == -1
+            nodes = np.arange(tree.node_count)
+            arrays["feature"].append(np.where(leaf, 0, tree.feature[order]).astype(np.int32))
+            arrays["threshold"].append(np.where(leaf, np.inf, tree.threshold[order]))
+            left = np.where(leaf, nodes, position[tree.children_left[order]])
+            arrays["left"].append((left + offset).astype(np.int32))
+            arrays["right"].append((np.where(leaf, nodes, left + 1) + offset).astype(np.int32))
+            missing = getattr(tree, "missing_go_to_left", np.zeros(tree.node_count, dtype=np.uint8))
+            arrays["missing_left"].append(np.asarray(missing, dtype=bool)[order] | leaf)
+            # As DecisionTreeClassifier.predict_proba: each node's values over their sum
+            value = tree.value[order, 0, :n_classes].copy()
+            normalizer = value.sum(axis=1)[:, np.newaxis]
+            normalizer[normalizer == 0.0] = 1.0
+            value /= normalizer
+            arrays["value"].append(value)
+            roots.append(offset)
+            depths.append(tree.max_depth)
+            offset += tree.node_count
+        forest = cls(*(np.concatenate(arrays[name]) for name in arrays), roots, depths, model.classes_)
+        forest.n_features_in_ = model.n_features_in_
+        forest.feature_importances_ = model.feature_importances_
+        return forest
+
+    def predict_proba(self, X):
+        return self.engine.predict_proba(X)
+
+    def predict(self, X):
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+
+
+class FlatScaler:
+    """``StandardScaler.transform`` from the saved mean and scale."""
+
+    def __init__(self, mean, scale, feature_names=None):
+        self.mean_ = None if mean is None else np.asarray(mean, dtype=np.float64)
+        self.scale_ = None if scale is None else np.asarray(scale, dtype=np.float64)
+        if feature_names is not None:
+            self.feature_names_in_ = np.asarray(feature_names, dtype=object)
+
+    @property
+    def n_features_in_(self):
+        return len(self.mean_ if self.mean_ is not None else self.scale_)
+
+    def transform(self, X):
+        X = np.array(X, dtype=np.float64)
+        if self.mean_ is not None:
+            X -= self.mean_
+        if self.scale_ is not None:
+            X /= self.scale_
+        return X
+
+
+def _json_array(values):
+    return None if values is None else [float(value) for value in values]
+
+
+def export_forest_package(package, artifact_path, metadata=None):
+    """Write the forest, scaler and features of ``package`` to ``artifact_path``.
+
+    Raises ``ValueError`` when the model is not a forest classifier (e.g. the
+    GradientBoosting package ``training`` may pick).
+    """
+    forest = FlatForest.from_sklearn(package["model"])
+    scaler = package["scaler"]
+    columns = {
+        "feature": forest.feature,
+        "threshold": forest.threshold,
+        "left": forest.left,
+        "right": forest.right,
+        "missing_left": forest.missing_left.view(np.uint8),
+        "value": pa.FixedSizeListArray.from_arrays(forest.value.ravel(), forest.value.shape[1]),
+    }
+    model = {
+        "roots": forest.roots.tolist(),
+        "depths": forest.depths.tolist(),
+        "classes": forest.classes_.tolist(),
+        "n_features": int(forest.n_features_in_),
+        "feature_importances": _json_array(forest.feature_importances_),
+        "features": list(package["features"]),
+        "scaler_mean": _json_array(getattr(scaler, "mean_", None)),
+        "scaler_scale": _json_array(getattr(scaler, "scale_", None)),
+        "scaler_features": (None if getattr(scaler, "feature_names_in_", None) is None
+                            else list(scaler.feature_names_in_)),
+    }
+    table = pa.table(columns).replace_schema_metadata({
+        **(metadata or {}), b"model": json.dumps(model, ensure_ascii=False).encode(),
+    })
+
+    with atomic_write(artifact_path) as tmp_path:
+        feather.write_feather(table, tmp_path, compression="uncompressed")
+    return artifact_path
+
+
+def build_forest_artifact(package_path, artifact_path=None, source_hash=None):
+    """Unpickle ``package_path`` and export it; return the artifact path."""
+    import joblib
+
+    artifact_path = artifact_path or artifact_path_for(package_path)
+    return export_forest_package(joblib.load(package_path), artifact_path,
+                                 source_metadata(package_path, ARTIFACT_VERSION, source_hash))
+
+
+def ensure_forest_artifact(package_path, artifact_path=None):
+    """Return an artifact path that is up to date with ``package_path``, exporting it if needed."""
+    return ensure_cache(package_path, artifact_path or artifact_path_for(package_path),
+                        build=build_forest_artifact, version=ARTIFACT_VERSION)
+
+
+def _column(table, name):
+    # Views into the memory-mapped file, nothing is copied
+    return table.column(name).chunk(0).to_numpy(zero_copy_only=True)
+
+
+def load_forest_package(artifact_path):
+    """Memory-map an artifact as a ``model_package`` dict (``model``, ``scaler``, ``features``)."""
+    table = feather.read_table(artifact_path, memory_map=True)
+    model = json.loads(table.schema.metadata[b"model"])
+    n_classes = len(model["classes"])
+    value = table.column("value").chunk(0).values.to_numpy(zero_copy_only=True).reshape(-1, n_classes)
+    forest = FlatForest(_column(table, "feature"), _column(table, "threshold"), _column(table, "left"),
+                        _column(table, "right"), _column(table, "missing_left").view(bool), value, model["roots"], model["depths"],
+                        model["classes"])
+    forest.n_features_in_ = model["n_features"]
+    forest.feature_importances_ = np.asarray(model["feature_importances"])
+    scaler = FlatScaler(model["scaler_mean"], model["scaler_scale"], model["scaler_features"])
+    return {"model": forest, "scaler": scaler, "features": model["features"]}
+
+
+def load_model_package(package_path):
+    """The ``model_package`` at ``package_path``, from its flat artifact when possible.
+
+    Falls back to ``joblib.load`` for models that cannot be flattened, when
+    the artifact cannot be written (e.g. a read-only deployment) and without
+    numba, as the NumPy engine alone scores large batches slower than
+    scikit-learn.
+    """
+    if compiled_kernel_available():
+        try:
+            return load_forest_package(ensure_forest_artifact(package_path))
+        except (OSError, ValueError):
+            pass
+    import joblib
+
+    return joblib.load(package_path)
+
+
+if __name__ == "__main__":
+    source = sys.argv[1] if len(sys.argv) > 1 else os.path.join("models", "modelo_rotacion_externa_random_forest.pkl")
+    start = time.perf_counter()
+    path = build_forest_artifact(source)
+    print(f"Artifact written to {path} in {time.perf_counter() - start:.2f}s")
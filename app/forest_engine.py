@@ -0,0 +1,164 @@
+"""Block-wise inference for flattened tree ensembles.
+
+``ForestEngine`` scores rows against every tree at once: a block of rows
+holds one current node per (row, tree) and all of them step one level down
+per iteration, so the Python loop runs once per tree level, not once per
+tree. The node arrays are laid out for that loop (see ``sibling_order``):
+
+* the children of a node are adjacent, so the next node is
+  ``left[node] + goes_right`` and needs no ``np.where``;
+* leaves have a ``+inf`` threshold, send missing values left and point to
+  themselves, so rows that reached a leaf stay there without masks.
+
+Thresholds are rounded down to float32: the inputs are float32 (as in
+scikit-learn's trees), and ``x <= t`` gives the same answer as
+``x <= float32_floor(t)`` for any float32 ``x``. Leaf probabilities are
+summed tree by tree, in the order ``RandomForestClassifier`` sums them, so
+the probabilities are bit-identical.
+
+NumPy pays several passes over the block per tree level, which is several
+times slower than scikit-learn's compiled traversal on large batches
+(``benchmarks/batch_inference.py``). Batches of ``COMPILED_MIN_ROWS`` rows
+or more therefore run the same walk in the compiled kernel of
+``forest_kernels``, one tree at a time over all rows, in parallel over rows.
+numba is in ``requirements.txt``; where it is missing,
+``forest_artifact.load_model_package`` keeps the scikit-learn model.
+"""
+import importlib.util
+
+import numpy as np
+
+# Rows per NumPy block: (rows × trees) node indices that stay in cache
+DEFAULT_BLOCK_CELLS = 1 << 16
+
+# Smaller batches stay on NumPy, so one-employee requests never import numba
+COMPILED_MIN_ROWS = 2_000
+
+NUMPY = "numpy"
+NUMBA = "numba"
+
+
+def sibling_order(children_left, children_right):
+    """Breadth-first order of a scikit-learn tree's nodes with each node's children adjacent."""
+    order = [0]
+    for node in order:
+        if children_left[node] != -1:
+            order.extend((children_left[node], children_right[node]))
+    return np.asarray(order, dtype=np.intp)
+
+
+def float32_floor(values):
+    """Largest float32 that is at most each float64 value."""
+    rounded = values.astype(np.float32)
+    above = rounded.astype(np.float64) > values
+    rounded[above] = np.nextafter(rounded[above], np.float32(-np.inf))
+    return rounded
+
+
+def compiled_kernel_available():
+    """Whether numba can be imported, checked without importing it."""
+    return importlib.util.find_spec("numba") is not None
+
+
+def compiled_kernel():
+    """The ``forest_kernels`` module, or ``None`` without numba."""
+    try:
+        import forest_kernels
+    except ImportError:
+        return None
+    return forest_kernels
+
+
+class ForestEngine:
+    """Class probabilities of a forest in sibling order, averaged over its trees."""
+
+    def __init__(self, feature, threshold, left, missing_left, value, roots, max_depth,
+                 block_cells=DEFAULT_BLOCK_CELLS):
+        self.feature = np.asarray(feature, dtype=np.int32)
+        self.threshold = float32_floor(np.asarray(threshold, dtype=np.float64))
+        self.left = np.asarray(left, dtype=np.int32)
+        self.missing_left = np.asarray(missing_left, dtype=bool)
+        self.value = value
+        self.roots = np.asarray(roots, dtype=np.int32)
+        self.max_depth = int(max_depth)
+        self.block_cells = block_cells
+        # Packed for the compiled kernel on its first batch
+        self._nodes = None
+
+    def _block_steps(self, block):
+        # Yield the (node, child) per (row, tree) of a block of float32 rows, one tree level at a time
+        n_rows = len(block)
+        # Feature-major copy, so the value of row r for feature f is at f * n_rows + r
+        values = np.ascontiguousarray(block.T).ravel()
+        feature_offsets = self.feature * np.int32(n_rows)
+        rows = np.repeat(np.arange(n_rows, dtype=np.int32)[:, np.newaxis], len(self.roots), axis=1)
+        node = np.repeat(self.roots[np.newaxis, :], n_rows, axis=0)
+        has_missing = np.isnan(values).any()
+        for _ in range(self.max_depth):
+            x = values[feature_offsets[node] + rows]
+            goes_right = x > self.threshold[node]
+            if has_missing:
+                goes_right |= np.isnan(x) & ~self.missing_left[node]
+            child = self.left[node] + goes_right
+            yield node, child
+            node = child
+
+    def _block_leaves(self, block):
+        # Leaf index per (row, tree) of a block of float32 rows
+        node = np.repeat(self.roots[np.newaxis, :], len(block), axis=0)
+        for _, node in self._block_steps(block):
+            pass
+        return node
+
+    def path_contributions(self, X, column, n_features):
+        """Per-feature contributions to the probability of class ``column`` for the rows of ``X``.
+
+        Every split a row passes through credits its feature with the change
+        in the class probability from the node to the child the row takes,
+        averaged over the trees (Saabas' path decomposition). Returns
+        ``(bias, contributions)``: the mean root probability and a
+        ``(rows, n_features)`` array, which add up to ``predict_proba``.
+        """
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        node_value = np.ascontiguousarray(self.value[:, column])
+        contributions = np.zeros((len(X), n_features))
+        block_rows = max(1, self.block_cells // len(self.roots))
+        for start in range(0, len(X), block_rows):
+            block = X[start:start + block_rows]
+            n_cells = len(block) * n_features
+            cell_offsets = np.arange(len(block))[:, np.newaxis] * n_features
+            totals = np.zeros(n_cells)
+            for node, child in self._block_steps(block):
+                # Leaves point to themselves, so rows already at a leaf add nothing
+                totals += np.bincount((cell_offsets + self.feature[node]).ravel(),
+                                      weights=(node_value[child] - node_value[node]).ravel(), minlength=n_cells)
+            contributions[start:start + len(block)] = totals.reshape(len(block), n_features)
+        contributions /= len(self.roots)
+        return float(node_value[self.roots].mean()), contributions
+
+    def predict_proba(self, X, backend=None):
+        """Probabilities for the rows of ``X``.
+
+        ``backend`` is ``"numpy"`` or ``"numba"``; by default large batches
+        use numba when it is installed.
+        """
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        kernel = None
+        if backend == NUMBA or (backend is None and len(X) >= COMPILED_MIN_ROWS):
+            kernel = compiled_kernel()
+            if kernel is None and backend == NUMBA:
+                raise ImportError("The compiled forest kernel needs numba (pip install numba)")
+
+        proba = np.zeros((len(X), self.value.shape[1]))
+        if kernel is not None:
+            if self._nodes is None:
+                self._nodes = kernel.pack_nodes(self.feature, self.threshold, self.left, self.missing_left)
+            kernel.forest_proba_sums(X, self._nodes, self.value, self.roots, proba)
+        else:
+            block_rows = max(1, self.block_cells // len(self.roots))
+            for start in range(0, len(X), block_rows):
+                node = self._block_leaves(X[start:start + block_rows])
+                # (rows, trees, classes) summed over the trees, one tree after another
+                proba[start:start + len(node)] = self.value[node].sum(axis=1)
+        proba /= len(self.roots)
+        return proba
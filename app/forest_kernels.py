@@ -0,0 +1,47 @@
+"""Compiled kernel for ``forest_engine`` (needs numba: ``pip install numba``).
+
+Imported only when a batch is large enough to use it, so the app never pays
+for importing numba or compiling the kernel on single-employee requests.
+The compiled code is cached next to this file after the first run.
+"""
+import numba
+import numpy as np
+
+# One record per node, so a step down the tree reads a single 16-byte record
+NODE_DTYPE = np.dtype([("threshold", np.float32), ("feature", np.int32), ("left", np.int32),
+                       ("missing_left", np.bool_)], align=True)
+
+
+def pack_nodes(feature, threshold, left, missing_left):
+    """The node arrays of ``ForestEngine`` as one ``NODE_DTYPE`` array."""
+    nodes = np.empty(len(feature), dtype=NODE_DTYPE)
+    nodes["threshold"] = threshold
+    nodes["feature"] = feature
+    nodes["left"] = left
+    nodes["missing_left"] = missing_left
+    return nodes
+
+
+@numba.njit(parallel=True, nogil=True, cache=True)
+def forest_proba_sums(X, nodes, value, roots, out):
+    """Add the leaf probabilities of every tree to ``out``, tree by tree, for each row of ``X``.
+
+    One tree at a time over all rows keeps that tree's nodes in cache.
+    """
+    n_classes = value.shape[1]
+    for root in roots:
+        for row in numba.prange(X.shape[0]):
+            node = root
+            while True:
+                record = nodes[node]
+                x = X[row, record.feature]
+                child = record.left
+                if not x <= record.threshold:
+                    if not (np.isnan(x) and record.missing_left):
+                        child += 1
+                # Leaves point to themselves
+                if child == node:
+                    break
+                node = child
+            for column in range(n_classes):
+                out[row, column] += value[node, column]
@@ -0,0 +1,116 @@
+"""Fixed-width binning and binned KDE for the distribution charts.
+
+``sns.histplot(..., kde=True)`` bins and runs a Gaussian KDE over every row
+on each render. ``BinGrid`` instead fixes a fine grid over a column's full
+range once per dataset version (``FINE_BINS_PER_BIN`` fine bins per display
+bin). ``AggregateCube`` keeps fine-bin counts per cube cell, so a filtered
+histogram is a roll-up of counts, and ``BinGrid.summarize`` turns those
+counts into:
+
+* display bins, merged from the fine bins that hold data, about as many as
+  ``histplot(bins=...)`` would draw over the filtered range;
+* a KDE evaluated on the fine-grid edges by FFT convolution with a Gaussian
+  kernel (Scott's bandwidth, like seaborn), clipped to the data range and
+  scaled to the bar counts.
+
+Besides the counts, each fine bin keeps the sum of its values' fractional
+positions inside the bin. That is enough for linear binning (each value's
+weight split between the two nearest grid edges), which keeps the KDE error
+second order in the fine-bin width even for integer-valued columns.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+FINE_BINS_PER_BIN = 16
+
+# Display bins per column, as passed to sns.histplot on the page
+HISTOGRAM_BINS = {
+    "Edad": 20,
+    "Salario Anual Actual 2020": 15,
+    "Antigüedad Años": 15,
+    "Evaluación Desempeño": 10,
+    "Horas de formación recibidas": 15,
+}
+
+# Kernel support, in bandwidths
+KERNEL_RADIUS = 4
+
+Histogram = namedtuple("Histogram", ["edges", "counts", "kde_x", "kde_y", "n"])
+
+
+def binned_kde(weights, bin_width, bandwidth):
+    """Gaussian KDE of weights on an evenly spaced grid, as a density at each grid point."""
+    radius = int(np.ceil(KERNEL_RADIUS * bandwidth / bin_width))
+    offsets = np.arange(-radius, radius + 1) * bin_width
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2)
+    kernel /= kernel.sum() * bin_width
+    size = len(weights) + len(kernel) - 1
+    n_fft = 1 << (size - 1).bit_length()
+    smoothed = np.fft.irfft(np.fft.rfft(weights, n_fft) * np.fft.rfft(kernel, n_fft), n_fft)
+    # Full convolution is shifted by the kernel radius
+    return np.clip(smoothed[radius:radius + len(weights)], 0, None) / weights.sum()
+
+
+class BinGrid:
+    """Fine fixed-width bins over the full range of one column."""
+
+    def __init__(self, values, bins, fine_factor=FINE_BINS_PER_BIN):
+        values = np.asarray(values, dtype=float)
+        finite = values[np.isfinite(values)]
+        self.low = float(finite.min()) if len(finite) else 0.0
+        high = float(finite.max()) if len(finite) else 1.0
+        self.bins = bins
+        self.n_fine = bins * fine_factor
+        self.width = (high - self.low) / self.n_fine if high > self.low else 1.0 / self.n_fine
+
+    def bin_index(self, values):
+        """Fine bin of each value (-1 for missing values) and its position inside the bin."""
+        values = np.asarray(values, dtype=float)
+        position = np.clip(np.nan_to_num((values - self.low) / self.width, nan=-1.0), -1, self.n_fine)
+        index = np.minimum(np.floor(position), self.n_fine - 1).astype(np.int64)
+        missing = ~np.isfinite(values)
+        index[missing] = -1
+        fraction = np.where(missing, 0.0, position - index)
+        return index, fraction
+
+    def counts(self, values):
+        """Fine-bin counts and sums of in-bin positions of ``values``."""
+        index, fraction = self.bin_index(values)
+        valid = index >= 0
+        return (np.bincount(index[valid], minlength=self.n_fine),
+                np.bincount(index[valid], weights=fraction[valid], minlength=self.n_fine))
+
+    def summarize(self, counts, fractions, bins=None):
+        """Display bins and KDE curve for fine-bin ``counts`` and position sums ``fractions``."""
+        bins = bins or self.bins
+        n = int(counts.sum())
+        if n == 0:
+            empty = np.array([])
+            return Histogram(np.array([self.low]), empty, empty, empty, 0)
+
+        occupied = np.flatnonzero(counts)
+        first, last = occupied[0], occupied[-1]
+        span = last - first + 1
+        per_bin = -(-span // bins)
+        n_bins = -(-span // per_bin)
+        display = np.zeros(n_bins * per_bin, dtype=counts.dtype)
+        display[:span] = counts[first:last + 1]
+        display_counts = display.reshape(n_bins, per_bin).sum(axis=1)
+        edges = self.low + (first + np.arange(n_bins + 1) * per_bin) * self.width
+
+        # Linear binning onto the edges first..last+1 of the occupied fine bins
+        weights = np.zeros(span + 1)
+        weights[:-1] += counts[first:last + 1] - fractions[first:last + 1]
+        weights[1:] += fractions[first:last + 1]
+        grid = self.low + np.arange(first, last + 2) * self.width
+
+        kde_x = kde_y = np.array([])
+        mean = np.dot(weights, grid) / n
+        std = np.sqrt(np.dot(weights, (grid - mean) ** 2) / max(n - 1, 1))
+        if n > 1 and std > 0:
+            bandwidth = std * n ** (-1 / 5)
+            density = binned_kde(weights, self.width, bandwidth)
+            kde_x = grid
+            kde_y = density * n * per_bin * self.width
+        return Histogram(edges, display_counts, kde_x, kde_y, n)
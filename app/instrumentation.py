@@ -0,0 +1,283 @@
+"""Optional timings and peak memory of the app's hot paths, per rerun.
+
+Off unless the ``PEOPLE_ANALYTICS_PROFILE`` environment variable is set
+(``1``, ``true`` or ``yes``, or ``timings`` to skip the memory tracing);
+while off, ``span`` and ``profiled`` cost a thread-local lookup. When on, ``app.py`` opens a ``RerunProfile`` at the top
+of every rerun and closes it at the end, and instrumented sections record
+into it::
+
+    with span("filter"):
+        filtered = filter_index.select(...)
+
+    @profiled("load_data")
+    @st.cache_data
+    def load_data(): ...
+
+Spans nest, and each records its wall time and the peak of the memory Python
+allocated while it ran (``tracemalloc``, above what was allocated when it
+started). Streamlit runs every session's script in its own thread, so the
+current profile is thread-local; ``tracemalloc`` is process-wide, though, so
+sessions rerunning at the same time see each other's allocations in their
+peaks. Tracing allocations also makes allocation-heavy code two to three
+times slower (``benchmarks/instrumentation_overhead.py``), which is why it
+is opt-in.
+
+Finished reruns are added to the process-wide ``registry`` and exported:
+
+* ``PEOPLE_ANALYTICS_PROFILE_LOG``: a file that gets one JSON line per rerun
+  (the same line is logged at INFO on this module's logger);
+* ``PEOPLE_ANALYTICS_PROFILE_METRICS``: a Prometheus text-format file of the
+  totals since startup, rewritten after every rerun (for node_exporter's
+  textfile collector, for instance).
+"""
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from collections import namedtuple
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import wraps
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ENABLE_VARIABLE = "PEOPLE_ANALYTICS_PROFILE"
+LOG_VARIABLE = "PEOPLE_ANALYTICS_PROFILE_LOG"
+METRICS_VARIABLE = "PEOPLE_ANALYTICS_PROFILE_METRICS"
+
+METRIC_PREFIX = "people_analytics"
+
+Span = namedtuple("Span", ["name", "depth", "seconds", "peak_bytes"])
+
+logger = logging.getLogger(__name__)
+
+# Profile of the rerun the current thread is executing
+_current = threading.local()
+
+
+def _mode():
+    return os.environ.get(ENABLE_VARIABLE, "").strip().lower()
+
+
+def enabled():
+    return _mode() in ("1", "true", "yes", "timings")
+
+
+class RerunProfile:
+    """Spans recorded during one rerun of one page, in the order they started."""
+
+    def __init__(self, page, trace_memory=True):
+        self.page = page
+        self.trace_memory = trace_memory
+        self.spans = []
+        self.seconds = None
+        self.interrupted = False
+        # Peaks seen so far by each open span, innermost last
+        self._stack = []
+        self._started = time.perf_counter()
+
+    def _memory(self):
+        return tracemalloc.get_traced_memory() if self.trace_memory and tracemalloc.is_tracing() else (0, 0)
+
+    @contextmanager
+    def span(self, name):
+        current, peak = self._memory()
+        if self._stack:
+            # The peak is reset for this span; keep what the enclosing span reached so far
+            self._stack[-1] = max(self._stack[-1], peak)
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        self._stack.append(current)
+        # The slot is taken now so that a span comes before the spans it encloses
+        index = len(self.spans)
+        self.spans.append(None)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            _, peak = self._memory()
+            peak = max(self._stack.pop(), peak)
+            if self._stack:
+                self._stack[-1] = max(self._stack[-1], peak)
+            self.spans[index] = Span(name, len(self._stack), seconds, max(0, peak - current))
+
+    def finish(self, interrupted=False):
+        self.seconds = time.perf_counter() - self._started
+        self.interrupted = interrupted
+
+    def record(self):
+        """The rerun as a JSON-serializable dict."""
+        return {
+            "time": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            "page": self.page,
+            "seconds": round(self.seconds, 6) if self.seconds is not None else None,
+            "interrupted": self.interrupted,
+            "max_rss_bytes": max_rss_bytes(),
+            "spans": [{"name": span.name, "depth": span.depth, "seconds": round(span.seconds, 6),
+                       "peak_bytes": span.peak_bytes} for span in self.spans],
+        }
+
+
+def max_rss_bytes():
+    """Peak resident memory of the process, or ``None`` where it is not available."""
+    if resource is None:
+        return None
+    # Kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class MetricsRegistry:
+    """Totals per span and per page over every finished rerun of the process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            # name → [count, total seconds, max seconds, max peak bytes]
+            self.spans = {}
+            # page → [count, total seconds, interrupted count]
+            self.pages = {}
+
+    def add(self, profile):
+        with self._lock:
+            for span in profile.spans:
+                totals = self.spans.setdefault(span.name, [0, 0.0, 0.0, 0])
+                totals[0] += 1
+                totals[1] += span.seconds
+                totals[2] = max(totals[2], span.seconds)
+                totals[3] = max(totals[3], span.peak_bytes)
+            totals = self.pages.setdefault(profile.page, [0, 0.0, 0])
+            totals[0] += 1
+            totals[1] += profile.seconds
+            totals[2] += profile.interrupted
+
+    def span_rows(self):
+        with self._lock:
+            return [{"Section": name, "Calls": count, "Total ms": round(total * 1e3, 1),
+                     "Mean ms": round(total / count * 1e3, 1), "Max ms": round(longest * 1e3, 1),
+                     "Max peak MiB": round(peak / 2 ** 20, 2)}
+                    for name, (count, total, longest, peak) in sorted(self.spans.items())]
+
+    def prometheus_text(self):
+        """The totals in the Prometheus text exposition format."""
+        with self._lock:
+            spans = sorted(self.spans.items())
+            pages = sorted(self.pages.items())
+        lines = [
+            f"# HELP {METRIC_PREFIX}_span_seconds Time spent in instrumented sections of the app.",
+            f"# TYPE {METRIC_PREFIX}_span_seconds summary",
+        ]
+        for name, (count, total, _, _) in spans:
+            lines.append(f'{METRIC_PREFIX}_span_seconds_sum{{span="{_label(name)}"}} {total:.6f}')
+            lines.append(f'{METRIC_PREFIX}_span_seconds_count{{span="{_label(name)}"}} {count}')
+        lines += [
+            f"# HELP {METRIC_PREFIX}_span_max_seconds Longest run of an instrumented section.",
+            f"# TYPE {METRIC_PREFIX}_span_max_seconds gauge",
+        ]
+        lines += [f'{METRIC_PREFIX}_span_max_seconds{{span="{_label(name)}"}} {longest:.6f}'
+                  for name, (_, _, longest, _) in spans]
+        lines += [
+            f"# HELP {METRIC_PREFIX}_span_peak_bytes Largest Python allocation peak of an instrumented section.",
+            f"# TYPE {METRIC_PREFIX}_span_peak_bytes gauge",
+        ]
+        lines += [f'{METRIC_PREFIX}_span_peak_bytes{{span="{_label(name)}"}} {peak}' for name, (_, _, _, peak) in spans]
+        lines += [
+            f"# HELP {METRIC_PREFIX}_rerun_seconds Time of whole script reruns per page.",
+            f"# TYPE {METRIC_PREFIX}_rerun_seconds summary",
+        ]
+        for page, (count, total, _) in pages:
+            lines.append(f'{METRIC_PREFIX}_rerun_seconds_sum{{page="{_label(page)}"}} {total:.6f}')
+            lines.append(f'{METRIC_PREFIX}_rerun_seconds_count{{page="{_label(page)}"}} {count}')
+        lines += [
+            f"# HELP {METRIC_PREFIX}_reruns_interrupted_total Reruns cut short by st.rerun or an error.",
+            f"# TYPE {METRIC_PREFIX}_reruns_interrupted_total counter",
+        ]
+        lines += [f'{METRIC_PREFIX}_reruns_interrupted_total{{page="{_label(page)}"}} {interrupted}'
+                  for page, (_, _, interrupted) in pages]
+        rss = max_rss_bytes()
+        if rss is not None:
+            lines += [
+                f"# HELP {METRIC_PREFIX}_max_rss_bytes Peak resident memory of the app process.",
+                f"# TYPE {METRIC_PREFIX}_max_rss_bytes gauge",
+                f"{METRIC_PREFIX}_max_rss_bytes {rss}",
+            ]
+        return "\n".join(lines) + "\n"
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+registry = MetricsRegistry()
+
+
+def start_rerun(page, trace_memory=None):
+    """Open the profile of this thread's rerun of ``page``; ``None`` when profiling is off.
+
+    Peak memory is traced unless ``trace_memory`` is false or, by default,
+    profiling is set to ``timings``.
+    """
+    if not enabled():
+        _current.profile = None
+        return None
+    if trace_memory is None:
+        trace_memory = _mode() != "timings"
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    profile = _current.profile = RerunProfile(page, trace_memory)
+    return profile
+
+
+def finish_rerun(profile, interrupted=False):
+    """Close ``profile``, add it to ``registry`` and write the exports that are configured."""
+    _current.profile = None
+    if profile is None:
+        return
+    profile.finish(interrupted)
+    registry.add(profile)
+    line = json.dumps(profile.record(), ensure_ascii=False)
+    logger.info(line)
+    log_path = os.environ.get(LOG_VARIABLE)
+    if log_path:
+        with open(log_path, "a", encoding="utf-8") as handle:
+            handle.write(line + "\n")
+    metrics_path = os.environ.get(METRICS_VARIABLE)
+    if metrics_path:
+        write_prometheus(metrics_path)
+
+
+def write_prometheus(path):
+    from data_cache import atomic_write
+
+    with atomic_write(path) as temporary, open(temporary, "w", encoding="utf-8") as handle:
+        handle.write(registry.prometheus_text())
+
+
+@contextmanager
+def span(name):
+    """Record the enclosed block as ``name`` in the current rerun's profile, if any."""
+    profile = getattr(_current, "profile", None)
+    if profile is None:
+        yield
+        return
+    with profile.span(name):
+        yield
+
+
+def profiled(name):
+    """Decorator recording every call of a function (cache hits included) as ``name``."""
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
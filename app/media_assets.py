@@ -0,0 +1,106 @@
+"""Resized WebP variants of the app's images.
+
+The PNG screenshots in ``app/`` are far larger than the places they are
+shown: the sidebar image alone is a 2.6 MB 1024x1536 PNG rendered about 300
+pixels wide on every page. ``variant`` encodes an image once per width as a
+WebP file in ``.media/`` next to it and returns the variant's path; the
+variant's name carries the size and mtime of the source, so it is rebuilt
+when the source changes and stale variants are removed.
+
+Streamlit serves media at content-hashed ``/media/`` URLs, so identical
+bytes keep the same URL in every session: the app hands ``st.image`` the
+bytes of ``variant_or_source``'s file, read once per process, and browsers (or a proxy
+in front of the app) can cache those URLs for as long as they like.
+
+Build every variant ahead of time with::
+
+    python app/media_assets.py
+"""
+import os
+import sys
+
+from PIL import Image
+
+MEDIA_DIR = ".media"
+WEBP_QUALITY = 80
+
+# Widths in CSS pixels times two for high-density screens
+SIDEBAR_WIDTH = 480
+THUMBNAIL_WIDTH = 800
+DISPLAY_WIDTH = 1600
+
+# Images of the app and the widths it shows them at
+APP_IMAGES = {
+    "funko.png": [SIDEBAR_WIDTH],
+    "dashboard.png": [DISPLAY_WIDTH],
+    "general_analysis.png": [THUMBNAIL_WIDTH, DISPLAY_WIDTH],
+    "labor_analysis.png": [THUMBNAIL_WIDTH, DISPLAY_WIDTH],
+    "summary.png": [THUMBNAIL_WIDTH, DISPLAY_WIDTH],
+}
+
+
+def _variant_prefix(source, width):
+    return f"{os.path.splitext(os.path.basename(source))[0]}-{width}w-"
+
+
+def variant_path_for(source, width):
+    stat = os.stat(source)
+    name = f"{_variant_prefix(source, width)}{stat.st_size:x}-{stat.st_mtime_ns:x}.webp"
+    return os.path.join(os.path.dirname(os.path.abspath(source)), MEDIA_DIR, name)
+
+
+def build_variant(source, width, path):
+    """Write ``source`` scaled down to at most ``width`` pixels wide as a WebP file at ``path``."""
+    # Imported here: data_cache brings pandas and pyarrow, which the app shell does not need
+    from data_cache import atomic_write
+
+    with Image.open(source) as image:
+        image.load()
+        if image.width > width:
+            image = image.resize((width, round(image.height * width / image.width)), Image.Resampling.LANCZOS)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+        with atomic_write(path) as temporary:
+            image.save(temporary, "WEBP", quality=WEBP_QUALITY, method=6)
+
+
+def variant(source, width):
+    """Path of the WebP variant of ``source`` at ``width``, built when missing or stale."""
+    path = variant_path_for(source, width)
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        build_variant(source, width, path)
+        # Variants of older versions of the source
+        prefix = _variant_prefix(source, width)
+        for name in os.listdir(os.path.dirname(path)):
+            if name.startswith(prefix) and name.endswith(".webp") and name != os.path.basename(path):
+                os.remove(os.path.join(os.path.dirname(path), name))
+    return path
+
+
+def variant_or_source(source, width):
+    """``variant(source, width)``, or ``source`` itself when the variant cannot be written.
+
+    A read-only deployment, for instance, serves the original images rather
+    than failing the page.
+    """
+    try:
+        return variant(source, width)
+    except OSError:
+        return source
+
+
+def build_all(directory):
+    """Build the variants of ``APP_IMAGES`` in ``directory``; returns (source, width, source bytes, variant bytes)."""
+    built = []
+    for name, widths in APP_IMAGES.items():
+        source = os.path.join(directory, name)
+        for width in widths:
+            built.append((name, width, os.path.getsize(source), os.path.getsize(variant(source, width))))
+    return built
+
+
+if __name__ == "__main__":
+    directory = sys.argv[1] if len(sys.argv) > 1 else os.path.dirname(os.path.abspath(__file__))
+    for name, width, source_size, variant_size in build_all(directory):
+        print(f"{name} @ {width}px: {source_size / 1024:,.0f} KiB -> {variant_size / 1024:,.0f} KiB")
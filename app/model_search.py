@@ -0,0 +1,262 @@
+"""Successive-halving hyperparameter search for the turnover models.
+
+``machine_learning.ipynb`` compares three fixed configurations and keeps the
+one with the best cross-validated F1. ``search`` samples RandomForest and
+GradientBoosting hyperparameters instead (the notebook's settings are always
+the first candidate of each model) and runs successive halving over them,
+with the ensemble size as the budget: every round scores the surviving
+candidates on the 5 CV folds with a share of their trees (boosting stops
+early), keeps the best third and gives the next round three times more
+trees, until the last round fits the full candidates. Fitting a tree costs
+about the same on a few dozen rows as on the whole of ``data_cleaned.csv``,
+so trees rather than rows are what the search saves.
+
+The notebook's preparation (feature selection, split, scaling, SMOTE) is
+cached on disk as ``.npy`` files next to the data (``data_cleaned.folds/``),
+keyed by the data's SHA-256 and the preparation settings, so repeated
+searches skip it. The pool workers (set up as in ``training``) memory-map the cached
+matrices instead of receiving copies.
+
+The winner is refitted on the whole training split and saved as the usual
+``modelo_rotacion_externa_*.pkl`` model package.
+
+Run it with::
+
+    python app/model_search.py notebook/data_cleaned.csv --output models
+"""
+import argparse
+import hashlib
+import json
+import math
+import os
+import shutil
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from data_cache import atomic_write, file_hash
+from training import (CV_FOLDS, N_FEATURES, RANDOM_STATE, TEST_SIZE, PreparedData, TrainingResult, cv_folds,
+                      default_workers, make_model, prepare_data, report_saved, save_model_package)
+
+# Bump when the cached preparation changes, so old fold caches are rebuilt
+FOLD_CACHE_VERSION = "1"
+FOLD_CACHE_EXTENSION = ".folds"
+
+DEFAULT_CANDIDATES = 24
+HALVING_FACTOR = 3
+MIN_ESTIMATORS = 10
+
+SEARCH_SPACES = {
+    "Random Forest": {
+        "n_estimators": [100, 200, 400],
+        "max_depth": [None, 4, 8, 16],
+        "min_samples_leaf": [1, 2, 4, 8],
+        "max_features": ["sqrt", "log2", None],
+        "class_weight": ["balanced", "balanced_subsample", None],
+    },
+    "Gradient Boosting": {
+        "n_estimators": [50, 100, 200, 400],
+        "learning_rate": [0.03, 0.1, 0.3],
+        "max_depth": [2, 3, 4, 5],
+        "subsample": [0.6, 0.8, 1.0],
+        "min_samples_leaf": [1, 5, 10],
+    },
+}
+
+Candidate = namedtuple("Candidate", ["name", "params"])
+HalvingRound = namedtuple("HalvingRound", ["fraction", "scores"])
+SearchResult = namedtuple("SearchResult", ["candidate", "f1_cv", "f1_cv_std", "rounds"])
+
+
+def fold_cache_dir(data_path):
+    return os.path.splitext(data_path)[0] + FOLD_CACHE_EXTENSION
+
+
+def _fold_cache_key(data_path):
+    from importlib.metadata import version
+
+    settings = [FOLD_CACHE_VERSION, file_hash(data_path), N_FEATURES, TEST_SIZE, CV_FOLDS, RANDOM_STATE,
+                version("scikit-learn"), version("imbalanced-learn")]
+    return hashlib.sha256(json.dumps(settings).encode()).hexdigest()[:16]
+
+
+def ensure_fold_cache(data_path, cache_dir=None, n_jobs=None):
+    """Return ``(path, built)`` of the prepared folds of ``data_path``, preparing them if needed."""
+    cache_dir = cache_dir or fold_cache_dir(data_path)
+    path = os.path.join(cache_dir, _fold_cache_key(data_path))
+    if os.path.exists(os.path.join(path, "features.json")):
+        return path, False
+
+    prepared = prepare_data(pd.read_csv(data_path), n_jobs=n_jobs)
+    fold_of_row = np.empty(len(prepared.y_train), dtype=np.int8)
+    for fold, (_, test) in enumerate(cv_folds(prepared.y_train)):
+        fold_of_row[test] = fold
+
+    import joblib
+
+    os.makedirs(cache_dir, exist_ok=True)
+    try:
+        with atomic_write(path) as tmp_path:
+            os.makedirs(tmp_path)
+            for name in ("X_train", "y_train", "X_test", "y_test"):
+                np.save(os.path.join(tmp_path, f"{name}.npy"), np.ascontiguousarray(getattr(prepared, name)))
+            np.save(os.path.join(tmp_path, "folds.npy"), fold_of_row)
+            joblib.dump(prepared.scaler, os.path.join(tmp_path, "scaler.pkl"))
+            with open(os.path.join(tmp_path, "features.json"), "w", encoding="utf-8") as handle:
+                json.dump(prepared.features, handle, ensure_ascii=False)
+
+            # Caches of older data or settings are never read again; temporary directories
+            # belong to searches still writing theirs
+            for entry in os.listdir(cache_dir):
+                if not entry.endswith(".tmp") and entry != os.path.basename(path):
+                    shutil.rmtree(os.path.join(cache_dir, entry), ignore_errors=True)
+    except OSError:
+        # Another search prepared the same folds meanwhile, so the move failed
+        if not os.path.exists(os.path.join(path, "features.json")):
+            raise
+    return path, True
+
+
+def load_fold_cache(path):
+    """``(PreparedData, folds)`` with the matrices memory-mapped from ``path``."""
+    import joblib
+
+    arrays = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r")
+              for name in ("X_train", "y_train", "X_test", "y_test")}
+    with open(os.path.join(path, "features.json"), encoding="utf-8") as handle:
+        features = json.load(handle)
+    prepared = PreparedData(features, joblib.load(os.path.join(path, "scaler.pkl")), **arrays)
+    fold_of_row = np.load(os.path.join(path, "folds.npy"))
+    folds = [(np.flatnonzero(fold_of_row != fold), np.flatnonzero(fold_of_row == fold)) for fold in range(CV_FOLDS)]
+    return prepared, folds
+
+
+def sample_candidates(n_per_model=DEFAULT_CANDIDATES, random_state=RANDOM_STATE):
+    """The notebook's configuration plus ``n_per_model - 1`` sampled ones per model."""
+    from sklearn.model_selection import ParameterSampler
+
+    candidates = []
+    for name, space in SEARCH_SPACES.items():
+        candidates.append(Candidate(name, {}))
+        sampled = ParameterSampler(space, n_iter=n_per_model - 1, random_state=random_state)
+        candidates.extend(Candidate(name, params) for params in sampled)
+    return candidates
+
+
+def halving_fractions(n_candidates, factor=HALVING_FACTOR):
+    """Share of the candidates' trees fitted in every round, ending at 1."""
+    n_rounds = 1
+    while n_candidates > factor ** n_rounds:
+        n_rounds += 1
+    return [factor ** -(n_rounds - 1 - index) for index in range(n_rounds)]
+
+
+# Prepared folds of the current process, memory-mapped once per worker by _init_worker
+_DATA = None
+
+
+def _init_worker(cache_path, single_thread=True):
+    global _DATA
+    _DATA = load_fold_cache(cache_path)
+    if single_thread:
+        from threadpoolctl import threadpool_limits
+
+        threadpool_limits(1)
+
+
+def _score_candidate(index, candidate, fold, fraction, min_estimators):
+    from sklearn.metrics import f1_score
+
+    prepared, folds = _DATA
+    train, test = folds[fold]
+    model = make_model(candidate.name, **candidate.params)
+    n_estimators = min(model.n_estimators, max(min_estimators, round(fraction * model.n_estimators)))
+    model.set_params(n_estimators=n_estimators)
+    model.fit(prepared.X_train[train], prepared.y_train[train])
+    return index, fold, f1_score(prepared.y_train[test], model.predict(prepared.X_train[test]))
+
+
+def search(cache_path, candidates=None, workers=None, factor=HALVING_FACTOR, min_estimators=MIN_ESTIMATORS):
+    """Successive halving over ``candidates`` on the prepared folds at ``cache_path``.
+
+    Returns the ``SearchResult`` of the winner, with the mean and standard
+    deviation of the CV F1 of every candidate in every round. ``workers`` is as in ``training.train_models``.
+    """
+    candidates = candidates if candidates is not None else sample_candidates()
+    alive = list(range(len(candidates)))
+    rounds = []
+    workers = workers or default_workers()
+    pool = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(cache_path,)) if workers > 1 else None
+    if pool is None:
+        _init_worker(cache_path, single_thread=False)
+    try:
+        for fraction in halving_fractions(len(candidates), factor):
+            jobs = [(index, candidates[index], fold, fraction, min_estimators)
+                    for index in alive for fold in range(CV_FOLDS)]
+            if pool is None:
+                outputs = [_score_candidate(*job) for job in jobs]
+            else:
+                outputs = [future.result() for future in [pool.submit(_score_candidate, *job) for job in jobs]]
+            fold_scores = {index: [0.0] * CV_FOLDS for index in alive}
+            for index, fold, score in outputs:
+                fold_scores[index][fold] = score
+            scores = {index: (np.mean(values), np.std(values)) for index, values in fold_scores.items()}
+            rounds.append(HalvingRound(fraction, scores))
+            # Ties go to the earlier candidate, so the notebook's settings win them
+            alive = sorted(alive, key=lambda index: (-scores[index][0], index))[:max(1, math.ceil(len(alive) / factor))]
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    winner = alive[0]
+    return SearchResult(candidates[winner], *rounds[-1].scores[winner], rounds)
+
+
+def refit(cache_path, result):
+    """Fit the winner on the whole training split; return its ``TrainingResult``."""
+    from sklearn.metrics import roc_auc_score
+
+    prepared, _ = load_fold_cache(cache_path)
+    model = make_model(result.candidate.name, **result.candidate.params)
+    model.fit(prepared.X_train, prepared.y_train)
+    accuracy = (model.predict(prepared.X_test) == prepared.y_test).mean()
+    auc = roc_auc_score(prepared.y_test, model.predict_proba(prepared.X_test)[:, 1])
+    return TrainingResult(result.candidate.name, model, accuracy, auc, result.f1_cv, result.f1_cv_std)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search turnover model hyperparameters with successive halving.")
+    parser.add_argument("data", nargs="?", default=os.path.join("notebook", "data_cleaned.csv"))
+    parser.add_argument("--output", default=".", help="directory for the model package")
+    parser.add_argument("--workers", type=int, help="search processes (default: usable cores)")
+    parser.add_argument("--candidates", type=int, default=DEFAULT_CANDIDATES, help="configurations per model")
+    parser.add_argument("--factor", type=int, default=HALVING_FACTOR)
+    parser.add_argument("--seed", type=int, default=RANDOM_STATE)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    cache_path, built = ensure_fold_cache(args.data, n_jobs=args.workers or default_workers())
+    print(f"Folds {'prepared' if built else 'loaded from'} {cache_path} in {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    candidates = sample_candidates(args.candidates, args.seed)
+    result = search(cache_path, candidates, workers=args.workers, factor=args.factor)
+    for halving_round in result.rounds:
+        best = max(halving_round.scores.values())[0]
+        print(f"{len(halving_round.scores)} candidates with {halving_round.fraction:.0%} of their trees: "
+              f"best F1 {best:.3f}")
+    print(f"Searched {len(candidates)} candidates in {time.perf_counter() - start:.1f}s")
+
+    trained = refit(cache_path, result)
+    print(f"The best model is {trained.name} {result.candidate.params or '(notebook settings)'}: "
+          f"accuracy {trained.accuracy:.3f}, AUC {trained.auc:.3f}, "
+          f"F1 (CV) {trained.f1_cv:.3f} ± {trained.f1_cv_std:.3f}")
+    prepared, _ = load_fold_cache(cache_path)
+    report_saved(save_model_package(prepared, trained, args.output))
+
+
+if __name__ == "__main__":
+    main()
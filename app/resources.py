@@ -0,0 +1,162 @@
+"""Data, models and media shared by the app's pages, cached once per process.
+
+``app.py`` and the modules of ``views`` import these instead of each
+building its own, so every page and session shares the same cached dataset
+store, inference session, monitors and media bytes. The data and model
+modules (and pandas with them) are imported by the functions that use them,
+so the app shell and the static pages start without them.
+"""
+import os
+from collections import namedtuple
+
+import streamlit as st
+
+from instrumentation import profiled
+
+# Obtener la ruta absoluta del directorio actual
+current_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Construir las rutas absolutas de las imágenes
+principal_image_path = os.path.join(current_dir, 'banner.png')
+menu_image_path = os.path.join(current_dir, 'funko.png')
+dashboard_image_path = os.path.join(current_dir, 'dashboard.png')
+general_analysis_image_path = os.path.join(current_dir, 'general_analysis.png')
+labor_analysis_image_path = os.path.join(current_dir, 'labor_analysis.png')
+summary_image_path = os.path.join(current_dir, 'summary.png')
+clip_video_path = os.path.join(current_dir, 'clip.mp4')
+
+Dataset = namedtuple("Dataset", ["store", "df", "filter_index", "aggregate_cube"])
+
+# Load data
+@profiled("load_data")
+@st.cache_data
+def load_data():
+    from data_cache import load_cleaned_data
+
+    # Path to your CSV file
+    data_path = os.path.join('notebook', 'data_cleaned.csv')
+    if os.path.exists(data_path):
+        # Reads the typed columnar cache, rebuilding it when the CSV changes
+        data = load_cleaned_data(data_path)
+        return data
+    else:
+        st.error(f"Data file not found at {data_path}")
+        return None
+    
+
+# Load model
+@profiled("load_model")
+@st.cache_resource
+def load_model():
+    from forest_artifact import load_model_package
+
+    try:
+        # Try multiple possible locations for the model file
+        possible_paths = [
+            os.path.join(current_dir, 'modelo_rotacion_externa_random_forest.pkl'),  # Same directory as app.py
+            os.path.join(current_dir, 'models', 'modelo_rotacion_externa_random_forest.pkl'),  # models subfolder
+            os.path.join('models', 'modelo_rotacion_externa_random_forest.pkl'),  # models folder (relative)
+            os.path.join('..', 'modelo_rotacion_externa_random_forest.pkl'),  # Parent directory
+            os.path.join('..', 'models', 'modelo_rotacion_externa_random_forest.pkl'),  # models in parent dir
+            os.path.join('notebook', 'modelo_rotacion_externa_random_forest.pkl')  # notebook directory
+        ]
+        
+        # Try each path until we find the file
+        for path in possible_paths:
+            if os.path.exists(path):
+                st.success(f"Model found at: {path}")
+                
+                # Memory-maps the flat forest export, writing it next to the pickle when stale
+                model = load_model_package(path)
+                return model
+        
+        # If we get here, no file was found
+        st.error("Model file not found in any of the expected locations")
+        return None
+    except Exception as e:
+        st.error(f"Error loading model: {e}")
+        return None
+
+# Shared inference session for the saved RandomForest (built once per process)
+@st.cache_resource
+def get_inference_session():
+    from turnover_model import InferenceSession
+
+    package = load_model()
+    reference = load_data()
+    if package is None or reference is None:
+        return None
+    try:
+        return InferenceSession(package, reference)
+    except ValueError as e:
+        st.error(f"Model package is not compatible with the data: {e}")
+        return None
+
+# RandomForest feature attributions, cached per employee ID for every session
+@st.cache_resource
+def get_attribution_cache():
+    from attributions import AttributionCache
+
+    session = get_inference_session()
+    if session is None:
+        return None
+    try:
+        return AttributionCache(session)
+    except ValueError:
+        # Only forests can be explained
+        return None
+
+# Rule engine baseline of the current dataset version for the what-if simulator
+@st.cache_resource(max_entries=1)
+def get_what_if_simulator(version, _data):
+    from what_if import WhatIfSimulator
+
+    return WhatIfSimulator(_data)
+
+# Monte Carlo forecast of the current dataset version, reused until a setting changes
+@st.cache_data(max_entries=16, show_spinner=False)
+def run_forecast(version, engine, months, runs, seed, _data):
+    from forecast import forecast_inputs, rule_engine_probabilities, simulate
+
+    if engine == "RandomForest model":
+        probabilities = get_inference_session().predict_proba(_data)
+    else:
+        probabilities = rule_engine_probabilities(_data)
+    return simulate(forecast_inputs(_data, probabilities, months), runs, seed)
+
+# Drift of the model features and risk score over the scored batches, shared by every session
+@st.cache_resource
+def get_drift_monitor():
+    from drift_monitor import monitor_for_session
+
+    session = get_inference_session()
+    reference = load_data()
+    if session is None or reference is None:
+        return None
+    return monitor_for_session(session, reference)
+
+# Dataset shared by every session, with its filter index and aggregation cube,
+# refreshed in place from changed HR records (replays the change journal on startup)
+@profiled("get_dataset_store")
+@st.cache_resource
+def get_dataset_store():
+    from dataset_store import DatasetStore, journal_path_for
+
+    data = load_data()
+    if data is None:
+        return None
+    return DatasetStore(data, journal_path=journal_path_for(os.path.join('notebook', 'data_cleaned.csv')))
+
+# Bytes of a media file (an image variant or the demo video), read once per process so every
+# session sends the same bytes and gets the same content-hashed /media URL
+@st.cache_resource(max_entries=32, show_spinner=False)
+def read_media(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+# Current version of the shared dataset, with its filter index and aggregation cube
+def current_dataset():
+    store = get_dataset_store()
+    if store is None:
+        return Dataset(None, None, None, None)
+    return Dataset(store, *store.snapshot())
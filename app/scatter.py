@@ -0,0 +1,95 @@
+"""Down-sampling and density summaries for the scatter charts.
+
+Drawing one marker per employee is fine for a few thousand rows but not for
+a million. ``prepare_scatter`` keeps every point up to a row limit and above
+it switches to either:
+
+* a stratified sample of ``limit`` rows that keeps the share of each hue
+  group (largest-remainder allocation, fixed seed so reruns draw the same
+  points and the chart cache keeps hitting), or
+* a 2D histogram of the rows, drawn as a density heatmap.
+"""
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+SCATTER_POINT_LIMIT = 5_000
+DENSITY_BINS = 60
+SAMPLE_SEED = 42
+
+SAMPLE_MODE = "Stratified sample"
+DENSITY_MODE = "Density"
+SCATTER_MODES = [SAMPLE_MODE, DENSITY_MODE]
+
+Density = namedtuple("Density", ["x_edges", "y_edges", "counts", "n"])
+ScatterPlan = namedtuple("ScatterPlan", ["kind", "data", "message"])
+
+
+def _allocate(group_sizes, n):
+    """Split ``n`` draws across groups proportionally (largest remainder)."""
+    quotas = group_sizes / group_sizes.sum() * n
+    allocation = np.floor(quotas).astype(np.int64)
+    remainder = n - allocation.sum()
+    if remainder:
+        allocation[np.argsort(allocation - quotas, kind="stable")[:remainder]] += 1
+    return np.minimum(allocation, group_sizes)
+
+
+def stratified_sample(data, n, hue=None, seed=SAMPLE_SEED):
+    """``n`` rows of ``data`` keeping the proportions of each ``hue`` group."""
+    if len(data) <= n:
+        return data
+    rng = np.random.default_rng(seed)
+    if hue is None:
+        rows = rng.choice(len(data), size=n, replace=False)
+    else:
+        codes, _ = pd.factorize(data[hue], use_na_sentinel=False)
+        order = np.argsort(codes, kind="stable")
+        group_sizes = np.bincount(codes)
+        starts = np.concatenate([[0], np.cumsum(group_sizes)[:-1]])
+        rows = np.concatenate([
+            order[start + rng.choice(size, size=draws, replace=False)]
+            for start, size, draws in zip(starts, group_sizes, _allocate(group_sizes, n))
+        ])
+    return data.take(np.sort(rows))
+
+
+def density_grid(data, x, y, bins=DENSITY_BINS):
+    """2D histogram of two columns over their filtered range."""
+    points = data[[x, y]].dropna()
+    x_values = points[x].to_numpy(dtype=float)
+    y_values = points[y].to_numpy(dtype=float)
+    counts, x_edges, y_edges = np.histogram2d(x_values, y_values, bins=bins)
+    return Density(x_edges, y_edges, counts.astype(np.int64), len(points))
+
+
+def linear_fit(data, x, y):
+    """Least-squares (slope, intercept) of ``y`` on ``x``, or None when undefined."""
+    points = data[[x, y]].dropna()
+    if len(points) < 2 or points[x].nunique() < 2:
+        return None
+    slope, intercept = np.polyfit(points[x].to_numpy(dtype=float), points[y].to_numpy(dtype=float), 1)
+    return slope, intercept
+
+
+def prepare_scatter(data, x, y, hue=None, limit=SCATTER_POINT_LIMIT, mode=SAMPLE_MODE):
+    """Pick how to draw a scatter of ``data`` and say so.
+
+    Returns a ``ScatterPlan`` whose ``kind`` is ``"points"`` (``data`` as
+    is), ``"sample"`` (a stratified sample) or ``"density"`` (a ``Density``).
+    """
+    n = len(data)
+    if n <= limit:
+        return ScatterPlan("points", data, f"Showing all {n:,} employees.")
+    if mode == DENSITY_MODE:
+        return ScatterPlan(
+            "density", density_grid(data, x, y),
+            f"{n:,} employees is above the {limit:,}-point limit: showing their density "
+            f"({DENSITY_BINS}×{DENSITY_BINS} grid) instead of individual points."
+        )
+    kept = f", keeping the share of each {hue} group" if hue else ""
+    return ScatterPlan(
+        "sample", stratified_sample(data, limit, hue),
+        f"{n:,} employees is above the {limit:,}-point limit: showing a random sample of {limit:,}{kept}."
+    )
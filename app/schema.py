@@ -0,0 +1,119 @@
+"""Declared dtypes for the cleaned employee dataset.
+
+``pd.read_csv`` leaves every text column as ``object``/``str`` and every
+number as int64/float64. ``EMPLOYEE_SCHEMA`` declares a compact dtype for
+each column of ``data_cleaned.csv`` and ``apply_schema`` enforces it.
+
+The tenure columns stay float64: the rule engine and the RandomForest both
+branch on their exact values, so downcasting them would change predictions.
+
+Print the memory saved per column with::
+
+    python app/schema.py notebook/data_cleaned.csv
+"""
+import os
+import sys
+import warnings
+
+import numpy as np
+import pandas as pd
+
+DATETIME_DTYPE = "datetime64[ns]"
+
+EMPLOYEE_SCHEMA = {
+    "ID Empleado": "int32",
+    "Año de Nacimiento": DATETIME_DTYPE,
+    "Edad": "int8",
+    "Sexo": "category",
+    "Sexo Num": "int8",
+    "Fecha Inicio de Contrato": DATETIME_DTYPE,
+    "Fecha Hoy": DATETIME_DTYPE,
+    "Antigüedad Meses": "float64",
+    "Antigüedad Años": "float64",
+    "Formación Oficial Reglada": "category",
+    "Formación Oficial Num": "int8",
+    "ESTADO CIVIL": "category",
+    "HIJOS": "float32",
+    "% MINUSVALÍA": "category",
+    "Categoría laboral": "category",
+    "Cat Lab num": "int8",
+    "Horas Jornada": "float32",
+    "FTE": "float32",
+    "Días de Trabajo Perdido (Abs)": "int16",
+    "Departamento": "category",
+    "Departamento Num": "int8",
+    "Rotación Externa": "int8",
+    "Rotación Interna": "int8",
+    "Salario Anual Inicial 2020": "int32",
+    "Salario Anual Actual 2020": "int32",
+    "Diferencia Salario": "int32",
+    "Experiencia previa (meses)": "int16",
+    "Horas de formación recibidas": "int16",
+    "Neglicencias/Sanciones": "int8",
+    "Nuevas contrataciones 2020": "int8",
+    "NPS": "int8",
+    "Evaluación Desempeño": "int8",
+}
+
+CATEGORICAL_COLUMNS = [column for column, dtype in EMPLOYEE_SCHEMA.items() if dtype == "category"]
+DATE_COLUMNS = [column for column, dtype in EMPLOYEE_SCHEMA.items() if dtype == DATETIME_DTYPE]
+
+
+def _cast(series, dtype):
+    if dtype == DATETIME_DTYPE:
+        return pd.to_datetime(series, errors="coerce").astype(DATETIME_DTYPE)
+
+    if dtype == "category":
+        return series.astype("category")
+
+    if np.issubdtype(np.dtype(dtype), np.integer):
+        limits = np.iinfo(dtype)
+        values = series.to_numpy()
+        # Only downcast whole numbers that fit; anything else keeps its dtype
+        if series.isna().any() or not np.array_equal(values, np.round(values)):
+            raise ValueError("non-integer values")
+        if len(series) and (values.min() < limits.min or values.max() > limits.max):
+            raise ValueError(f"values outside the {dtype} range")
+
+    return series.astype(dtype)
+
+
+def apply_schema(data, schema=EMPLOYEE_SCHEMA):
+    """Return ``data`` with every column listed in ``schema`` cast to its dtype.
+
+    Columns that are not in the schema are left untouched. A column whose
+    values do not fit the declared dtype keeps its current dtype and a
+    warning is emitted, so an unexpected export never fails to load.
+    """
+    typed = data.copy(deep=False)
+    for column, dtype in schema.items():
+        if column not in typed.columns or str(typed[column].dtype) == dtype:
+            continue
+        try:
+            typed[column] = _cast(typed[column], dtype)
+        except (ValueError, TypeError, OverflowError) as e:
+            warnings.warn(f"Column '{column}' kept as {typed[column].dtype}, cannot cast to {dtype}: {e}")
+    return typed
+
+
+def memory_report(data, baseline=None):
+    """Memory used per column (deep), optionally next to a ``baseline`` frame."""
+    report = pd.DataFrame({
+        "Column": data.columns,
+        "Dtype": [str(dtype) for dtype in data.dtypes],
+        "Bytes": data.memory_usage(deep=True, index=False).to_numpy(),
+    })
+    if baseline is not None:
+        baseline_bytes = baseline.memory_usage(deep=True, index=False)
+        report.insert(2, "Baseline Dtype", [str(baseline[column].dtype) for column in data.columns])
+        report["Baseline Bytes"] = [baseline_bytes[column] for column in data.columns]
+        report["Saving"] = 1 - report["Bytes"] / report["Baseline Bytes"]
+    return report
+
+
+if __name__ == "__main__":
+    source = sys.argv[1] if len(sys.argv) > 1 else os.path.join("notebook", "data_cleaned.csv")
+    raw = pd.read_csv(source)
+    report = memory_report(apply_schema(raw), baseline=raw)
+    print(report.to_string(index=False))
+    print(f"\nTotal: {report['Baseline Bytes'].sum():,} -> {report['Bytes'].sum():,} bytes")
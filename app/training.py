@@ -0,0 +1,227 @@
+"""Parallel port of the model training in ``notebook/machine_learning.ipynb``.
+
+The notebook prepares the data (winsorizing, category codes, top 10 features
+by RandomForest importance, 70/30 split, ``StandardScaler`` and SMOTE) and
+then fits LogisticRegression, RandomForest and GradientBoosting one after
+another through ``evaluate_model``: a fit scored on the test split plus a
+5-fold ``StratifiedKFold`` F1 cross-validation, all on one core.
+
+``train_models`` runs those 3 × (1 + 5) fits as independent jobs on a
+process pool, one estimator per process: every estimator gets ``n_jobs=1``
+and BLAS/OpenMP are limited to one thread in the workers, so N workers use
+N cores and no more. The training data is sent once per worker, not once
+per job, and the slowest model is scheduled first. Each job fits a fresh
+estimator with the notebook's seeds, so the scores, the chosen model and the
+saved ``model_package`` (``model``, ``scaler``, ``features``) are the same
+as a serial run.
+
+Run it with::
+
+    python app/training.py notebook/data_cleaned.csv --output models
+"""
+import argparse
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from turnover_model import WINSORIZE_LIMITS, WINSORIZED_COLUMNS
+
+TARGET_COLUMN = "Rotación Externa"
+DROPPED_COLUMNS = ["ID Empleado", "Fecha Hoy"]
+N_FEATURES = 10
+TEST_SIZE = 0.3
+CV_FOLDS = 5
+RANDOM_STATE = 42
+
+# Slowest first, so the long GradientBoosting fits do not start last
+MODEL_NAMES = ["Gradient Boosting", "Random Forest", "Regresión Logística"]
+
+PreparedData = namedtuple("PreparedData", ["features", "scaler", "X_train", "y_train", "X_test", "y_test"])
+TrainingResult = namedtuple("TrainingResult", ["name", "model", "accuracy", "auc", "f1_cv", "f1_cv_std"])
+
+
+def make_model(name, **params):
+    """Unfitted estimator with the notebook's settings, single-threaded.
+
+    ``params`` override the notebook's hyperparameters (see ``model_search``).
+    """
+    from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier
+    from sklearn.linear_model import LogisticRegression
+
+    if name == "Regresión Logística":
+        return LogisticRegression(**{"random_state": RANDOM_STATE, "max_iter": 1000, "class_weight": "balanced",
+                                     **params})
+    if name == "Random Forest":
+        return RandomForestClassifier(**{"n_estimators": 100, "random_state": RANDOM_STATE,
+                                         "class_weight": "balanced", **params, "n_jobs": 1})
+    if name == "Gradient Boosting":
+        return GradientBoostingClassifier(**{"random_state": RANDOM_STATE, **params})
+    raise ValueError(f"Unknown model {name!r}, expected one of {MODEL_NAMES}")
+
+
+def model_file_name(name):
+    return f"modelo_rotacion_externa_{name.replace(' ', '_').lower()}.pkl"
+
+
+# The only package resources.load_model() looks for
+APP_MODEL_FILE = model_file_name("Random Forest")
+
+
+def prepare_data(df, n_jobs=None):
+    """Feature selection, split, scaling and SMOTE as in the notebook.
+
+    ``n_jobs`` is passed to the RandomForest that ranks the features, which
+    runs on its own before the training jobs.
+    """
+    from imblearn.over_sampling import SMOTE
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.model_selection import train_test_split
+    from sklearn.preprocessing import StandardScaler
+
+    df = df.copy()
+    for column in WINSORIZED_COLUMNS:
+        if column in df.columns:
+            lower = np.quantile(df[column], WINSORIZE_LIMITS[0])
+            upper = np.quantile(df[column], 1 - WINSORIZE_LIMITS[1])
+            df[column] = np.clip(df[column], lower, upper)
+
+    X = df.drop(columns=[TARGET_COLUMN, *[column for column in DROPPED_COLUMNS if column in df.columns]])
+    y = df[TARGET_COLUMN]
+    for column in X.select_dtypes(exclude="number").columns:
+        X[column] = X[column].astype("category").cat.codes
+
+    selector = RandomForestClassifier(n_estimators=100, random_state=RANDOM_STATE, n_jobs=n_jobs)
+    selector.fit(X, y)
+    order = np.argsort(-selector.feature_importances_, kind="stable")
+    features = X.columns[order[:N_FEATURES]].tolist()
+
+    X_train, X_test, y_train, y_test = train_test_split(X[features], y, test_size=TEST_SIZE,
+                                                        random_state=RANDOM_STATE, stratify=y)
+    scaler = StandardScaler()
+    X_train_scaled = scaler.fit_transform(X_train)
+    X_test_scaled = scaler.transform(X_test)
+    X_balanced, y_balanced = SMOTE(random_state=RANDOM_STATE).fit_resample(X_train_scaled, y_train)
+    return PreparedData(features, scaler, X_balanced, np.asarray(y_balanced), X_test_scaled, np.asarray(y_test))
+
+
+# Training data of the current process, set once per worker by _init_worker
+_DATA = None
+
+
+def _init_worker(data, single_thread=True):
+    global _DATA
+    _DATA = data
+    if single_thread:
+        from threadpoolctl import threadpool_limits
+
+        threadpool_limits(1)
+
+
+def _run_job(name, fold):
+    # fold None: fit on the whole training split and score on the test split
+    from sklearn.metrics import f1_score, roc_auc_score
+
+    prepared, folds = _DATA
+    model = make_model(name)
+    if fold is None:
+        model.fit(prepared.X_train, prepared.y_train)
+        predictions = model.predict(prepared.X_test)
+        probabilities = model.predict_proba(prepared.X_test)[:, 1]
+        return name, fold, model, ((predictions == prepared.y_test).mean(),
+                                   roc_auc_score(prepared.y_test, probabilities))
+    train, test = folds[fold]
+    model.fit(prepared.X_train[train], prepared.y_train[train])
+    return name, fold, None, f1_score(prepared.y_train[test], model.predict(prepared.X_train[test]))
+
+
+def cv_folds(y):
+    """(train, test) row indices of the notebook's 5-fold ``StratifiedKFold``."""
+    from sklearn.model_selection import StratifiedKFold
+
+    cv = StratifiedKFold(n_splits=CV_FOLDS, shuffle=True, random_state=RANDOM_STATE)
+    return list(cv.split(np.zeros((len(y), 1)), y))
+
+
+def default_workers():
+    return len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+
+
+def train_models(prepared, workers=None, model_names=MODEL_NAMES):
+    """Fit and cross-validate every model; return ``TrainingResult`` per model name.
+
+    ``workers`` processes run the model × fold jobs (default: the usable
+    cores); ``workers=1`` runs them one after another in this process, with
+    the default thread settings, like the notebook.
+    """
+    folds = cv_folds(prepared.y_train)
+    jobs = [(name, fold) for name in model_names for fold in (None, *range(CV_FOLDS))]
+
+    workers = min(workers or default_workers(), len(jobs))
+    if workers == 1:
+        _init_worker((prepared, folds), single_thread=False)
+        outputs = [_run_job(name, fold) for name, fold in jobs]
+    else:
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=((prepared, folds),)) as pool:
+            futures = [pool.submit(_run_job, name, fold) for name, fold in jobs]
+            outputs = [future.result() for future in futures]
+
+    models, test_scores, cv_scores = {}, {}, {name: [0.0] * CV_FOLDS for name in model_names}
+    for name, fold, model, score in outputs:
+        if fold is None:
+            models[name], test_scores[name] = model, score
+        else:
+            cv_scores[name][fold] = score
+    return {
+        name: TrainingResult(name, models[name], *test_scores[name], np.mean(cv_scores[name]),
+                             np.std(cv_scores[name]))
+        for name in model_names
+    }
+
+
+def best_result(results):
+    """The model with the best cross-validated F1, as the notebook picks it."""
+    return max(results.values(), key=lambda result: result.f1_cv)
+
+
+def save_model_package(prepared, result, directory="."):
+    """Write the ``model_package`` dict ``load_model()`` expects; return its path."""
+    import joblib
+
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, model_file_name(result.name))
+    joblib.dump({"model": result.model, "scaler": prepared.scaler, "features": prepared.features}, path)
+    return path
+
+
+def report_saved(path):
+    print(f"Saved to {path}")
+    if os.path.basename(path) != APP_MODEL_FILE:
+        print(f"Note: the app only loads {APP_MODEL_FILE} and keeps using it, not this package")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the turnover models like notebook/machine_learning.ipynb.")
+    parser.add_argument("data", nargs="?", default=os.path.join("notebook", "data_cleaned.csv"))
+    parser.add_argument("--output", default=".", help="directory for the model package")
+    parser.add_argument("--workers", type=int, help="training processes (default: usable cores)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    prepared = prepare_data(pd.read_csv(args.data), n_jobs=args.workers or default_workers())
+    results = train_models(prepared, workers=args.workers)
+    elapsed = time.perf_counter() - start
+
+    for result in results.values():
+        print(f"{result.name}: accuracy {result.accuracy:.3f}, AUC {result.auc:.3f}, "
+              f"F1 (CV) {result.f1_cv:.3f} ± {result.f1_cv_std:.3f}")
+    best = best_result(results)
+    print(f"The best model is {best.name}; trained in {elapsed:.1f}s")
+    report_saved(save_model_package(prepared, best, args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Inference session for the persisted turnover RandomForest.
+
+``machine_learning.ipynb`` saves a ``model_package`` dict with ``model``,
+``scaler`` and ``features``. Before training, the notebook winsorizes three
+columns and turns every text column (the two date columns among the selected
+features) into ``category`` codes, i.e. the position of the value among the
+sorted unique values of ``data_cleaned.csv``. ``InferenceSession`` rebuilds
+that encoding from the reference data once and then scores frames in batches.
+"""
+import numpy as np
+import pandas as pd
+
+MODEL_FILE_NAME = "modelo_rotacion_externa_random_forest.pkl"
+
+# Columns winsorized at the 5th/95th percentiles in machine_learning.ipynb
+WINSORIZED_COLUMNS = ["Antigüedad Meses", "Experiencia previa (meses)", "Salario Anual Actual 2020"]
+WINSORIZE_LIMITS = (0.05, 0.05)
+
+DEFAULT_BATCH_SIZE = 10_000
+
+# predict() of a binary classifier picks class 1 only when it is strictly more likely
+DECISION_THRESHOLD = 0.5
+
+
+def _as_text(series):
+    # Dates may come as strings (CSV) or datetime64 (typed frames); the notebook saw strings
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series.dt.strftime("%Y-%m-%d")
+    return series.astype(str)
+
+
+class FeatureEncoder:
+    """Reproduce the notebook's feature preprocessing for new rows."""
+
+    def __init__(self, vocabularies, clip_limits):
+        self.vocabularies = vocabularies
+        self.clip_limits = clip_limits
+
+    @classmethod
+    def from_reference(cls, reference, features):
+        vocabularies = {}
+        clip_limits = {}
+        for column in features:
+            series = reference[column]
+            if not pd.api.types.is_numeric_dtype(series):
+                vocabularies[column] = np.sort(_as_text(series.dropna()).unique())
+            if column in WINSORIZED_COLUMNS:
+                lower = np.quantile(series, WINSORIZE_LIMITS[0])
+                upper = np.quantile(series, 1 - WINSORIZE_LIMITS[1])
+                clip_limits[column] = (lower, upper)
+        return cls(vocabularies, clip_limits)
+
+    def transform(self, df, features, clip=True):
+        """Encoded ``features`` of ``df``; ``clip=False`` skips the winsorizing."""
+        encoded = {}
+        for column in features:
+            series = df[column]
+            if column in self.vocabularies:
+                # Known values get their training code, unseen ones the nearest sorted position
+                text = _as_text(series).to_numpy()
+                codes = np.searchsorted(self.vocabularies[column], text)
+                values = np.where(series.isna().to_numpy(), -1, codes)
+            else:
+                values = series.to_numpy(dtype=float)
+            if clip and column in self.clip_limits:
+                values = np.clip(values, *self.clip_limits[column])
+            encoded[column] = values
+        return pd.DataFrame(encoded, index=df.index, columns=features)
+
+
+class InferenceSession:
+    """Validated model package plus feature encoder, shared across requests."""
+
+    def __init__(self, package, reference):
+        missing_keys = [key for key in ("model", "scaler", "features") if key not in package]
+        if missing_keys:
+            raise ValueError(f"Model package is missing {missing_keys}")
+
+        self.model = package["model"]
+        self.scaler = package["scaler"]
+        self.features = list(package["features"])
+        self._check_feature_order()
+
+        missing = [column for column in self.features if column not in reference.columns]
+        if missing:
+            raise ValueError(f"Reference data is missing model features {missing}")
+        self.encoder = FeatureEncoder.from_reference(reference, self.features)
+
+        # Warm up so the first real request does not pay for lazy initialisation
+        self.predict_proba(reference.head(1))
+
+    def _check_feature_order(self):
+        fitted_names = getattr(self.scaler, "feature_names_in_", None)
+        if fitted_names is not None and list(fitted_names) != self.features:
+            raise ValueError(
+                f"Scaler was fitted on {list(fitted_names)} but the package lists {self.features}"
+            )
+        for name, estimator in (("scaler", self.scaler), ("model", self.model)):
+            n_features = getattr(estimator, "n_features_in_", len(self.features))
+            if n_features != len(self.features):
+                raise ValueError(
+                    f"The {name} expects {n_features} features but the package lists {len(self.features)}"
+                )
+
+    def feature_matrix(self, df):
+        """Encode and scale ``df`` into the model's input matrix."""
+        missing = [column for column in self.features if column not in df.columns]
+        if missing:
+            raise KeyError(f"Missing columns for model scoring: {missing}")
+        encoded = self.encoder.transform(df, self.features)
+        return self.scaler.transform(encoded)
+
+    def predict_proba(self, df, batch_size=DEFAULT_BATCH_SIZE):
+        """Return the probability of leaving for every row of ``df``."""
+        probabilities = np.empty(len(df))
+        leave_column = list(self.model.classes_).index(1)
+        for start in range(0, len(df), batch_size):
+            batch = df.iloc[start:start + batch_size]
+            matrix = self.feature_matrix(batch)
+            probabilities[start:start + len(batch)] = self.model.predict_proba(matrix)[:, leave_column]
+        return probabilities
+
+    def score(self, df):
+        """Score ``df`` with the same output columns as the rule engine."""
+        risk_score = self.predict_proba(df)
+        return pd.DataFrame({
+            "risk_score": risk_score,
+            "prediction": (risk_score > DECISION_THRESHOLD).astype(int),
+        }, index=df.index)
+
+
+def model_employee_frame(negligencias, edad, nuevas_contrataciones, exp_previa, antig_anios,
+                         antig_meses, salario_inicial, salario_actual, fecha_inicio, year_birth):
+    """Build a one-row frame with the model features from the prediction form."""
+    total_tenure = antig_anios + (antig_meses / 12)
+    return pd.DataFrame({
+        "Neglicencias/Sanciones": [negligencias],
+        "Antigüedad Años": [total_tenure],
+        "Antigüedad Meses": [total_tenure * 12],
+        "Fecha Inicio de Contrato": [fecha_inicio.isoformat()],
+        # The form only asks for the year, so use mid-year as the birth date
+        "Año de Nacimiento": [f"{int(year_birth)}-07-01"],
+        "Salario Anual Inicial 2020": [salario_inicial],
+        "Experiencia previa (meses)": [exp_previa],
+        "Edad": [edad],
+        "Salario Anual Actual 2020": [salario_actual],
+        "Nuevas contrataciones 2020": [nuevas_contrataciones],
+    })
@@ -0,0 +1,215 @@
+"""Rule-based employee turnover scoring.
+
+Vectorized version of the risk factors used by the "🔮 ML Predictions" page.
+Every function takes scalars or NumPy arrays, so the same code scores a single
+employee from the form or a whole ``data_cleaned.csv`` frame in one pass.
+"""
+import numpy as np
+import pandas as pd
+
+# Columns of data_cleaned.csv used by the rule engine
+INPUT_COLUMNS = {
+    "negligencias": "Neglicencias/Sanciones",
+    "edad": "Edad",
+    "nuevas_contrataciones": "Nuevas contrataciones 2020",
+    "exp_previa": "Experiencia previa (meses)",
+    "total_tenure": "Antigüedad Años",
+    "salario_inicial": "Salario Anual Inicial 2020",
+    "salario_actual": "Salario Anual Actual 2020",
+}
+
+# Define factor weights - MUST SUM TO 1.0
+RISK_WEIGHTS = {
+    "Negligencias": 0.25,
+    "Crecimiento Salarial": 0.15,
+    "Antigüedad": 0.20,
+    "Edad": 0.10,
+    "Nueva Contratación": 0.10,
+    "Alineación Salarial": 0.15,
+    "Adaptación": 0.05
+}
+
+RISK_FACTORS = list(RISK_WEIGHTS.keys())
+
+# Cap at 90% maximum risk
+MAX_RISK = 0.9
+
+# Decision threshold
+RISK_THRESHOLD = 0.35
+
+
+def negligencias_risk(negligencias):
+    # Progressive impact: 0.15 for 1, 0.3 for 2, 0.35 to 0.45 up to 5, then 0.52 to 0.8
+    n = np.asarray(negligencias, dtype=float)
+    return np.select(
+        [n == 0, n <= 2, n <= 5],
+        [0.0, 0.15 * n, 0.3 + 0.05 * (n - 2)],
+        default=0.45 + 0.07 * (n - 5)
+    )
+
+
+def salary_growth(salario_inicial, salario_actual):
+    inicial = np.asarray(salario_inicial, dtype=float)
+    actual = np.asarray(salario_actual, dtype=float)
+    return (actual - inicial) / np.maximum(1, inicial)
+
+
+def salary_growth_risk(growth):
+    # Inverse relationship with diminishing returns, high risk if growth <= 0
+    growth = np.asarray(growth, dtype=float)
+    with np.errstate(over="ignore"):
+        decay = 0.6 * np.exp(-5 * growth)
+    return np.where(growth <= 0, 0.6, decay)
+
+
+def tenure_risk(total_tenure):
+    # Higher risk for new employees, decreases over time
+    t = np.asarray(total_tenure, dtype=float)
+    with np.errstate(over="ignore"):
+        late = 0.1 * np.exp(-0.2 * (t - 3))  # Slow decrease after 3 years
+    return np.select(
+        [t < 1, t < 3],
+        [0.7 - (0.4 * t),  # 0.7 at 0 years to 0.3 at 1 year
+         0.3 - (0.1 * (t - 1))],  # 0.3 at 1 year to 0.1 at 3 years
+        default=late
+    )
+
+
+def age_risk(edad):
+    # U-shaped risk (young and older have higher risk)
+    edad = np.asarray(edad, dtype=float)
+    return np.select(
+        [edad < 30, edad < 50],
+        [0.5 - ((edad - 20) * 0.03),  # 0.5 at 20yo to 0.2 at 30yo
+         0.2 - ((edad - 30) * 0.005)],  # 0.2 at 30yo to 0.1 at 50yo
+        default=0.1 + ((edad - 50) * 0.015)  # 0.1 at 50yo to 0.4 at 70yo
+    )
+
+
+def new_hire_risk(nuevas_contrataciones):
+    flag = np.asarray(nuevas_contrataciones)
+    return np.where(flag == 1, 0.3, 0.0)
+
+
+def salary_ratio(salario_actual, total_tenure, exp_previa):
+    # Expected salary based on experience: €25000 base plus €1000 per year
+    market_experience = np.asarray(total_tenure, dtype=float) + (np.asarray(exp_previa, dtype=float) / 12)
+    expected_salary = 25000 + 1000 * market_experience
+    return np.asarray(salario_actual, dtype=float) / np.maximum(1, expected_salary)
+
+
+def market_risk(ratio):
+    # Risk is higher if actual salary is below expected
+    ratio = np.asarray(ratio, dtype=float)
+    return np.select(
+        [ratio >= 1.1, ratio >= 0.9, ratio >= 0.8],
+        [0.05, 0.15, 0.3],
+        default=0.5
+    )
+
+
+def adjustment_risk(total_tenure, exp_previa):
+    # Less than 2 years tenure but more than 5 years prior experience
+    t = np.asarray(total_tenure, dtype=float)
+    exp_previa = np.asarray(exp_previa, dtype=float)
+    return np.where((t < 2) & (exp_previa > 60), 0.25, 0.0)
+
+
+# Inputs each factor reads, so a change to some inputs only re-evaluates the factors that use them
+FACTOR_INPUTS = {
+    "Negligencias": ("negligencias",),
+    "Crecimiento Salarial": ("salario_inicial", "salario_actual"),
+    "Antigüedad": ("total_tenure",),
+    "Edad": ("edad",),
+    "Nueva Contratación": ("nuevas_contrataciones",),
+    "Alineación Salarial": ("salario_actual", "total_tenure", "exp_previa"),
+    "Adaptación": ("total_tenure", "exp_previa"),
+}
+
+
+def compute_risk_factor(factor, negligencias=None, edad=None, nuevas_contrataciones=None, exp_previa=None,
+                        total_tenure=None, salario_inicial=None, salario_actual=None):
+    """Return one raw risk factor; only the inputs in ``FACTOR_INPUTS[factor]`` are needed."""
+    if factor == "Negligencias":
+        return negligencias_risk(negligencias)
+    if factor == "Crecimiento Salarial":
+        return salary_growth_risk(salary_growth(salario_inicial, salario_actual))
+    if factor == "Antigüedad":
+        return tenure_risk(total_tenure)
+    if factor == "Edad":
+        return age_risk(edad)
+    if factor == "Nueva Contratación":
+        return new_hire_risk(nuevas_contrataciones)
+    if factor == "Alineación Salarial":
+        return market_risk(salary_ratio(salario_actual, total_tenure, exp_previa))
+    if factor == "Adaptación":
+        return adjustment_risk(total_tenure, exp_previa)
+    raise KeyError(f"Unknown risk factor {factor!r}")
+
+
+def compute_risk_factors(negligencias, edad, nuevas_contrataciones, exp_previa,
+                         total_tenure, salario_inicial, salario_actual):
+    """Return the seven raw risk factors as a dict of arrays keyed by factor name."""
+    inputs = {
+        "negligencias": negligencias,
+        "edad": edad,
+        "nuevas_contrataciones": nuevas_contrataciones,
+        "exp_previa": exp_previa,
+        "total_tenure": total_tenure,
+        "salario_inicial": salario_inicial,
+        "salario_actual": salario_actual,
+    }
+    return {factor: compute_risk_factor(factor, **inputs) for factor in RISK_FACTORS}
+
+
+def combine_risk_factors(risk_factors):
+    """Weight the raw factors and return (weighted factors, capped risk score)."""
+    weighted_risks = {}
+    risk_score = 0
+    # Accumulate in the same order as RISK_WEIGHTS so the float sum is reproducible
+    for factor in RISK_FACTORS:
+        weighted_value = risk_factors[factor] * RISK_WEIGHTS[factor]
+        weighted_risks[factor] = weighted_value
+        risk_score = risk_score + weighted_value
+    return weighted_risks, np.minimum(MAX_RISK, risk_score)
+
+
+def risk_inputs(df):
+    """Extract the rule engine inputs from a frame with data_cleaned.csv columns."""
+    missing = [col for col in INPUT_COLUMNS.values() if col not in df.columns]
+    if missing:
+        raise KeyError(f"Missing columns for turnover scoring: {missing}")
+    return {arg: df[col].to_numpy() for arg, col in INPUT_COLUMNS.items()}
+
+
+def score_turnover(df):
+    """Score every row of ``df`` with the rule engine.
+
+    Returns a frame aligned with ``df.index`` holding the raw factor scores,
+    the weighted impacts (``"<factor> (weighted)"``), ``risk_score`` and the
+    binary ``prediction``.
+    """
+    risk_factors = compute_risk_factors(**risk_inputs(df))
+    weighted_risks, risk_score = combine_risk_factors(risk_factors)
+
+    result = pd.DataFrame(risk_factors, index=df.index)
+    for factor, values in weighted_risks.items():
+        result[f"{factor} (weighted)"] = values
+    result["risk_score"] = risk_score
+    result["prediction"] = (risk_score > RISK_THRESHOLD).astype(int)
+    return result
+
+
+def employee_frame(negligencias, edad, nuevas_contrataciones, exp_previa,
+                   antig_anios, antig_meses, salario_inicial, salario_actual):
+    """Build a one-row frame with data_cleaned.csv columns from the prediction form."""
+    values = {
+        "negligencias": negligencias,
+        "edad": edad,
+        "nuevas_contrataciones": nuevas_contrataciones,
+        "exp_previa": exp_previa,
+        "total_tenure": antig_anios + (antig_meses / 12),
+        "salario_inicial": salario_inicial,
+        "salario_actual": salario_actual,
+    }
+    return pd.DataFrame({INPUT_COLUMNS[arg]: [value] for arg, value in values.items()})
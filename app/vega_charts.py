@@ -0,0 +1,276 @@
+"""Browser-rendered chart backend for the Interactive Visualizations page.
+
+Each function mirrors the chart of the same name in ``charts`` but returns a
+Vega-Lite spec for ``st.vega_lite_chart`` instead of drawing on a matplotlib
+axis. The server only sends what the chart needs (histogram bins and KDE
+curve, box-plot statistics, regression line, aggregated counts) and the
+browser renders it, so a rerun does not rasterize anything and the payload
+is a few hundred bytes of JSON for most charts. Scatter charts send their
+points, capped by ``scatter.prepare_scatter``; the ``*_density`` variants
+send the non-empty cells of a ``scatter.Density``.
+"""
+import json
+
+import numpy as np
+import pandas as pd
+
+from scatter import linear_fit
+
+SCHEMA_URL = "https://vega.github.io/schema/vega-lite/v5.json"
+DEFAULT_HEIGHT = 360
+ROTATED_LABELS = {"labelAngle": -45, "labelAlign": "right"}
+
+
+def _values(frame):
+    """JSON-ready records (numpy scalars, categories and NaN handled by pandas)."""
+    return json.loads(frame.to_json(orient="records", force_ascii=False))
+
+
+def _spec(frame, title, height=DEFAULT_HEIGHT, **chart):
+    return {
+        "$schema": SCHEMA_URL,
+        "title": title,
+        "height": height,
+        "data": {"values": _values(frame)},
+        **chart,
+    }
+
+
+def _histogram_spec(histogram, title, x_title, x_format=None):
+    # Bars from the pre-binned counts, KDE curve as a line layer
+    axis = {"format": x_format} if x_format else {}
+    bars = pd.DataFrame({"start": histogram.edges[:-1], "end": histogram.edges[1:], "count": histogram.counts})
+    curve = pd.DataFrame({"start": histogram.kde_x, "count": histogram.kde_y})
+    x = {"field": "start", "type": "quantitative", "title": x_title, "axis": axis}
+    y = {"field": "count", "type": "quantitative", "title": "Count"}
+    return _spec(
+        bars, title,
+        layer=[
+            {"mark": {"type": "bar", "tooltip": True, "opacity": 0.75},
+             "encoding": {"x": {**x, "bin": {"binned": True}}, "x2": {"field": "end"}, "y": y}},
+            {"data": {"values": _values(curve.round(6))}, "mark": "line", "encoding": {"x": x, "y": y}},
+        ],
+    )
+
+
+def _box_stats(data, column, by="Departamento"):
+    """Tukey box-plot statistics per group (whiskers at 1.5 IQR, like seaborn)."""
+    groups = data[by]
+    stats = data.groupby(by, observed=True)[column].quantile([0.25, 0.5, 0.75]).unstack()
+    stats.columns = ["q1", "median", "q3"]
+    iqr = stats["q3"] - stats["q1"]
+    lower = (stats["q1"] - 1.5 * iqr).reindex(groups).to_numpy()
+    upper = (stats["q3"] + 1.5 * iqr).reindex(groups).to_numpy()
+    values = data[column].to_numpy(dtype=float)
+    inside = pd.Series(np.where((values >= lower) & (values <= upper), values, np.nan), index=data.index)
+    stats["lower"] = inside.groupby(groups, observed=True).min()
+    stats["upper"] = inside.groupby(groups, observed=True).max()
+    return stats.rename_axis(by).reset_index()
+
+
+def _box_spec(data, column, title, y_title, y_format=None, by="Departamento"):
+    axis = {"format": y_format} if y_format else {}
+    x = {"field": by, "type": "nominal", "title": "Department", "axis": ROTATED_LABELS}
+    return _spec(
+        _box_stats(data, column, by), title,
+        encoding={"x": x},
+        layer=[
+            {"mark": "rule", "encoding": {
+                "y": {"field": "lower", "type": "quantitative", "title": y_title, "axis": axis},
+                "y2": {"field": "upper"},
+            }},
+            {"mark": {"type": "bar", "size": 24, "tooltip": True}, "encoding": {
+                "y": {"field": "q1", "type": "quantitative"},
+                "y2": {"field": "q3"},
+                "color": {"field": by, "type": "nominal", "legend": None},
+            }},
+            {"mark": {"type": "tick", "color": "black", "size": 24}, "encoding": {
+                "y": {"field": "median", "type": "quantitative"},
+            }},
+        ],
+    )
+
+
+def _density_spec(density, title, x_title, y_title, extra_layers=()):
+    x_index, y_index = np.nonzero(density.counts)
+    cells = pd.DataFrame({
+        "x_start": density.x_edges[x_index], "x_end": density.x_edges[x_index + 1],
+        "y_start": density.y_edges[y_index], "y_end": density.y_edges[y_index + 1],
+        "count": density.counts[x_index, y_index],
+    })
+    return _spec(
+        cells, title,
+        layer=[
+            {"mark": {"type": "rect", "tooltip": True}, "encoding": {
+                "x": {"field": "x_start", "type": "quantitative", "title": x_title},
+                "x2": {"field": "x_end"},
+                "y": {"field": "y_start", "type": "quantitative", "title": y_title},
+                "y2": {"field": "y_end"},
+                "color": {"field": "count", "type": "quantitative", "title": "Employees",
+                          "scale": {"scheme": "viridis"}},
+            }},
+            *extra_layers,
+        ],
+    )
+
+
+def _fit_layer(fit, x_range, x, y):
+    slope, intercept = fit
+    ends = np.asarray(x_range, dtype=float)
+    line = pd.DataFrame({x["field"]: ends, y["field"]: slope * ends + intercept})
+    return {"data": {"values": _values(line)}, "mark": {"type": "line", "color": "red"},
+            "encoding": {"x": x, "y": y}}
+
+
+def _pie_spec(counts, category, title, labels=None):
+    frame = counts.rename("count").rename_axis(category).reset_index()
+    if labels:
+        frame[category] = frame[category].map(labels)
+    frame["share"] = frame["count"] / frame["count"].sum()
+    return _spec(
+        frame, title,
+        mark={"type": "arc", "tooltip": True},
+        encoding={
+            "theta": {"field": "count", "type": "quantitative"},
+            "color": {"field": category, "type": "nominal", "title": None},
+            "tooltip": [
+                {"field": category, "type": "nominal"},
+                {"field": "count", "type": "quantitative"},
+                {"field": "share", "type": "quantitative", "format": ".1%"},
+            ],
+        },
+    )
+
+
+def age_distribution(histogram):
+    return _histogram_spec(histogram, 'Age Distribution', 'Age')
+
+
+def gender_distribution(gender_counts):
+    return _pie_spec(gender_counts, 'Sexo', 'Gender Distribution')
+
+
+def department_distribution(dept_counts):
+    frame = dept_counts.rename("count").rename_axis('Departamento').reset_index()
+    return _spec(
+        frame, 'Department Distribution', height=max(DEFAULT_HEIGHT, 24 * len(frame)),
+        mark={"type": "bar", "tooltip": True},
+        encoding={
+            "y": {"field": 'Departamento', "type": "nominal", "title": 'Department', "sort": "-x"},
+            "x": {"field": "count", "type": "quantitative", "title": 'Number of Employees'},
+            "color": {"field": 'Departamento', "type": "nominal", "legend": None},
+        },
+    )
+
+
+def salary_distribution(histogram):
+    return _histogram_spec(histogram, 'Salary Distribution (2020)', 'Annual Salary', x_format=",d")
+
+
+def salary_by_department(data):
+    return _box_spec(data, 'Salario Anual Actual 2020', 'Salary by Department', 'Annual Salary', y_format=",d")
+
+
+def tenure_distribution(histogram):
+    return _histogram_spec(histogram, 'Tenure Distribution (Years)', 'Years of Service')
+
+
+def age_vs_tenure(data):
+    return _spec(
+        data[['Edad', 'Antigüedad Años', 'Sexo']], 'Age vs Tenure',
+        mark={"type": "circle", "tooltip": True},
+        encoding={
+            "x": {"field": 'Edad', "type": "quantitative", "title": 'Age', "scale": {"zero": False}},
+            "y": {"field": 'Antigüedad Años', "type": "quantitative", "title": 'Years of Service'},
+            "color": {"field": 'Sexo', "type": "nominal"},
+        },
+    )
+
+
+def age_vs_tenure_density(density):
+    return _density_spec(density, 'Age vs Tenure', 'Age', 'Years of Service')
+
+
+def tenure_by_department(data):
+    return _box_spec(data, 'Antigüedad Años', 'Tenure by Department', 'Years of Service')
+
+
+def performance_distribution(histogram):
+    return _histogram_spec(histogram, 'Performance Evaluation Distribution', 'Performance Score')
+
+
+def performance_by_department(data):
+    return _box_spec(data, 'Evaluación Desempeño', 'Performance by Department', 'Performance Score')
+
+
+def training_vs_performance(data):
+    columns = ['Horas de formación recibidas', 'Evaluación Desempeño', 'Departamento', 'Antigüedad Años']
+    return _spec(
+        data[columns], 'Training Hours vs Performance',
+        mark={"type": "circle", "opacity": 0.7, "tooltip": True},
+        encoding={
+            "x": {"field": columns[0], "type": "quantitative", "title": 'Training Hours'},
+            "y": {"field": columns[1], "type": "quantitative", "title": 'Performance Score'},
+            "color": {"field": columns[2], "type": "nominal", "title": 'Department'},
+            "size": {"field": columns[3], "type": "quantitative", "title": 'Years of Service',
+                     "scale": {"range": [50, 200]}},
+        },
+    )
+
+
+def training_vs_performance_density(density):
+    return _density_spec(density, 'Training Hours vs Performance', 'Training Hours', 'Performance Score')
+
+
+def external_rotation(rotation_counts):
+    return _pie_spec(rotation_counts, 'Rotación Externa', 'External Rotation', labels={0: 'No', 1: 'Yes'})
+
+
+def internal_rotation(rotation_counts):
+    return _pie_spec(rotation_counts, 'Rotación Interna', 'Internal Rotation', labels={0: 'No', 1: 'Yes'})
+
+
+def rotation_by_department(dept_rotation):
+    # dept_rotation: external rotation % per department
+    frame = dept_rotation.rename("rate").rename_axis('Departamento').reset_index()
+    x = {"field": 'Departamento', "type": "nominal", "title": 'Department', "sort": "-y", "axis": ROTATED_LABELS}
+    y = {"field": "rate", "type": "quantitative", "title": 'External Rotation %'}
+    return _spec(
+        frame, 'External Rotation by Department (%)',
+        encoding={"x": x, "y": y},
+        layer=[
+            {"mark": {"type": "bar", "tooltip": True},
+             "encoding": {"color": {"field": 'Departamento', "type": "nominal", "legend": None}}},
+            {"mark": {"type": "text", "dy": -8},
+             "encoding": {"text": {"field": "rate", "type": "quantitative", "format": ".1f"}}},
+        ],
+    )
+
+
+def training_distribution(histogram):
+    return _histogram_spec(histogram, 'Training Hours Distribution', 'Training Hours')
+
+
+def training_by_department(data):
+    return _box_spec(data, 'Horas de formación recibidas', 'Training Hours by Department', 'Training Hours')
+
+
+def training_regression(data):
+    x_column, y_column = 'Horas de formación recibidas', 'Evaluación Desempeño'
+    points = data[[x_column, y_column]].dropna()
+    x = {"field": x_column, "type": "quantitative", "title": 'Training Hours'}
+    y = {"field": y_column, "type": "quantitative", "title": 'Performance Score'}
+    layers = [{"mark": {"type": "circle", "opacity": 0.5}, "encoding": {"x": x, "y": y}}]
+    fit = linear_fit(points, x_column, y_column)
+    if fit is not None:
+        # Least-squares line fitted here, sent as its two end points
+        layers.append(_fit_layer(fit, [points[x_column].min(), points[x_column].max()], x, y))
+    return _spec(points, 'Training Hours vs Performance Score', layer=layers)
+
+
+def training_regression_density(density, fit):
+    x = {"field": "x", "type": "quantitative"}
+    y = {"field": "y", "type": "quantitative"}
+    layers = [_fit_layer(fit, density.x_edges[[0, -1]], x, y)] if fit is not None else []
+    return _density_spec(density, 'Training Hours vs Performance Score', 'Training Hours', 'Performance Score',
+                         extra_layers=layers)
@@ -0,0 +1,31 @@
+"""One module per page of the app, imported the first time its page is shown.
+
+Each module has a ``render()`` that draws its page. ``app.py`` only draws
+the header and the sidebar and hands the selected menu entry to
+``render_page``, so a rerun executes a single page, and the libraries a page
+needs (seaborn and matplotlib for the charts, the model for predictions)
+are not imported until someone opens it. The package is not called
+``pages`` on purpose: Streamlit would turn that folder into its own
+multipage navigation.
+"""
+import importlib
+
+# Sidebar menu entry → page module
+PAGES = {
+    "🏠 Home & Objectives": "home",
+    "📊 Project Overview": "project_overview",
+    "📈 Interactive Visualizations": "visualizations",
+    "📊 Power BI Dashboards": "power_bi",
+    "🔮 ML Predictions": "ml_predictions",
+    "📉 Drift Monitor": "drift",
+    "🧪 What-If Simulator": "what_if_simulator",
+    "📆 Workforce Forecast": "workforce_forecast",
+}
+
+
+def page_module(menu):
+    return importlib.import_module(f"{__name__}.{PAGES[menu]}")
+
+
+def render_page(menu):
+    page_module(menu).render()
@@ -0,0 +1,76 @@
+"""📉 Drift Monitor: scored batches compared with the training data."""
+import pandas as pd
+import streamlit as st
+
+from bulk_scoring import iter_chunks
+from drift_monitor import RISK_SCORE_COLUMN, monitored_columns
+from resources import get_drift_monitor, get_inference_session
+
+
+def render():
+    st.markdown('<p class="section-header">📉 Drift Monitor</p>', unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div style="background-color: #f0f8ff; padding: 15px; border-radius: 10px; border-left: 5px solid #2E86C1; margin-bottom: 20px;">
+        <h3 style="color: #2E86C1; margin-top: 0;">Model and Data Drift</h3>
+        <p style="color: var(--text-color, #333);">Every batch scored with the RandomForest is compared with the training data in <code>data_cleaned.csv</code>, feature by feature and on the predicted risk.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    monitor = get_drift_monitor()
+    if monitor is None:
+        st.warning("The RandomForest model is not available, so there is nothing to monitor.")
+    else:
+        session = get_inference_session()
+        
+        metric_col1, metric_col2, metric_col3 = st.columns(3)
+        summary = monitor.summary()
+        metric_col1.metric("Batches Monitored", f"{monitor.batches:,}")
+        metric_col2.metric("Rows Monitored", f"{monitor.rows:,}")
+        metric_col3.metric("Drifting Columns", sum(stats.status != "Stable" for stats in summary))
+        
+        if monitor.rows == 0:
+            st.info("No batches yet. Score a file in 🔮 ML Predictions (RandomForest model) or check one below.")
+        else:
+            st.markdown("### Since the Last Reset")
+            st.dataframe(pd.DataFrame({
+                'Column': [stats.column for stats in summary],
+                'Rows': [stats.rows for stats in summary],
+                'PSI': [stats.psi for stats in summary],
+                'KS': [stats.ks for stats in summary],
+                'KS Critical (5%)': [stats.ks_critical for stats in summary],
+                'Missing': [stats.missing for stats in summary],
+                'Status': [stats.status for stats in summary],
+            }).style.format({'PSI': '{:.3f}', 'KS': '{:.3f}', 'KS Critical (5%)': '{:.3f}', 'Missing': '{:.1%}'}),
+                hide_index=True)
+            st.caption("PSI below 0.1 is stable, 0.1 to 0.25 a moderate shift and above 0.25 a significant one. "
+                       "KS above its critical value means the distribution differs at the 5% level.")
+            
+            st.markdown("### PSI per Batch")
+            history = list(monitor.history)
+            psi_history = pd.DataFrame(
+                [{stats.column: stats.psi for stats in batch.stats} for batch in history],
+                index=pd.Index([batch.batch for batch in history], name='Batch')
+            )
+            selected_columns = st.multiselect("Columns:", list(psi_history.columns),
+                                              default=[RISK_SCORE_COLUMN] if RISK_SCORE_COLUMN in psi_history else None)
+            if selected_columns:
+                st.line_chart(psi_history[selected_columns])
+        
+        with st.expander("Check a File for Drift"):
+            st.markdown(
+                "Upload a CSV or Parquet file with the model features. It is scored and added to the monitor "
+                "chunk by chunk, without keeping the rows."
+            )
+            drift_file = st.file_uploader("Employee file", type=["csv", "parquet"], key="drift_file")
+            if drift_file is not None and st.button("Check File", key="drift_check_button"):
+                try:
+                    for chunk, _ in iter_chunks(drift_file, drift_file.name):
+                        monitor.update(monitored_columns(session, chunk, session.predict_proba(chunk)))
+                    st.rerun()
+                except (KeyError, ValueError) as e:
+                    st.error(f"Error checking file: {e}")
+        
+        if st.button("Reset Monitor", key="drift_reset_button"):
+            monitor.reset()
+            st.rerun()
@@ -0,0 +1,92 @@
+"""🏠 Home & Objectives: what the dashboard is for. Static, so it loads no data."""
+import streamlit as st
+
+
+def render():
+    # Introduction with visual cards - improved text contrast
+    st.markdown("""
+    <div style="display: flex; margin-bottom: 25px;">
+        <div style="flex: 2; background: linear-gradient(135deg, #EBF5FB 0%, #D4E6F1 100%); border-radius: 10px; padding: 20px; margin-right: 15px; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
+            <h3 style="color: #0D47A1; text-align: center; margin-bottom: 20px; border-bottom: 2px solid #0D47A1; padding-bottom: 10px;">
+                📊 Interactive Analytics Platform
+            </h3>
+            <p style="font-size: 16px; line-height: 1.6; color: #333;">
+                This comprehensive dashboard provides powerful visualization and analysis tools for workforce data, enabling HR professionals and managers to make informed decisions.
+            </p>
+        </div>
+        <div style="flex: 1; background: linear-gradient(135deg, #E8F8F5 0%, #D1F2EB 100%); border-radius: 10px; padding: 20px; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
+            <h3 style="color: #00695C; text-align: center; margin-bottom: 20px; border-bottom: 2px solid #00695C; padding-bottom: 10px;">
+                🎯 Our Mission
+            </h3>
+            <p style="font-size: 16px; line-height: 1.6; text-align: center; color: #333;">
+                Transform HR data into actionable insights to optimize workforce performance and employee satisfaction.
+            </p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Key features section with icons and visual elements - fixed text overflow
+    st.markdown("<h3 style='text-align: center; color: #3498DB; margin-top: 10px;'>🔎 Key Analysis Features</h3>", unsafe_allow_html=True)
+    
+    feature_cols = st.columns(5)
+    
+    features = [
+        {"icon": "🔄", "title": "Retention Analysis", "color": "#3498DB"},
+        {"icon": "📈", "title": "Performance Insights", "color": "#9B59B6"},
+        {"icon": "😊", "title": "Satisfaction Metrics", "color": "#2ECC71"},
+        {"icon": "📚", "title": "Training Impact", "color": "#F39C12"},
+        {"icon": "📉", "title": "Absenteeism", "color": "#E74C3C"}
+    ]
+    
+    for i, col in enumerate(feature_cols):
+        with col:
+            feature = features[i]
+            st.markdown(f"""
+            <div style="background-color: white; border-radius: 10px; padding: 15px; height: 140px; text-align: center; 
+                        border-top: 5px solid {feature['color']}; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+                        display: flex; flex-direction: column; justify-content: center; align-items: center;">
+                <div style="font-size: 2.5rem; margin-bottom: 15px;">{feature['icon']}</div>
+                <h4 style="color: {feature['color']}; margin: 0; font-size: 16px;">{feature['title']}</h4>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    # Strategic objectives with progress indicators
+    st.markdown("<h3 style='text-align: center; color: #E67E22; margin-top: 30px;'>🚀 Strategic Objectives</h3>", unsafe_allow_html=True)
+    
+    objectives = [
+        {"title": "Data-driven HR Decisions", "icon": "📊", "progress": 85, "color": "#3498DB"},
+        {"title": "Identify Retention Factors", "icon": "🔍", "progress": 70, "color": "#9B59B6"},
+        {"title": "Optimize Performance", "icon": "📈", "progress": 60, "color": "#2ECC71"},
+        {"title": "Enhance Employee Experience", "icon": "🌟", "progress": 75, "color": "#F39C12"},
+        {"title": "Strategic Workforce Planning", "icon": "🗓️", "progress": 55, "color": "#E74C3C"}
+    ]
+    
+    obj_cols = st.columns(len(objectives))
+    
+    for i, col in enumerate(obj_cols):
+        with col:
+            obj = objectives[i]
+            st.markdown(f"""
+            <div style="background-color: white; border-radius: 10px; padding: 15px; text-align: center; 
+                       box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
+                <div style="font-size: 1.8rem;">{obj['icon']}</div>
+                <h4 style="font-size: 13px; height: 36px; display: flex; align-items: center; justify-content: center; color: #333;">
+                    {obj['title']}
+                </h4>
+                <div style="background-color: #f0f0f0; border-radius: 10px; height: 8px; margin: 8px 0;">
+                    <div style="background-color: {obj['color']}; width: {obj['progress']}%; height: 8px; border-radius: 10px;"></div>
+                </div>
+                <p style="font-size: 12px; color: {obj['color']}; font-weight: bold;">{obj['progress']}% Complete</p>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    # Smaller, more compact CTA
+    st.markdown("""
+    <div style="background: linear-gradient(135deg, #F5EEF8 0%, #EBF5FB 100%); padding: 12px; border-radius: 8px; 
+                text-align: center; margin-top: 25px; width: 60%; margin-left: auto; margin-right: auto;
+                box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); border: 1px dashed #3498DB;">
+        <h4 style="color: #3498DB; margin: 0 0 5px 0;">Ready to explore the data?</h4>
+        <p style="color: #555; margin: 0 0 5px 0; font-size: 14px;">Navigate using the sidebar menu</p>
+        <p style="font-size: 1.5rem; margin: 0;">👈</p>
+    </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,433 @@
+"""🔮 ML Predictions: single predictions, employee explanations and bulk scoring."""
+import os
+import tempfile
+from datetime import date
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from attributions import RISK_SCORE_COLUMN as EXPLAINED_RISK_COLUMN, top_factors as explained_top_factors
+from bulk_scoring import DEFAULT_CHUNK_SIZE, required_columns, score_file
+from dataset_store import ID_COLUMN
+from drift_monitor import monitored_columns
+from instrumentation import span
+from resources import current_dataset, get_attribution_cache, get_drift_monitor, get_inference_session
+from turnover_model import model_employee_frame
+from turnover_scoring import RISK_FACTORS, RISK_WEIGHTS, employee_frame, score_turnover
+
+
+def render():
+    df = current_dataset().df
+
+    #st.markdown('<p class="section-header">🔮 Machine Learning Predictions</p>', unsafe_allow_html=True)
+    
+    # Notify user we're using a rule-based model
+    #st.info("Using a rule-based prediction model based on HR research and best practices")
+    
+    st.markdown("""
+    <div style="background-color: #f0f8ff; padding: 15px; border-radius: 10px; border-left: 5px solid #2E86C1; margin-bottom: 20px;">
+        <h3 style="color: #2E86C1; margin-top: 0;">Employee Turnover Prediction</h3>
+        <p style="color: var(--text-color, #333);">This tool predicts the likelihood of an employee leaving the company based on various HR factors.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Choose between scoring one employee and scoring a whole file
+    prediction_mode = st.radio(
+        "Prediction mode:",
+        ["Single employee", "Bulk upload", "Explain employees"],
+        horizontal=True
+    )
+    
+    # Choose between the hand-written rules and the saved RandomForest
+    prediction_engine = st.radio(
+        "Prediction engine:",
+        ["Rule engine", "RandomForest model"],
+        horizontal=True,
+        help="The RandomForest was trained in machine_learning.ipynb on data_cleaned.csv"
+    )
+    
+    session = get_inference_session() if prediction_engine == "RandomForest model" else None
+    model_unavailable = prediction_engine == "RandomForest model" and session is None
+    if model_unavailable:
+        st.warning("The RandomForest model is not available. Switch to the rule engine to make predictions.")
+    
+    if prediction_mode == "Bulk upload":
+        st.markdown("### Score an Employee File")
+        st.markdown(
+            "Upload a CSV or Parquet file with the same columns as `data_cleaned.csv`. "
+            "The file is scored in chunks, so large exports do not need to fit in memory."
+        )
+        
+        with st.expander("Required columns"):
+            st.write(required_columns(session.features if session is not None else None))
+        
+        uploaded_file = st.file_uploader("Employee file", type=["csv", "parquet"])
+        chunk_size = st.number_input("Rows per chunk", 1000, 1000000, DEFAULT_CHUNK_SIZE, step=1000)
+        
+        if uploaded_file is not None and not model_unavailable and st.button("Score File", key="bulk_predict_button"):
+            progress_bar = st.progress(0.0, text="Scoring...")
+            
+            def update_progress(fraction, rows):
+                progress_bar.progress(fraction, text=f"Scored {rows:,} rows")
+            
+            # One temporary file per run so concurrent sessions never share output
+            output_fd, output_path = tempfile.mkstemp(suffix=".csv")
+            os.close(output_fd)
+            # RandomForest batches also feed the drift monitor
+            monitor = get_drift_monitor() if session is not None else None
+            
+            def monitor_chunk(scored):
+                monitor.update(monitored_columns(session, scored, scored['risk_score']))
+            
+            try:
+                with span(f"prediction: bulk file ({prediction_engine})"):
+                    summary = score_file(uploaded_file, uploaded_file.name, output_path,
+                                         chunk_size=int(chunk_size), progress_callback=update_progress,
+                                         scorer=session.score if session is not None else score_turnover,
+                                         chunk_callback=monitor_chunk if monitor is not None else None)
+                progress_bar.progress(1.0, text=f"Scored {summary['rows']:,} rows")
+                
+                metric_col1, metric_col2, metric_col3 = st.columns(3)
+                metric_col1.metric("Employees Scored", f"{summary['rows']:,}")
+                metric_col2.metric("Predicted Leavers", f"{summary['predicted_leavers']:,}")
+                metric_col3.metric("Average Risk", f"{summary['mean_risk']:.1%}")
+                
+                with open(output_path, "rb") as scored_file:
+                    st.download_button(
+                        "Download scored file",
+                        data=scored_file,
+                        file_name=f"scored_{os.path.splitext(uploaded_file.name)[0]}.csv",
+                        mime="text/csv"
+                    )
+            except (KeyError, ValueError) as e:
+                progress_bar.empty()
+                st.error(f"Error scoring file: {e}")
+            finally:
+                os.remove(output_path)
+    
+    elif prediction_mode == "Explain employees":
+        st.markdown("### Why Are Employees at Risk?")
+        st.markdown(
+            "Each employee's RandomForest probability of leaving is split into the share of leavers the trees "
+            "start from plus one contribution per model feature, in percentage points (pp)."
+        )
+        
+        attribution_cache = get_attribution_cache() if session is not None else None
+        if prediction_engine != "RandomForest model":
+            st.info("Explanations are available for the RandomForest model. The rule engine's factors are shown in single employee mode.")
+        elif attribution_cache is None or df is None:
+            st.warning("The RandomForest model or the dataset is not available.")
+        elif df.empty:
+            st.info("There are no employees to explain.")
+        else:
+            # The whole dataset is explained once; reruns only explain new or changed employees
+            with span("prediction: explain employees"):
+                explanations = attribution_cache.explain(df)
+            ranking = explanations[[EXPLAINED_RISK_COLUMN]].rename(columns={EXPLAINED_RISK_COLUMN: 'Risk'})
+            ranking['Top risk factors'] = explained_top_factors(explanations)
+            ranking = ranking.sort_values('Risk', ascending=False)
+            
+            # The slider needs more employees than its minimum of 5
+            n_listed = (st.slider("Employees to list", 5, min(500, len(ranking)), min(25, len(ranking)))
+                        if len(ranking) > 5 else len(ranking))
+            st.dataframe(ranking.head(n_listed).style.format({'Risk': '{:.1%}'}))
+            st.caption(f"The trees start from {attribution_cache.bias:.1%}, the share of leavers in their "
+                       "(SMOTE-balanced) training data.")
+            
+            employee_id = st.selectbox("Employee to explain:", ranking.index[:n_listed].tolist())
+            contributions = explanations.loc[employee_id].drop(EXPLAINED_RISK_COLUMN).sort_values()
+            employee_values = df.loc[df[ID_COLUMN] == employee_id, session.features].iloc[0]
+            
+            fig, ax = plt.subplots(figsize=(10, 6))
+            ax.barh([f"{feature} = {employee_values[feature]}" for feature in contributions.index],
+                    contributions.to_numpy() * 100,
+                    color=np.where(contributions.to_numpy() > 0, '#E74C3C', '#2ECC71'))
+            ax.axvline(0, color='#555', linewidth=0.8)
+            ax.set_title(f"Employee {employee_id}: {explanations.loc[employee_id, EXPLAINED_RISK_COLUMN]:.1%} "
+                         "probability of leaving", fontsize=14)
+            ax.set_xlabel('Contribution to the probability of leaving (pp)')
+            ax.spines['top'].set_visible(False)
+            ax.spines['right'].set_visible(False)
+            plt.tight_layout()
+            with span("serialize (st.pyplot)"):
+                st.pyplot(fig)
+    
+    else:
+        # Create interface for prediction inputs
+        st.markdown("### Enter Employee Information")
+    
+        # Use tabs to organize the form
+        tab1, tab2 = st.tabs(["Employee Details", "Contract & Compensation"])
+    
+        with tab1:
+            col1, col2 = st.columns(2)
+        
+            with col1:
+                negligencias = st.number_input("Negligencias/Sanciones", 0, 10, 0, help="Number of sanctions or documented policy violations")
+                year_birth = st.number_input("Año de Nacimiento", 1950, 2000, 1985)
+                edad = st.number_input("Edad", 20, 70, 35)
+                nuevas_contrataciones = st.selectbox("¿Es nueva contratación?", ["No", "Sí"])
+                nuevas_contrataciones = 1 if nuevas_contrataciones == "Sí" else 0
+            
+            with col2:
+                exp_previa = st.number_input("Experiencia previa (meses)", 0, 240, 36, help="Previous work experience before joining the company")
+                fecha_inicio = st.date_input("Fecha inicio de contrato", 
+                                           date(2015, 1, 1), 
+                                           min_value=date(2000, 1, 1),
+                                           max_value=date.today())
+    
+        with tab2:
+            col1, col2 = st.columns(2)
+        
+            with col1:
+                antig_anios = st.number_input("Antigüedad en años", 0, 30, 3)
+                antig_meses = st.number_input("Antigüedad en meses", 0, 11, 6)
+            
+            with col2:
+                salario_inicial = st.number_input("Salario inicial 2020 (€)", 15000, 100000, 30000, step=1000)
+                salario_actual = st.number_input("Salario anual actual 2020 (€)", 15000, 150000, 35000, step=1000)
+    
+        # Prediction section
+        st.markdown("### Prediction")
+    
+        if prediction_engine == "RandomForest model":
+            if st.button("Predict Turnover Risk", key="model_predict_button") and not model_unavailable:
+                try:
+                    employee = model_employee_frame(
+                        negligencias=negligencias,
+                        edad=edad,
+                        nuevas_contrataciones=nuevas_contrataciones,
+                        exp_previa=exp_previa,
+                        antig_anios=antig_anios,
+                        antig_meses=antig_meses,
+                        salario_inicial=salario_inicial,
+                        salario_actual=salario_actual,
+                        fecha_inicio=fecha_inicio,
+                        year_birth=year_birth
+                    )
+                    with span("prediction: RandomForest"):
+                        risk_score = float(session.predict_proba(employee)[0])
+                    
+                    if risk_score > 0.5:
+                        risk_level, risk_color = "High", "#E74C3C"
+                    elif risk_score > 0.25:
+                        risk_level, risk_color = "Moderate", "#F39C12"
+                    else:
+                        risk_level, risk_color = "Low", "#2ECC71"
+                    
+                    st.markdown(f"""
+                    <div style="background-color: #f8f9fa; padding: 20px; border-radius: 10px; 
+                                border-left: 5px solid {risk_color}; margin-top: 20px; width: 100%;">
+                        <h3 style="color: {risk_color}; margin-top: 0;">Turnover Risk: {risk_level}</h3>
+                        <p style="color: #333;">Share of RandomForest trees voting that this employee leaves.</p>
+                        <p style="color: #333;">Probability of leaving: <b>{risk_score:.2%}</b></p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    
+                    # What moved this employee's probability away from the training average
+                    attribution_cache = get_attribution_cache()
+                    if attribution_cache is not None:
+                        st.markdown("### Key Factors")
+                        with span("prediction: explain employee"):
+                            contributions = attribution_cache.explain(employee, id_column=None).iloc[0]
+                        contributions = contributions.drop(EXPLAINED_RISK_COLUMN).sort_values()
+                        
+                        fig, ax = plt.subplots(figsize=(10, 6))
+                        ax.barh(contributions.index, contributions.to_numpy() * 100,
+                                color=np.where(contributions.to_numpy() > 0, '#E74C3C', '#2ECC71'))
+                        ax.axvline(0, color='#555', linewidth=0.8)
+                        ax.set_title('Feature Contributions to the Probability of Leaving', fontsize=14)
+                        ax.set_xlabel(f'Percentage points from the {attribution_cache.bias:.1%} the trees start from')
+                        ax.spines['top'].set_visible(False)
+                        ax.spines['right'].set_visible(False)
+                        plt.tight_layout()
+                        with span("serialize (st.pyplot)"):
+                            st.pyplot(fig)
+                    
+                    # Global feature importance of the saved model
+                    st.markdown("### Model Feature Importance")
+                    importance = pd.DataFrame({
+                        'Feature': session.features,
+                        'Importance': session.model.feature_importances_
+                    }).sort_values('Importance', ascending=True)
+                    
+                    fig, ax = plt.subplots(figsize=(10, 6))
+                    ax.barh(importance['Feature'], importance['Importance'],
+                            color=plt.cm.Blues(np.linspace(0.4, 0.9, len(importance))))
+                    ax.set_title('RandomForest Feature Importance', fontsize=14)
+                    ax.set_xlabel('Importance')
+                    ax.spines['top'].set_visible(False)
+                    ax.spines['right'].set_visible(False)
+                    plt.tight_layout()
+                    with span("serialize (st.pyplot)"):
+                        st.pyplot(fig)
+                except (KeyError, ValueError) as e:
+                    st.error(f"Error making prediction: {e}")
+        
+        elif st.button("Predict Turnover Risk", key="predict_button"):
+            try:
+                # Score the employee with the shared (vectorized) rule engine
+                employee = employee_frame(
+                    negligencias=negligencias,
+                    edad=edad,
+                    nuevas_contrataciones=nuevas_contrataciones,
+                    exp_previa=exp_previa,
+                    antig_anios=antig_anios,
+                    antig_meses=antig_meses,
+                    salario_inicial=salario_inicial,
+                    salario_actual=salario_actual
+                )
+                with span("prediction: rule engine"):
+                    scores = score_turnover(employee).iloc[0]
+            
+                weights = RISK_WEIGHTS
+                risk_factors = {factor: float(scores[factor]) for factor in RISK_FACTORS}
+                weighted_risks = {factor: float(scores[f"{factor} (weighted)"]) for factor in RISK_FACTORS}
+                risk_score = float(scores['risk_score'])
+                prediction = int(scores['prediction'])
+                probability = [1 - risk_score, risk_score]
+            
+                # Display prediction
+                if prediction == 1:
+                    risk_level = "High"
+                    risk_color = "#E74C3C"
+                    if risk_score > 0.6:
+                        risk_message = "This employee is at very high risk of leaving. Immediate action recommended."
+                    else:
+                        risk_message = "This employee is at high risk of leaving."
+                else:
+                    if risk_score > 0.25:
+                        risk_level = "Moderate"
+                        risk_color = "#F39C12"
+                        risk_message = "This employee has some turnover risk factors that should be monitored."
+                    else:
+                        risk_level = "Low"
+                        risk_color = "#2ECC71"
+                        risk_message = "This employee is likely to stay with the company."
+            
+                # Display result
+                st.markdown(f"""
+                <div style="background-color: #f8f9fa; padding: 20px; border-radius: 10px; 
+                            border-left: 5px solid {risk_color}; margin-top: 20px; width: 100%;"> <!-- Added width: 70% -->
+                    <h3 style="color: {risk_color}; margin-top: 0;">Turnover Risk: {risk_level}</h3>
+                    <p style="color: #333;">{risk_message}</p> <!-- Added color to ensure visibility -->
+                    <p style="color: #333;">Probability of leaving: <b>{risk_score:.2%}</b></p> <!-- Added color -->
+                </div>
+                """, unsafe_allow_html=True)
+            
+                # Create data for visualization based on weighted factors
+                chart_data = pd.DataFrame({
+                    'Factor': list(weighted_risks.keys()),
+                    'Impact': list(weighted_risks.values())
+                })
+            
+                # Sort by impact (descending to show highest impact factors first)
+                chart_data = chart_data.sort_values('Impact', ascending=True)
+            
+                # Feature importance visualization
+                st.markdown("### Key Factors")
+            
+                # Use a custom color palette based on risk level
+                colors = plt.cm.RdYlGn_r(np.linspace(0.2, 0.8, len(chart_data)))
+            
+                # Create visualization
+                fig, ax = plt.subplots(figsize=(10, 6))
+                bars = ax.barh(chart_data['Factor'], chart_data['Impact'], color=colors)
+            
+                ax.set_title('Factors Influencing Turnover Risk', fontsize=14)
+                ax.set_xlabel('Weighted Impact')
+                ax.spines['top'].set_visible(False)
+                ax.spines['right'].set_visible(False)
+                plt.tight_layout()
+            
+                with span("serialize (st.pyplot)"):
+                    st.pyplot(fig)
+            
+                # Show raw factor scores for transparency
+                with st.expander("Show detailed factor scores"):
+                    raw_data = pd.DataFrame({
+                        'Factor': list(risk_factors.keys()),
+                        'Raw Score': list(risk_factors.values()),
+                        'Weight': [weights[f] for f in risk_factors.keys()],
+                        'Weighted Impact': list(weighted_risks.values())
+                    }).sort_values('Weighted Impact', ascending=False).reset_index(drop=True)
+                
+                    st.table(raw_data)
+            
+                # Recommendations based on risk level and factors
+                st.markdown("### Recommendations")
+            
+                # Get top 3 risk factors
+                top_rule_factors = chart_data.sort_values('Impact', ascending=False).head(3)['Factor'].tolist()
+            
+                if prediction == 1:  # High risk
+                    # Custom recommendations based on top factors
+                    specific_recs = []
+                
+                    if "Negligencias" in top_rule_factors:
+                        specific_recs.append("Address the high number of sanctions or policy violations through coaching and clear expectations")
+                
+                    if "Crecimiento Salarial" in top_rule_factors:
+                        specific_recs.append("Review compensation history and consider a market adjustment to salary")
+                
+                    if "Antigüedad" in top_rule_factors:
+                        specific_recs.append("Implement targeted retention strategies for employees in their early tenure")
+                
+                    if "Edad" in top_rule_factors:
+                        if edad < 30:
+                            specific_recs.append("Provide clear career progression paths and development opportunities for younger employees")
+                        else:
+                            specific_recs.append("Consider flexible work arrangements and recognize experience contributions")
+                
+                    if "Alineación Salarial" in top_rule_factors:
+                        specific_recs.append("Conduct a market compensation analysis and adjust if below market rate")
+                
+                    if "Adaptación" in top_rule_factors:
+                        specific_recs.append("Check in on job satisfaction and role fit for this experienced new hire")
+                
+                    # Generate recommendations HTML
+                    rec_items = "".join([f"<li>{rec}</li>" for rec in specific_recs])
+                
+                    st.markdown(f"""
+                    <div style="background-color: #FDEDEC; padding: 15px; border-radius: 10px; border-left: 5px solid #E74C3C; width: 85%;">
+                        <h4 style="color: #E74C3C; margin-top: 0;">Retention Strategies</h4>
+                        <ul style="color: #333;"> <!-- Added color to ensure visibility -->
+                            {rec_items}
+                            <li>Schedule a one-on-one meeting to discuss career aspirations</li>
+                            <li>Review overall compensation and benefits package</li>
+                            <li>Consider role adjustments to better align with employee strengths</li>
+                        </ul>
+                    </div>
+                    """, unsafe_allow_html=True)
+                elif risk_score > 0.25:  # Moderate risk
+                    st.markdown("""
+                    <div style="background-color: #FEF9E7; padding: 15px; border-radius: 10px; border-left: 5px solid #F39C12; width: 85%;">
+                        <h4 style="color: #F39C12; margin-top: 0;">Preventive Measures</h4>
+                        <ul style="color: #333;"> <!-- Added color to ensure visibility -->
+                            <li>Schedule regular check-ins to gauge job satisfaction</li>
+                            <li>Ensure competitive compensation based on market rates</li>
+                            <li>Provide learning and development opportunities</li>
+                            <li>Recognize contributions and achievements</li>
+                            <li>Consider potential career growth paths within the organization</li>
+                        </ul>
+                    </div>
+                    """, unsafe_allow_html=True)
+                else:  # Low risk
+                    st.markdown("""
+                    <div style="background-color: #EAFAF1; padding: 15px; border-radius: 10px; border-left: 5px solid #2ECC71; width: 85%;">
+                        <h4 style="color: #2ECC71; margin-top: 0;">Engagement Strategies</h4>
+                        <ul style="color: #333;"> <!-- Added color to ensure visibility -->
+                            <li>Continue regular feedback and recognition</li>
+                            <li>Identify opportunities for taking on new challenges</li>
+                            <li>Consider for mentoring or knowledge-sharing roles</li>
+                            <li>Involve in strategic initiatives and planning</li>
+                            <li>Continue to review compensation periodically to maintain market competitiveness</li>
+                        </ul>
+                    </div>
+                    """, unsafe_allow_html=True)
+            
+            except Exception as e:
+                st.error(f"Error making prediction: {e}")
+                st.markdown("Try adjusting the input values or check if all the required fields are filled correctly.")
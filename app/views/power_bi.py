@@ -0,0 +1,66 @@
+"""📊 Power BI Dashboards: screenshots of the dashboards and the demo video."""
+import os
+
+import streamlit as st
+
+from media_assets import DISPLAY_WIDTH, THUMBNAIL_WIDTH, variant_or_source
+from resources import (clip_video_path, general_analysis_image_path, labor_analysis_image_path, read_media,
+                       summary_image_path)
+
+
+# Power BI screenshot as a small WebP thumbnail, with the larger variant on request
+def show_dashboard_image(image_path, key):
+    full_size = st.toggle("Full resolution", key=key)
+    width = DISPLAY_WIDTH if full_size else THUMBNAIL_WIDTH
+    st.image(read_media(variant_or_source(image_path, width)), use_container_width=True)
+
+
+def render():
+    st.markdown('<p class="section-header">📊 Power BI Dashboards</p>', unsafe_allow_html=True)
+    
+    # Use tabs for organization
+    tabs = st.tabs(["General Analysis", "Labor Analysis", "Summary"])
+    
+    with tabs[0]:
+        show_dashboard_image(general_analysis_image_path, key='general_analysis_full_size')
+        with st.expander("Dashboard Details"):
+            st.markdown("""
+            The **General Analysis** dashboard provides a comprehensive overview of key workforce metrics:
+            
+            - Employee demographics and distribution
+            - Salary analysis across departments
+            - Tenure and experience visualization
+            - Performance metrics by team
+            """)
+    
+    with tabs[1]:
+        show_dashboard_image(labor_analysis_image_path, key='labor_analysis_full_size')
+        with st.expander("Dashboard Details"):
+            st.markdown("""
+            The **Labor Analysis** dashboard focuses on workforce productivity and engagement:
+            
+            - NPS scores and satisfaction metrics
+            - FTE distribution across departments
+            - Absenteeism patterns and trends
+            - Training effectiveness analysis
+            """)
+    
+    with tabs[2]:
+        show_dashboard_image(summary_image_path, key='summary_full_size')
+        with st.expander("Dashboard Details"):
+            st.markdown("""
+            The **Summary** dashboard provides a tabular overview of all metrics:
+            
+            - Employee roster with key indicators
+            - Hiring trends over time
+            - Working hours optimization
+            - Department-level performance metrics
+            """)
+    
+    # Dashboard demo video
+    st.subheader("Interactive Dashboard Demo")
+    # The video is only sent once someone asks for it
+    if st.session_state.get('show_demo_video') or st.button(
+            f"▶️ Load demo video ({os.path.getsize(clip_video_path) / 1024 / 1024:.1f} MB)", key='demo_video_button'):
+        st.session_state['show_demo_video'] = True
+        st.video(read_media(clip_video_path), format="video/mp4")
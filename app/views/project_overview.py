@@ -0,0 +1,547 @@
+"""📊 Project Overview: architecture, results, key metrics and conclusions."""
+import os
+
+import streamlit as st
+
+from media_assets import DISPLAY_WIDTH, variant_or_source
+from resources import current_dataset, dashboard_image_path, read_media
+
+
+def render():
+    df = current_dataset().df
+
+    st.markdown('<p class="section-header">📊 Project Overview</p>', unsafe_allow_html=True)
+    
+    # Create a submenu within Project Overview
+    overview_submenu = st.radio(
+        "Select overview section:",
+        ["Project Structure", "Results", "Key Metrics", "Conclusions"],
+        horizontal=True
+    )
+    
+    if overview_submenu == "Project Structure":
+        # Display project diagram
+        st.markdown("""
+        <h2 style="color: #3498DB; text-align: center; margin-bottom: 20px;">
+            Project Architecture
+        </h2>
+        """, unsafe_allow_html=True)
+        
+        # Use tabs for better organization
+        tab1, tab2, tab3 = st.tabs(["🔍 Functionality", "🛠️ Tools Used", "📋 Process"])
+        
+        with tab1:
+            # Functionality - Simple visual list with icons
+            st.markdown("""
+            <h3 style="color: #3498DB; text-align: center; margin-bottom: 20px;">Key Functionality</h3>
+            
+            <div style="background-color: #f5f9ff; padding: 15px; border-radius: 10px; margin-bottom: 10px;">
+                <h4 style="color: #3498DB; margin-top: 0;"><span style="font-size: 24px;">📈</span> Interactive Power BI Visualizations</h4>
+                <p style="margin-left: 35px; color: #555;">Dynamic filtering and drill-down capabilities</p>
+            </div>
+            
+            <div style="background-color: #f8f5ff; padding: 15px; border-radius: 10px; margin-bottom: 10px;">
+                <h4 style="color: #9B59B6; margin-top: 0;"><span style="font-size: 24px;">📊</span> Comprehensive KPI Tracking</h4>
+                <p style="margin-left: 35px; color: #555;">Real-time monitoring of critical HR metrics</p>
+            </div>
+            
+            <div style="background-color: #f5fff9; padding: 15px; border-radius: 10px; margin-bottom: 10px;">
+                <h4 style="color: #2ECC71; margin-top: 0;"><span style="font-size: 24px;">📅</span> Time-series Analysis</h4>
+                <p style="margin-left: 35px; color: #555;">Identify trends and patterns over time</p>
+            </div>
+            
+            <div style="background-color: #fff9f5; padding: 15px; border-radius: 10px; margin-bottom: 10px;">
+                <h4 style="color: #E74C3C; margin-top: 0;"><span style="font-size: 24px;">📊</span> Three Specialized Dashboards</h4>
+                <p style="margin-left: 35px; color: #555;">Tailored views for different analysis needs</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with tab2:
+            # Tools - Simple two-column layout
+            # Versión mucho más simple usando componentes nativos
+            st.subheader("Tools & Technologies")
+    
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("""
+                <div style="background-color: #f0f8ff; padding: 15px; border-radius: 10px; border: 1px solid #ddd;">
+                    <h3 style="color: #3498DB; text-align: center;">📊 Power BI</h3>
+                    <ul style="list-style-type: none; padding-left: 5px; color: #333;">
+                        <li style="margin-bottom: 5px;">✓ <span style="color: #333;">Interactive dashboards</span></li>
+                        <li style="margin-bottom: 5px;">✓ <span style="color: #333;">Customizable visuals</span></li>
+                        <li style="margin-bottom: 5px;">✓ <span style="color: #333;">Real-time filtering</span></li>
+                        <li style="margin-bottom: 5px;">✓ <span style="color: #333;">Data relationships</span></li>
+                    </ul>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col2:
+                st.markdown("""
+                <div style="background-color: #f0fff0; padding: 15px; border-radius: 10px; border: 1px solid #ddd;">
+                    <h3 style="color: #2ECC71; text-align: center;">🐍 Python Analysis</h3>
+                    <ul style="list-style-type: none; padding-left: 5px; color: #333;">
+                        <li style="margin-bottom: 5px;">✓ <span style="color: #333;">Pandas data cleaning</span></li>
+                        <li style="margin-bottom: 5px;">✓ <span style="color: #333;">Matplotlib visualization</span></li>
+                        <li style="margin-bottom: 5px;">✓ <span style="color: #333;">Seaborn statistical plots</span></li>
+                        <li style="margin-bottom: 5px;">✓ <span style="color: #333;">NumPy calculations</span></li>
+                    </ul>
+                </div>
+                """, unsafe_allow_html=True)
+
+            # Agrega un pequeño espacio entre las filas
+            st.markdown("<br>", unsafe_allow_html=True)
+            
+            # Segunda fila de tecnologías
+            col3, col4 = st.columns(2)
+            
+            with col3:
+                st.markdown("""
+                <div style="background-color: #f8f5ff; padding: 15px; border-radius: 10px; border: 1px solid #ddd;">
+                    <h3 style="color: #9B59B6; text-align: center;">🧠 Machine Learning</h3>
+                    <ul style="list-style-type: none; padding-left: 5px; color: #333;">
+                        <li style="margin-bottom: 5px;">✓ <span style="color: #333;">Predictive employee turnover models</span></li>
+                        <li style="margin-bottom: 5px;">✓ <span style="color: #333;">Scikit-learn classification algorithms</span></li>
+                        <li style="margin-bottom: 5px;">✓ <span style="color: #333;">Feature importance analysis</span></li>
+                        <li style="margin-bottom: 5px;">✓ <span style="color: #333;">Performance metric evaluation</span></li>
+                    </ul>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col4:
+                st.markdown("""
+                <div style="background-color: #fff8f5; padding: 15px; border-radius: 10px; border: 1px solid #ddd;">
+                    <h3 style="color: #E74C3C; text-align: center;">🌟 Streamlit</h3>
+                    <ul style="list-style-type: none; padding-left: 5px; color: #333;">
+                        <li style="margin-bottom: 5px;">✓ <span style="color: #333;">Interactive web applications</span></li>
+                        <li style="margin-bottom: 5px;">✓ <span style="color: #333;">Real-time data exploration</span></li>
+                        <li style="margin-bottom: 5px;">✓ <span style="color: #333;">Customizable user interface</span></li>
+                        <li style="margin-bottom: 5px;">✓ <span style="color: #333;">Integration with Python analytics</span></li>
+                    </ul>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with tab3:
+            # Process - Simple numbered steps
+            st.markdown("""
+            <h3 style="color: #3498DB; text-align: center; margin-bottom: 20px;">Development Process</h3>
+            
+            <div style="background-color: #f5f9ff; padding: 15px; border-radius: 10px; margin-bottom: 15px;">
+                <h4><span style="display: inline-block; background-color: #3498DB; color: white; border-radius: 50%; width: 30px; height: 30px; text-align: center; line-height: 30px; margin-right: 10px;">1</span> <span style="color: #555;">Data Extraction</span></h4>
+                <p style="margin-left: 40px; color: #555;">Connecting to HR systems and retrieving necessary workforce data</p>
+            </div>
+            
+            <div style="background-color: #f8f5ff; padding: 15px; border-radius: 10px; margin-bottom: 15px;">
+                <h4><span style="display: inline-block; background-color: #9B59B6; color: white; border-radius: 50%; width: 30px; height: 30px; text-align: center; line-height: 30px; margin-right: 10px;">2</span> <span style="color: #555;">Cleaning & Transformation</span></h4>
+                <p style="margin-left: 40px; color: #555;">Processing and standardizing data for consistent analysis</p>
+            </div>
+            
+            <div style="background-color: #f5fff9; padding: 15px; border-radius: 10px; margin-bottom: 15px;">
+                <h4><span style="display: inline-block; background-color: #2ECC71; color: white; border-radius: 50%; width: 30px; height: 30px; text-align: center; line-height: 30px; margin-right: 10px;">3</span> <span style="color: #555;">Exploratory Analysis</span></h4>
+                <p style="margin-left: 40px; color: #555;">Discovering patterns, relationships, and insights in the data</p>
+            </div>
+            
+            <div style="background-color: #fffcf5; padding: 15px; border-radius: 10px; margin-bottom: 15px;">
+                <h4><span style="display: inline-block; background-color: #F39C12; color: white; border-radius: 50%; width: 30px; height: 30px; text-align: center; line-height: 30px; margin-right: 10px;">4</span> <span style="color: #555;">Dashboard Creation</span></h4>
+                <p style="margin-left: 40px; color: #555;">Building interactive visualizations for data exploration</p>
+            </div>
+            
+            <div style="background-color: #fff9f5; padding: 15px; border-radius: 10px; margin-bottom: 15px;">
+                <h4><span style="display: inline-block; background-color: #E74C3C; color: white; border-radius: 50%; width: 30px; height: 30px; text-align: center; line-height: 30px; margin-right: 10px;">5</span> <span style="color: #555;">Metric Development</span></h4>
+                <p style="margin-left: 40px; color: #555;">Creating KPIs and metrics to track organizational performance</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    elif overview_submenu == "Results":
+        st.markdown('<p class="section-header">📈 Key Results</p>', unsafe_allow_html=True)
+    
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("""
+            <div style="background-color: #f5f9ff; padding: 15px; border-radius: 10px; border: 1px solid #ddd;">
+                <h3 style="color: #3498DB; text-align: center;">📊 Power BI Analysis</h3>
+                <ul style="list-style-type: none; padding-left: 5px; color: #333;">
+                    <li style="margin-bottom: 5px;">✓ <span style="color: #333;">Custom KPI calculations for retention, satisfaction and performance</span></li>
+                    <li style="margin-bottom: 5px;">✓ <span style="color: #333;">DAX calculated measures for advanced metric analysis</span></li>
+                    <li style="margin-bottom: 5px;">✓ <span style="color: #333;">Calculated columns for enhanced categorization</span></li>
+                    <li style="margin-bottom: 5px;">✓ <span style="color: #333;">Dynamic filtering for focused analysis</span></li>
+                </ul>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            st.markdown("""
+            <div style="background-color: #f0fff0; padding: 15px; border-radius: 10px; border: 1px solid #ddd;">
+                <h3 style="color: #2ECC71; text-align: center;">🐍 Python Insights</h3>
+                <ul style="list-style-type: none; padding-left: 5px; color: #333;">
+                    <li style="margin-bottom: 5px;">✓ <span style="color: #333;">Comprehensive data cleaning methodologies</span></li>
+                    <li style="margin-bottom: 5px;">✓ <span style="color: #333;">In-depth statistical analysis of key workforce variables</span></li>
+                    <li style="margin-bottom: 5px;">✓ <span style="color: #333;">Correlation analysis</span></li>
+                    <li style="margin-bottom: 5px;">✓ <span style="color: #333;">Outlier detection in salary and performance metrics</span></li>
+                </ul>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # Visualizaciones principales
+        st.markdown("<h3 style='text-align: center; color: #3498DB; margin-top: 20px;'>Key Findings Visualization</h3>", unsafe_allow_html=True)
+        
+        # Aquí añadimos una visualización de ejemplo
+        if os.path.exists(dashboard_image_path):
+            st.image(read_media(variant_or_source(dashboard_image_path, DISPLAY_WIDTH)), caption="Sample dashboard visualization",
+                     use_container_width=True)
+        else:
+            st.info("Dashboard visualization would appear here")
+        
+        # Métricas claves en formato visual
+        st.markdown("<h3 style='text-align: center; color: #3498DB; margin-top: 20px;'>Summary of Key Findings</h3>", unsafe_allow_html=True)
+        
+        findings_col1, findings_col2, findings_col3 = st.columns(3)
+        
+        with findings_col1:
+            st.markdown("""
+            <div style="background-color: #f8f5ff; padding: 15px; border-radius: 10px; text-align: center; border: 1px solid #ddd;">
+                <span style="font-size: 32px;">🔄</span>
+                <h4 style="margin: 10px 0; color: #9B59B6;">Turnover Patterns</h4>
+                <p style="color: #333;">Voluntary turnover rates are significantly higher in specific organizational business units across departments.</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with findings_col2:
+            st.markdown("""
+            <div style="background-color: #f0f8ff; padding: 15px; border-radius: 10px; text-align: center; border: 1px solid #ddd;">
+                <span style="font-size: 32px;">📈</span>
+                <h4 style="margin: 10px 0; color: #3498DB;">Performance Trends</h4>
+                <p style="color: #333;">Higher training hours are strongly correlated with significantly improved employee performance ratings.</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with findings_col3:
+            st.markdown("""
+            <div style="background-color: #f5fff9; padding: 15px; border-radius: 10px; text-align: center; border: 1px solid #ddd;">
+                <span style="font-size: 32px;">💰</span>
+                <h4 style="margin: 10px 0; color: #2ECC71;">Compensation Impact</h4>
+                <p style="color: #333;">Employees with below-average compensation exhibit attrition rates overall.</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+
+    elif overview_submenu == "Key Metrics":
+        st.markdown('<p class="section-header">📏 Key HR Metrics</p>', unsafe_allow_html=True)
+        
+        # Display metrics in cards - Primera fila
+        metric_col1, metric_col2, metric_col3 = st.columns(3)
+        
+        with metric_col1:
+            st.markdown("""
+            <div style="background-color: #f0f8ff; padding: 15px; border-radius: 10px; border: 1px solid #ddd; height: 100%;">
+                <div style="text-align: center; margin-bottom: 10px;">
+                    <span style="font-size: 36px;">🔄</span>
+                    <h3 style="margin: 5px 0; color: #3498DB;">Turnover Rate</h3>
+                </div>
+                <div style="text-align: center; margin: 15px 0;">
+            """, unsafe_allow_html=True)
+            
+            if df is not None:
+                turnover_rate = df['Rotación Externa'].mean() * 100
+                st.markdown(f'<p style="font-size: 28px; font-weight: bold; margin: 0; color: #3498DB;">{turnover_rate:.1f}%</p>', unsafe_allow_html=True)
+            else:
+                st.markdown('<p style="font-size: 28px; font-weight: bold; margin: 0; color: #3498DB;">--</p>', unsafe_allow_html=True)
+                
+            st.markdown("""
+                </div>
+                <div style="margin-top: 15px; color: #3498DB;">
+                    <p style="margin: 5px 0;"><strong>Definition:</strong> Percentage of employees who left during a period</p>
+                    <p style="margin: 5px 0;"><strong>Formula:</strong> (Employees who left / Total employees) × 100</p>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with metric_col2:
+            st.markdown("""
+            <div style="background-color: #f8f5ff; padding: 15px; border-radius: 10px; border: 1px solid #ddd; height: 100%;">
+                <div style="text-align: center; margin-bottom: 10px;">
+                    <span style="font-size: 36px;">📈</span>
+                    <h3 style="margin: 5px 0; color: #9B59B6;">NPS Score</h3>
+                </div>
+                <div style="text-align: center; margin: 15px 0;">
+            """, unsafe_allow_html=True)
+            
+            if df is not None:
+                avg_nps = df['NPS'].mean()
+                st.markdown(f'<p style="font-size: 28px; font-weight: bold; margin: 0; color: #9B59B6;">{avg_nps:.1f}</p>', unsafe_allow_html=True)
+            else:
+                st.markdown('<p style="font-size: 28px; font-weight: bold; margin: 0; color: #9B59B6;">--</p>', unsafe_allow_html=True)
+                
+            st.markdown("""
+                </div>
+                <div style="margin-top: 15px; color: #9B59B6;">
+                    <p style="margin: 5px 0;"><strong>Definition:</strong> Net Promoter Score measuring employee loyalty</p>
+                    <p style="margin: 5px 0;"><strong>Formula:</strong> Promoters % - Detractors %</p>
+                    <p style="margin: 5px 0;"><strong>Scale:</strong> 1-10, where 9-10: Promoters, 7-8: Passive, 1-6: Detractors</p>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with metric_col3:
+            st.markdown("""
+            <div style="background-color: #f5fff9; padding: 15px; border-radius: 10px; border: 1px solid #ddd; height: 100%;">
+                <div style="text-align: center; margin-bottom: 10px;">
+                    <span style="font-size: 36px;">📉</span>
+                    <h3 style="margin: 5px 0; color: #2ECC71;">Absenteeism</h3>
+                </div>
+                <div style="text-align: center; margin: 15px 0;">
+            """, unsafe_allow_html=True)
+            
+            if df is not None:
+                avg_days_lost = df['Días de Trabajo Perdido (Abs)'].mean()
+                st.markdown(f'<p style="font-size: 28px; font-weight: bold; margin: 0; color: #2ECC71;">{avg_days_lost:.1f} days</p>', unsafe_allow_html=True)
+            else:
+                st.markdown('<p style="font-size: 28px; font-weight: bold; margin: 0; color: #2ECC71;">--</p>', unsafe_allow_html=True)
+                
+            st.markdown("""
+                </div>
+                <div style="margin-top: 15px; color: #2ECC71;">
+                    <p style="margin: 5px 0;"><strong>Definition:</strong> Average work days lost per employee</p>
+                    <p style="margin: 5px 0;"><strong>Impact:</strong> High absenteeism can indicate workplace issues or job dissatisfaction</p>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # Pequeño espacio entre filas
+        st.markdown("<br>", unsafe_allow_html=True)
+        
+        # Segunda fila de métricas
+        metric_col4, metric_col5, metric_col6 = st.columns(3)
+        
+        with metric_col4:
+            st.markdown("""
+            <div style="background-color: #fff9f5; padding: 15px; border-radius: 10px; border: 1px solid #ddd; height: 100%;">
+                <div style="text-align: center; margin-bottom: 10px;">
+                    <span style="font-size: 36px;">📊</span>
+                    <h3 style="margin: 5px 0; color: #E74C3C;">Performance</h3>
+                </div>
+                <div style="text-align: center; margin: 15px 0;">
+            """, unsafe_allow_html=True)
+            
+            if df is not None:
+                avg_performance = df['Evaluación Desempeño'].mean()
+                st.markdown(f'<p style="font-size: 28px; font-weight: bold; margin: 0; color: #E74C3C;">{avg_performance:.1f}/10</p>', unsafe_allow_html=True)
+            else:
+                st.markdown('<p style="font-size: 28px; font-weight: bold; margin: 0; color: #E74C3C;">--</p>', unsafe_allow_html=True)
+                
+            st.markdown("""
+                </div>
+                <div style="margin-top: 15px; color: #E74C3C;">
+                    <p style="margin: 5px 0;"><strong>Definition:</strong> Average performance evaluation score</p>
+                    <p style="margin: 5px 0;"><strong>Scale:</strong> 1-10, with 10 being the highest performance</p>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with metric_col5:
+            st.markdown("""
+            <div style="background-color: #f5f5ff; padding: 15px; border-radius: 10px; border: 1px solid #ddd; height: 100%;">
+                <div style="text-align: center; margin-bottom: 10px;">
+                    <span style="font-size: 36px;">⏱️</span>
+                    <h3 style="margin: 5px 0; color: #3949AB;">Training Hours</h3>
+                </div>
+                <div style="text-align: center; margin: 15px 0;">
+            """, unsafe_allow_html=True)
+            
+            if df is not None:
+                avg_training = df['Horas de formación recibidas'].mean()
+                st.markdown(f'<p style="font-size: 28px; font-weight: bold; margin: 0; color: #3949AB;">{avg_training:.1f} hours</p>', unsafe_allow_html=True)
+            else:
+                st.markdown('<p style="font-size: 28px; font-weight: bold; margin: 0; color: #3949AB;">--</p>', unsafe_allow_html=True)
+                
+            st.markdown("""
+                </div>
+                <div style="margin-top: 15px; color: #3949AB;">
+                    <p style="margin: 5px 0;"><strong>Definition:</strong> Average training hours per employee</p>
+                    <p style="margin: 5px 0;"><strong>Impact:</strong> Investment in employee development and skill enhancement</p>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with metric_col6:
+            st.markdown("""
+            <div style="background-color: #fffdf5; padding: 15px; border-radius: 10px; border: 1px solid #ddd; height: 100%;">
+                <div style="text-align: center; margin-bottom: 10px;">
+                    <span style="font-size: 36px;">💰</span>
+                    <h3 style="margin: 5px 0; color: #F39C12;">Salary Growth</h3>
+                </div>
+                <div style="text-align: center; margin: 15px 0;">
+            """, unsafe_allow_html=True)
+            
+            if df is not None:
+                avg_salary_diff = df['Diferencia Salario'].mean()
+                pct_with_increase = (df['Diferencia Salario'] > 0).mean() * 100
+                st.markdown(f'<p style="font-size: 28px; font-weight: bold; margin: 0; color: #F39C12;">€{avg_salary_diff:.0f}</p>', unsafe_allow_html=True)
+                st.markdown(f'<p style="font-size: 14px; margin: 5px 0; color: #F39C12;">{pct_with_increase:.1f}% received an increase</p>', unsafe_allow_html=True)
+            else:
+                st.markdown('<p style="font-size: 28px; font-weight: bold; margin: 0; color: #F39C12;">--</p>', unsafe_allow_html=True)
+                
+            st.markdown("""
+                </div>
+                <div style="margin-top: 15px; color: #F39C12;">
+                    <p style="margin: 5px 0;"><strong>Definition:</strong> Average salary increase in 2020</p>
+                    <p style="margin: 5px 0;"><strong>Impact:</strong> Indicator of compensation strategy and employee value</p>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    elif overview_submenu == "Conclusions":
+        st.markdown('<p class="section-header">🎯 Project Conclusions</p>', unsafe_allow_html=True)
+        
+        # Key Findings with more visual formatting
+        st.markdown("<h3 style='text-align: center; color: #1E88E5;'>💡 Key Findings</h3>", unsafe_allow_html=True)
+    
+        # Two columns for findings to make it more compact
+        f_col1, f_col2 = st.columns(2)
+        
+        with f_col1:
+            st.markdown("""
+            <div style="background-color: #f0f8ff; padding: 15px; border-radius: 10px; border: 1px solid #ddd;">
+                <h3 style="color: #3498DB; text-align: center;">✅ Employee Retention</h3>
+                <p style="color: #333; margin: 5px 0;">• Compensation is a key driver</p>
+                <p style="color: #333; margin: 5px 0;">• Management quality matters</p>
+                <p style="color: #333; margin: 5px 0;">• Career development opportunities</p>
+                <p style="color: #333; margin: 5px 0;">• Strong correlation with training</p>
+                <p style="color: #333; margin: 5px 0;">• Higher investments = better outcomes</p>
+                <p style="color: #333; margin: 5px 0;">• Performance varies by department</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+        with f_col2:
+            st.markdown("""
+            <div style="background-color: #f5fff9; padding: 15px; border-radius: 10px; border: 1px solid #ddd;">
+                <h3 style="color: #2ECC71; text-align: center;">✅ Department Insights</h3>
+                <p style="color: #333; margin: 5px 0;">• Significant variations in engagement</p>
+                <p style="color: #333; margin: 5px 0;">• Performance differs across teams</p>
+                <p style="color: #333; margin: 5px 0;">• Turnover rates vary significantly</p>
+                <p style="color: #333; margin: 5px 0;">• NPS analysis revealed key factors</p>
+                <p style="color: #333; margin: 5px 0;">• Work-life balance is critical</p>
+                <p style="color: #333; margin: 5px 0;">• Recognition affects engagement</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+        
+        # Espacio entre secciones
+        st.markdown("<br>", unsafe_allow_html=True)
+        
+        # Recommendations section with visual indicators
+        st.markdown("<h3 style='text-align: center; color: #FF5722;'>🚀 Recommendations</h3>", unsafe_allow_html=True)
+        
+        rec_cols = st.columns(4)
+        
+        with rec_cols[0]:
+            st.markdown("""
+            <div style="background-color: #fff3e0; padding: 15px; border-radius: 10px; border: 1px solid #ddd; height: 100%; text-align: center;">
+                <div style="background-color: #FF9800; width: 60px; height: 60px; border-radius: 50%; margin: 0 auto 10px; display: flex; align-items: center; justify-content: center;">
+                    <span style="font-size: 2rem; color: white;">📚</span>
+                </div>
+                <h4 style="color: #FF9800; margin: 10px 0;">Targeted Training</h4>
+                <p style="color: #333; margin: 0;">Increase training in areas with lower performance scores</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with rec_cols[1]:
+            st.markdown("""
+            <div style="background-color: #e1f5fe; padding: 15px; border-radius: 10px; border: 1px solid #ddd; height: 100%; text-align: center;">
+                <div style="background-color: #03A9F4; width: 60px; height: 60px; border-radius: 50%; margin: 0 auto 10px; display: flex; align-items: center; justify-content: center;">
+                    <span style="font-size: 2rem; color: white;">🔄</span>
+                </div>
+                <h4 style="color: #03A9F4; margin: 10px 0;">Retention Strategy</h4>
+                <p style="color: #333; margin: 0;">Target efforts at departments with high turnover</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with rec_cols[2]:
+            st.markdown("""
+            <div style="background-color: #f3e5f5; padding: 15px; border-radius: 10px; border: 1px solid #ddd; height: 100%; text-align: center;">
+                <div style="background-color: #9C27B0; width: 60px; height: 60px; border-radius: 50%; margin: 0 auto 10px; display: flex; align-items: center; justify-content: center;">
+                    <span style="font-size: 2rem; color: white;">🌟</span>
+                </div>
+                <h4 style="color: #9C27B0; margin: 10px 0;">Engagement Initiatives</h4>
+                <p style="color: #333; margin: 0;">Address low NPS scores with targeted customer experience programs</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with rec_cols[3]:
+            st.markdown("""
+            <div style="background-color: #e8f5e9; padding: 15px; border-radius: 10px; border: 1px solid #ddd; height: 100%; text-align: center;">
+                <div style="background-color: #4CAF50; width: 60px; height: 60px; border-radius: 50%; margin: 0 auto 10px; display: flex; align-items: center; justify-content: center;">
+                    <span style="font-size: 2rem; color: white;">📊</span>
+                </div>
+                <h4 style="color: #4CAF50; margin: 10px 0;">Continuous Monitoring</h4>
+                <p style="color: #333; margin: 0;">Implement ongoing analytics for proactive management</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # Espacio entre secciones
+        st.markdown("<br>", unsafe_allow_html=True)
+        
+        # Future Directions with visual timeline
+        st.markdown("<h3 style='text-align: center; color: #4CAF50;'>🔮 Future Directions</h3>", unsafe_allow_html=True)
+        
+        # Progress bar to visualize implementation timeline
+        st.markdown("<p style='text-align: center; margin-bottom: 15px;'>Implementation Roadmap</p>", unsafe_allow_html=True)
+        st.progress(25)
+        
+        future_cols = st.columns(4)
+        
+        with future_cols[0]:
+            st.markdown("""
+            <div style="background-color: #e8f5e9; padding: 15px; border-radius: 10px; border: 1px solid #ddd; height: 100%; text-align: center;">
+                <div style="height: 5px; background-color: #4CAF50; margin: -15px -15px 15px -15px; border-radius: 10px 10px 0 0;"></div>
+                <p style="color: #4CAF50; font-weight: bold; margin-bottom: 10px;">Phase 1</p>
+                <div style="background-color: rgba(76, 175, 80, 0.2); width: 60px; height: 60px; border-radius: 50%; margin: 0 auto 10px; display: flex; align-items: center; justify-content: center;">
+                    <span style="font-size: 2rem;">🔄</span>
+                </div>
+                <p style="color: #333; margin: 0; font-size: 14px;">Data Integration & Centralization Platform</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with future_cols[1]:
+            st.markdown("""
+            <div style="background-color: #e3f2fd; padding: 15px; border-radius: 10px; border: 1px solid #ddd; height: 100%; text-align: center;">
+                <div style="height: 5px; background-color: #2196F3; margin: -15px -15px 15px -15px; border-radius: 10px 10px 0 0;"></div>
+                <p style="color: #2196F3; font-weight: bold; margin-bottom: 10px;">Phase 2</p>
+                <div style="background-color: rgba(33, 150, 243, 0.2); width: 60px; height: 60px; border-radius: 50%; margin: 0 auto 10px; display: flex; align-items: center; justify-content: center;">
+                    <span style="font-size: 2rem;">⏱️</span>
+                </div>
+                <p style="color: #333; margin: 0; font-size: 14px;">Real-Time Analytics Dashboards</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with future_cols[2]:
+            st.markdown("""
+            <div style="background-color: #fff8e1; padding: 15px; border-radius: 10px; border: 1px solid #ddd; height: 100%; text-align: center;">
+                <div style="height: 5px; background-color: #FFC107; margin: -15px -15px 15px -15px; border-radius: 10px 10px 0 0;"></div>
+                <p style="color: #FFC107; font-weight: bold; margin-bottom: 10px;">Phase 3</p>
+                <div style="background-color: rgba(255, 193, 7, 0.2); width: 60px; height: 60px; border-radius: 50%; margin: 0 auto 10px; display: flex; align-items: center; justify-content: center;">
+                    <span style="font-size: 2rem;">🔌</span>
+                </div>
+                <p style="color: #333; margin: 0; font-size: 14px;">Integration with HRIS Systems</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with future_cols[3]:
+            st.markdown("""
+            <div style="background-color: #f3e5f5; padding: 15px; border-radius: 10px; border: 1px solid #ddd; height: 100%; text-align: center;">
+                <div style="height: 5px; background-color: #9C27B0; margin: -15px -15px 15px -15px; border-radius: 10px 10px 0 0;"></div>
+                <p style="color: #9C27B0; font-weight: bold; margin-bottom: 10px;">Phase 4</p>
+                <div style="background-color: rgba(156, 39, 176, 0.2); width: 60px; height: 60px; border-radius: 50%; margin: 0 auto 10px; display: flex; align-items: center; justify-content: center;">
+                    <span style="font-size: 2rem;">📈</span>
+                </div>
+                <p style="color: #333; margin: 0; font-size: 14px;">Expanded Metrics for Deeper Insights</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # Signature
+        st.markdown("""
+        <div style="text-align: center; margin-top: 30px; color: #555;">
+        <p>Project developed by Jotis with love</p>
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,382 @@
+"""📈 Interactive Visualizations: filtered charts of the shared dataset and its incremental refresh.
+
+seaborn and matplotlib are only imported here and by the pages that plot
+with them, so pages without charts start without them.
+"""
+import io
+import json
+
+import matplotlib.pyplot as plt
+import pandas as pd
+import streamlit as st
+
+import charts
+import vega_charts
+from bulk_scoring import iter_chunks
+from dataset_store import ID_COLUMN
+from figure_cache import FigureCache, filter_state_key
+from instrumentation import span
+from resources import current_dataset
+from scatter import SCATTER_MODES, SCATTER_POINT_LIMIT, linear_fit, prepare_scatter
+from schema import memory_report
+
+
+# Rendered chart images shared by every session
+@st.cache_resource
+def get_figure_cache():
+    return FigureCache()
+
+
+# Create matplotlib/seaborn chart in memory
+def create_figure(plot_function, figsize=(10, 6), cache_key=None, **kwargs):
+    # Reruns with the same key reuse the PNG and never touch matplotlib
+    figure_cache = get_figure_cache()
+    if cache_key is not None:
+        png = figure_cache.get(cache_key)
+        if png is not None:
+            return png
+    
+    fig, ax = plt.subplots(figsize=figsize)
+    plot_function(ax=ax, **kwargs)
+    plt.tight_layout()
+    
+    # Convert plot to image (same settings as st.pyplot)
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=200, bbox_inches='tight')
+    plt.close(fig)
+    png = buf.getvalue()
+    
+    if cache_key is not None:
+        figure_cache.put(cache_key, png)
+    return png
+
+
+# Build a browser-rendered Vega-Lite spec, cached as JSON next to the PNGs
+def create_chart_spec(spec_function, cache_key=None, **kwargs):
+    figure_cache = get_figure_cache()
+    if cache_key is not None:
+        encoded = figure_cache.get(cache_key)
+        if encoded is not None:
+            return json.loads(encoded)
+    
+    spec = spec_function(**kwargs)
+    
+    if cache_key is not None:
+        figure_cache.put(cache_key, json.dumps(spec, ensure_ascii=False).encode())
+    return spec
+
+
+def render():
+    store, df, filter_index, aggregate_cube = current_dataset()
+
+    st.markdown('<p class="section-header">📈 Interactive Visualizations</p>', unsafe_allow_html=True)
+    
+    # Visualization selection
+    viz_options = [
+        "Age Distribution",
+        "Gender Distribution",
+        "Department Distribution",
+        "Salary Analysis",
+        "Tenure Analysis",
+        "Performance Metrics",
+        "Rotation Analysis",
+        "Training Impact"
+    ]
+    
+    # Row-level columns each visualization reads, so filtering only materializes those;
+    # counts, means, rates and histograms come from the aggregate cube
+    viz_columns = {
+        "Age Distribution": [],
+        "Gender Distribution": [],
+        "Department Distribution": [],
+        "Salary Analysis": ['Salario Anual Actual 2020', 'Departamento'],
+        "Tenure Analysis": ['Antigüedad Años', 'Edad', 'Sexo', 'Departamento'],
+        "Performance Metrics": ['Evaluación Desempeño', 'Departamento', 'Horas de formación recibidas', 'Antigüedad Años'],
+        "Rotation Analysis": [],
+        "Training Impact": ['Horas de formación recibidas', 'Departamento', 'Evaluación Desempeño']
+    }
+    
+    selected_viz = st.selectbox("Select visualization type:", viz_options)
+    
+    # Chart backends: browser-rendered Vega-Lite, or server-rendered matplotlib images
+    chart_backends = {"Interactive (Vega-Lite)": "vega-lite", "Static images (matplotlib)": "matplotlib"}
+    chart_backend = chart_backends[st.radio("Chart rendering:", list(chart_backends), horizontal=True)]
+    
+    # Check if data is loaded
+    if df is not None:
+        dept_filter, gender_filter, category_filter, age_range = [], [], [], None
+        
+        # Filter options
+        with st.expander("Visualization Filters"):
+            filter_col1, filter_col2 = st.columns(2)
+            
+            with filter_col1:
+                if 'Departamento' in df.columns:
+                    dept_options = filter_index.values('Departamento')
+                    dept_filter = st.multiselect(
+                        "Department",
+                        options=dept_options,
+                        default=dept_options[:5]
+                    )
+                
+                if 'Edad' in df.columns:
+                    age_min, age_max = (int(bound) for bound in filter_index.range_bounds())
+                    age_range = st.slider(
+                        "Age Range",
+                        min_value=age_min,
+                        max_value=age_max,
+                        value=(age_min, age_max)
+                    )
+            
+            with filter_col2:
+                if 'Sexo' in df.columns:
+                    gender_options = filter_index.values('Sexo')
+                    gender_filter = st.multiselect(
+                        "Gender",
+                        options=gender_options,
+                        default=gender_options
+                    )
+                
+                if 'Categoría laboral' in df.columns:
+                    category_options = filter_index.values('Categoría laboral')
+                    category_filter = st.multiselect(
+                        "Job Category",
+                        options=category_options,
+                        default=category_options[:3]
+                    )
+        
+        # Scatter charts switch to a sample or a density grid above the point limit
+        scatter_limit, scatter_mode = SCATTER_POINT_LIMIT, SCATTER_MODES[0]
+        if selected_viz in ("Tenure Analysis", "Performance Metrics", "Training Impact"):
+            with st.expander("Scatter Plot Options"):
+                scatter_limit = st.number_input(
+                    "Scatter point limit",
+                    min_value=100,
+                    value=SCATTER_POINT_LIMIT,
+                    step=1000
+                )
+                scatter_mode = st.radio("Above the limit, draw:", SCATTER_MODES, horizontal=True)
+        
+        # Apply filters: one combined bitmap, then copy only the columns the chart needs
+        selections = {
+            'Departamento': dept_filter,
+            'Sexo': gender_filter,
+            'Categoría laboral': category_filter
+        }
+        with span("filter"):
+            filtered_df = filter_index.select(
+                [column for column in viz_columns[selected_viz] if column in df.columns],
+                selections=selections,
+                value_range=age_range
+            )
+            
+            # Filtered KPIs are roll-ups of the precomputed cube cells
+            kpis = aggregate_cube.rollup(selections, age_range)
+        
+        # Charts are cached per (visualization, chart, filters, dataset version)
+        filter_state = filter_state_key(selections, age_range)
+        
+        def show_chart(chart_name, figsize=(10, 6), **data):
+            # Charts draw the filtered rows unless aggregated data is passed in
+            data = data or {'data': filtered_df}
+            cache_key = (chart_backend, selected_viz, chart_name, filter_state,
+                         scatter_limit, scatter_mode, df.attrs.get('version'))
+            spec_function = getattr(vega_charts, chart_name, None)
+            # Building the chart and handing it to Streamlit are profiled apart
+            with span(f"chart: {selected_viz} / {chart_name}"):
+                if chart_backend == "vega-lite" and spec_function is not None:
+                    with span("plot (Vega-Lite spec)"):
+                        spec = create_chart_spec(spec_function, cache_key=cache_key, **data)
+                    with span("serialize (st.vega_lite_chart)"):
+                        st.vega_lite_chart(spec, use_container_width=True)
+                else:
+                    # matplotlib fallback for the static backend and charts without a spec
+                    with span("plot (matplotlib)"):
+                        png = create_figure(getattr(charts, chart_name), figsize=figsize, cache_key=cache_key, **data)
+                    with span("serialize (st.image)"):
+                        st.image(png, use_container_width=True)
+        
+        def show_scatter(chart_name, x, y, hue=None, with_fit=False):
+            # All points, a stratified sample, or the "<chart>_density" variant, and a note saying which
+            plan = prepare_scatter(filtered_df, x, y, hue=hue, limit=scatter_limit, mode=scatter_mode)
+            if plan.kind == "density":
+                fit = {'fit': linear_fit(filtered_df, x, y)} if with_fit else {}
+                show_chart(f"{chart_name}_density", density=plan.data, **fit)
+            else:
+                show_chart(chart_name, data=plan.data)
+            st.caption(plan.message)
+        
+        # Display visualization based on selection
+        st.markdown(f"### {selected_viz}")
+        
+        if selected_viz == "Age Distribution":
+            show_chart("age_distribution", histogram=kpis.histogram('Edad'))
+            
+            # Include additional insights
+            st.markdown(f"""
+            **Key Insights:**
+            - Average age: {kpis.mean('Edad'):.1f} years
+            - Youngest employee: {kpis.min('Edad'):.0f} years
+            - Oldest employee: {kpis.max('Edad'):.0f} years
+            """)
+        
+        elif selected_viz == "Gender Distribution":
+            gender_counts = kpis.value_counts('Sexo')
+            show_chart("gender_distribution", gender_counts=gender_counts)
+            
+            # Show counts in a table
+            st.markdown("**Gender Breakdown:**")
+            st.dataframe(gender_counts.reset_index().rename(columns={'index': 'Gender', 'Sexo': 'Count'}))
+        
+        elif selected_viz == "Department Distribution":
+            # Horizontal bar chart of departments
+            show_chart("department_distribution", figsize=(10, 8),
+                       dept_counts=kpis.value_counts('Departamento'))
+            
+            # Show department percentages
+            st.markdown("**Department Size (% of workforce):**")
+            dept_pct = (kpis.value_counts('Departamento', normalize=True) * 100).reset_index()
+            dept_pct.columns = ['Department', 'Percentage']
+            dept_pct['Percentage'] = dept_pct['Percentage'].round(1).astype(str) + '%'
+            st.dataframe(dept_pct)
+        
+        elif selected_viz == "Salary Analysis":
+            # Create two columns for visualizations
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                show_chart("salary_distribution", histogram=kpis.histogram('Salario Anual Actual 2020'))
+            
+            with col2:
+                show_chart("salary_by_department")
+            
+            # Show salary statistics
+            st.markdown("**Salary Statistics:**")
+            # Moments from the cube; quartiles need the rows
+            salary_stats = kpis.describe('Salario Anual Actual 2020')
+            salary_quartiles = filtered_df['Salario Anual Actual 2020'].quantile([0.25, 0.5, 0.75])
+            st.dataframe({
+                'Metric': ['Average', 'Minimum', 'Maximum', '25th Percentile', 'Median', '75th Percentile'],
+                'Value': [
+                    f"€{salary_stats['mean']:,.0f}",
+                    f"€{salary_stats['min']:,.0f}",
+                    f"€{salary_stats['max']:,.0f}",
+                    f"€{salary_quartiles[0.25]:,.0f}",
+                    f"€{salary_quartiles[0.5]:,.0f}",
+                    f"€{salary_quartiles[0.75]:,.0f}"
+                ]
+            })
+        
+        elif selected_viz == "Tenure Analysis":
+            # Create two columns for visualizations
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                show_chart("tenure_distribution", histogram=kpis.histogram('Antigüedad Años'))
+            
+            with col2:
+                show_scatter("age_vs_tenure", 'Edad', 'Antigüedad Años', hue='Sexo')
+            
+            # Tenure by department
+            show_chart("tenure_by_department", figsize=(12, 6))
+        
+        elif selected_viz == "Performance Metrics":
+            # Create two columns for visualizations
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                show_chart("performance_distribution", histogram=kpis.histogram('Evaluación Desempeño'))
+            
+            with col2:
+                show_chart("performance_by_department")
+            
+            # Performance vs Training hours
+            show_scatter("training_vs_performance", 'Horas de formación recibidas', 'Evaluación Desempeño',
+                         hue='Departamento')
+        
+        elif selected_viz == "Rotation Analysis":
+            # Rotation counts
+            rotation_external = kpis.binary_counts('Rotación Externa')
+            rotation_internal = kpis.binary_counts('Rotación Interna')
+            
+            # Create two columns for visualizations
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                show_chart("external_rotation", figsize=(8, 8),
+                           rotation_counts=rotation_external)
+                
+                # Add metric
+                external_pct = (rotation_external.get(1, 0) / rotation_external.sum() * 100) if not rotation_external.empty else 0
+                st.metric("External Rotation Rate", f"{external_pct:.1f}%")
+            
+            with col2:
+                show_chart("internal_rotation", figsize=(8, 8),
+                           rotation_counts=rotation_internal)
+                
+                # Add metric
+                internal_pct = (rotation_internal.get(1, 0) / rotation_internal.sum() * 100) if not rotation_internal.empty else 0
+                st.metric("Internal Rotation Rate", f"{internal_pct:.1f}%")
+            
+            # Department rotation analysis
+            show_chart("rotation_by_department", figsize=(12, 6),
+                       dept_rotation=kpis.group_mean('Rotación Externa', 'Departamento') * 100)
+        
+        elif selected_viz == "Training Impact":
+            # Create two columns for visualizations
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                show_chart("training_distribution", histogram=kpis.histogram('Horas de formación recibidas'))
+            
+            with col2:
+                show_chart("training_by_department")
+            
+            # Correlation between training and performance
+            st.subheader("Training Impact on Performance")
+            show_scatter("training_regression", 'Horas de formación recibidas', 'Evaluación Desempeño',
+                         with_fit=True)
+            
+            # Calculate correlation
+            corr = kpis.corr('Horas de formación recibidas', 'Evaluación Desempeño')
+            st.metric("Correlation Coefficient", f"{corr:.3f}")
+        
+        # Apply an HR export of changed records and leavers without reloading the dataset
+        with st.expander("Incremental Data Refresh"):
+            st.markdown(
+                "Upload new or changed employee records (same columns as `data_cleaned.csv`, matched on "
+                f"`{ID_COLUMN}`) and list the IDs of employees who left. Only those rows are updated in the "
+                "dataset, filters and KPIs; the change is saved next to the CSV and replayed on restart."
+            )
+            changes_file = st.file_uploader("Changed or new records", type=["csv", "parquet"], key="refresh_file")
+            leavers_text = st.text_area("IDs of employees who left", placeholder="1024, 1187, 2301")
+            
+            if st.button("Apply changes", key="refresh_button"):
+                try:
+                    upserts = None
+                    if changes_file is not None:
+                        upserts = pd.concat([chunk for chunk, _ in iter_chunks(changes_file, changes_file.name)],
+                                            ignore_index=True)
+                    leavers = [int(value) for value in leavers_text.replace(",", " ").split()]
+                    st.session_state['refresh_summary'] = store.apply_changes(upserts, leavers)
+                    st.rerun()
+                except (KeyError, ValueError) as e:
+                    st.error(f"Error applying changes: {e}")
+            
+            if 'refresh_summary' in st.session_state:
+                summary = st.session_state['refresh_summary']
+                st.success(
+                    f"Inserted {summary.inserted:,}, updated {summary.updated:,} and removed {summary.removed:,} "
+                    f"employees in {summary.seconds * 1e3:,.0f} ms."
+                )
+                if summary.unknown_leavers:
+                    st.warning(f"{summary.unknown_leavers:,} leaver IDs were not in the dataset.")
+            st.caption(f"{len(df):,} employees · dataset version `{str(df.attrs.get('version'))[:12]}`")
+        
+        # Memory footprint of the typed dataset
+        with st.expander("Dataset Memory Usage"):
+            memory = memory_report(df)
+            st.markdown(f"**Total:** {memory['Bytes'].sum() / 1024:,.1f} KiB for {len(df):,} employees")
+            st.dataframe(memory.sort_values('Bytes', ascending=False).reset_index(drop=True))
+    else:
+        st.error("Dataset not loaded. Please ensure 'data_cleaned.csv' is available in the correct location.")
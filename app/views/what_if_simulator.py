@@ -0,0 +1,93 @@
+"""🧪 What-If Simulator: policy changes re-scored by the rule engine."""
+import matplotlib.pyplot as plt
+import numpy as np
+import streamlit as st
+
+from instrumentation import span
+from resources import current_dataset, get_what_if_simulator
+from what_if import OPERATIONS, PERCENT, POLICY_COLUMNS, Policy
+
+
+def render():
+    df = current_dataset().df
+
+    st.markdown('<p class="section-header">🧪 What-If Simulator</p>', unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div style="background-color: #f0f8ff; padding: 15px; border-radius: 10px; border-left: 5px solid #2E86C1; margin-bottom: 20px;">
+        <h3 style="color: #2E86C1; margin-top: 0;">Workforce Policy Simulation</h3>
+        <p style="color: var(--text-color, #333);">Apply policy changes to every employee (or one department) and see how the rule engine's expected leavers change by department. Expected leavers are the sum of the employees' risk scores.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    if df is None:
+        st.error("Dataset not loaded. Please ensure 'data_cleaned.csv' is available in the correct location.")
+    else:
+        simulator = get_what_if_simulator(str(df.attrs.get('version')), df)
+        if 'what_if_policies' not in st.session_state:
+            st.session_state['what_if_policies'] = []
+        
+        st.markdown("### Policy Changes")
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            policy_column = st.selectbox("Column", POLICY_COLUMNS, index=POLICY_COLUMNS.index("Salario Anual Actual 2020"))
+        with col2:
+            policy_operation = st.selectbox("Change", OPERATIONS)
+        with col3:
+            policy_value = st.number_input("Value", value=5.0, step=0.5)
+        with col4:
+            policy_group = st.selectbox("Who", ["All employees", *sorted(simulator.groups)])
+        
+        button_col1, button_col2 = st.columns(2)
+        if button_col1.button("Add Policy", key="what_if_add_button"):
+            st.session_state['what_if_policies'].append(Policy(
+                policy_column, policy_operation, float(policy_value),
+                None if policy_group == "All employees" else policy_group
+            ))
+        if button_col2.button("Clear Policies", key="what_if_clear_button"):
+            st.session_state['what_if_policies'] = []
+        
+        policies = st.session_state['what_if_policies']
+        if not policies:
+            st.info("Add a policy, e.g. +5% Salario Anual Actual 2020 for one department.")
+        else:
+            for policy in policies:
+                amount = f"{policy.value:+g}%" if policy.operation == PERCENT else f"{policy.operation.lower()} {policy.value:g}"
+                st.markdown(f"- **{policy.column}**: {amount} for {policy.group or 'all employees'}")
+            
+            try:
+                with span("prediction: what-if simulation"):
+                    result = simulator.simulate(policies)
+            except ValueError as e:
+                st.error(f"Error simulating policies: {e}")
+            else:
+                by_group = result.by_group
+                metric_col1, metric_col2, metric_col3 = st.columns(3)
+                metric_col1.metric("Expected Leavers", f"{by_group['Simulated expected leavers'].sum():,.1f}",
+                                   f"{by_group['Change'].sum():+,.1f}", delta_color="inverse")
+                metric_col2.metric("Predicted Leavers", f"{by_group['Simulated predicted leavers'].sum():,}",
+                                   f"{by_group['Simulated predicted leavers'].sum() - by_group['Predicted leavers'].sum():+,}",
+                                   delta_color="inverse")
+                metric_col3.metric("Employees Re-scored", f"{result.affected_rows:,}")
+                
+                if result.factors:
+                    st.caption(f"Re-evaluated {', '.join(result.factors)} for {result.affected_rows:,} employees "
+                               f"in {result.seconds * 1e3:,.1f} ms.")
+                else:
+                    st.caption("None of these columns feed the rule engine's risk factors, so no risk changes.")
+                
+                st.markdown("### Change in Expected Leavers by Department")
+                fig, ax = plt.subplots(figsize=(10, 6))
+                ax.barh(by_group.index, by_group['Change'],
+                        color=np.where(by_group['Change'] > 0, '#E74C3C', '#2ECC71'))
+                ax.axvline(0, color='#555', linewidth=0.8)
+                ax.set_xlabel('Change in expected leavers')
+                ax.spines['top'].set_visible(False)
+                ax.spines['right'].set_visible(False)
+                plt.tight_layout()
+                with span("serialize (st.pyplot)"):
+                    st.pyplot(fig)
+                
+                st.dataframe(by_group.style.format({
+                    'Expected leavers': '{:,.2f}', 'Simulated expected leavers': '{:,.2f}', 'Change': '{:+,.2f}'
+                }))
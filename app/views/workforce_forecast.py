@@ -0,0 +1,68 @@
+"""📆 Workforce Forecast: Monte Carlo headcount, FTE and salary cost per department."""
+import matplotlib.pyplot as plt
+import streamlit as st
+
+from forecast import METRICS as FORECAST_METRICS, TOTAL
+from instrumentation import span
+from resources import current_dataset, get_inference_session, run_forecast
+
+
+def render():
+    df = current_dataset().df
+
+    st.markdown('<p class="section-header">📆 Workforce Forecast</p>', unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div style="background-color: #f0f8ff; padding: 15px; border-radius: 10px; border-left: 5px solid #2E86C1; margin-bottom: 20px;">
+        <h3 style="color: #2E86C1; margin-top: 0;">Headcount and Attrition Forecast</h3>
+        <p style="color: var(--text-color, #333);">Monte Carlo simulation of who leaves over the coming months, from each employee's probability of leaving within a year. Leavers are not replaced.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    if df is None:
+        st.error("Dataset not loaded. Please ensure 'data_cleaned.csv' is available in the correct location.")
+    else:
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            forecast_engine = st.radio("Probability of leaving", ["Rule engine", "RandomForest model"])
+        with col2:
+            forecast_months = st.slider("Months ahead", 12, 36, 24, step=6)
+        with col3:
+            forecast_runs = st.selectbox("Simulation runs", [1000, 5000, 10000], index=2)
+        with col4:
+            forecast_seed = st.number_input("Random seed", 0, 1_000_000, 42)
+        
+        if forecast_engine == "RandomForest model" and get_inference_session() is None:
+            st.warning("The RandomForest model is not available. Switch to the rule engine to forecast.")
+        else:
+            with st.spinner(f"Simulating {forecast_runs:,} runs..."), span("prediction: forecast"):
+                forecast = run_forecast(str(df.attrs.get('version')), forecast_engine, forecast_months,
+                                        forecast_runs, int(forecast_seed), df)
+            
+            metric_col1, metric_col2 = st.columns(2)
+            with metric_col1:
+                forecast_metric = st.radio("Metric", FORECAST_METRICS, horizontal=True)
+            with metric_col2:
+                departments = forecast.bands.index.get_level_values(1).unique().tolist()
+                forecast_group = st.selectbox("Department", departments, index=departments.index(TOTAL))
+            
+            bands = forecast.bands.loc[(forecast_metric, forecast_group)]
+            fig, ax = plt.subplots(figsize=(10, 6))
+            ax.fill_between(bands.index, bands['p5'], bands['p95'], color='#2E86C1', alpha=0.2, label='5th-95th percentile')
+            ax.fill_between(bands.index, bands['p25'], bands['p75'], color='#2E86C1', alpha=0.4, label='25th-75th percentile')
+            ax.plot(bands.index, bands['p50'], color='#1B4F72', linewidth=2, label='Median')
+            ax.set_title(f"{forecast_metric}: {forecast_group}", fontsize=14)
+            ax.set_xlabel('Months from today')
+            ax.set_ylabel(forecast_metric)
+            ax.legend(loc='upper right')
+            ax.spines['top'].set_visible(False)
+            ax.spines['right'].set_visible(False)
+            plt.tight_layout()
+            with span("serialize (st.pyplot)"):
+                st.pyplot(fig)
+            
+            st.markdown(f"### {forecast_metric} in {forecast_months} Months by Department")
+            horizon = forecast.bands.loc[forecast_metric].xs(forecast_months, level='Month')
+            today = forecast.bands.loc[forecast_metric].xs(0, level='Month')['p50']
+            st.dataframe(horizon.assign(Today=today)[['Today', *horizon.columns]].style.format('{:,.1f}'))
+            st.caption(f"{forecast.runs:,} runs simulated in {forecast.seconds:.2f}s.")
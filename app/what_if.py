@@ -0,0 +1,127 @@
+"""What-if simulation of workforce policies on the rule engine's turnover risk.
+
+A ``Policy`` changes one column for every employee or for one department,
+e.g. ``Policy("Salario Anual Actual 2020", PERCENT, 5, "Departamento 3")``
+or ``Policy("Horas Jornada", CAP, 37.5)``. ``WhatIfSimulator`` scores the
+population once and keeps the raw risk factors, the risk scores and the
+expected leavers per department. ``simulate`` then only re-evaluates what a
+set of policies can change:
+
+* the factors whose inputs a policy touches (``FACTOR_INPUTS``): a salary
+  raise re-evaluates salary growth and salary alignment, not the other five;
+* on the rows the policies select;
+
+and updates the department totals by the difference on those rows. A policy
+on a column the rule engine does not read (such as ``Horas Jornada``)
+re-evaluates nothing and leaves every risk unchanged.
+"""
+import time
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from turnover_scoring import (FACTOR_INPUTS, INPUT_COLUMNS, RISK_FACTORS, RISK_THRESHOLD, combine_risk_factors,
+                              compute_risk_factor, compute_risk_factors, risk_inputs)
+
+GROUP_COLUMN = "Departamento"
+
+PERCENT = "Change by %"
+ADD = "Add"
+SET = "Set to"
+CAP = "Cap at"
+FLOOR = "Floor at"
+OPERATIONS = [PERCENT, ADD, SET, CAP, FLOOR]
+
+# Columns a policy may change: the rule engine inputs plus the working time columns
+POLICY_COLUMNS = [*INPUT_COLUMNS.values(), "Horas Jornada", "FTE", "Horas de formación recibidas"]
+
+Policy = namedtuple("Policy", ["column", "operation", "value", "group"], defaults=[None])
+SimulationResult = namedtuple("SimulationResult", ["by_group", "affected_rows", "factors", "seconds"])
+
+
+def apply_operation(values, operation, value):
+    """``values`` after one policy operation, as floats."""
+    values = np.asarray(values, dtype=float)
+    if operation == PERCENT:
+        return values * (1 + value / 100)
+    if operation == ADD:
+        return values + value
+    if operation == SET:
+        return np.full_like(values, value)
+    if operation == CAP:
+        return np.minimum(values, value)
+    if operation == FLOOR:
+        return np.maximum(values, value)
+    raise ValueError(f"Unknown operation {operation!r}, expected one of {OPERATIONS}")
+
+
+class WhatIfSimulator:
+    """Baseline rule engine scores of a population, re-scored incrementally under policies."""
+
+    def __init__(self, df, group_column=GROUP_COLUMN):
+        self.inputs = {arg: np.asarray(values, dtype=float) for arg, values in risk_inputs(df).items()}
+        self.factors = compute_risk_factors(**self.inputs)
+        _, self.risk = combine_risk_factors(self.factors)
+        self.codes, self.groups = pd.factorize(df[group_column], use_na_sentinel=False)
+        self.group_column = group_column
+        self.employees = np.bincount(self.codes, minlength=len(self.groups))
+        self.expected = np.bincount(self.codes, weights=self.risk, minlength=len(self.groups))
+        self.predicted = np.bincount(self.codes, weights=self.risk > RISK_THRESHOLD, minlength=len(self.groups))
+
+    def _group_mask(self, group):
+        if group is None:
+            return np.ones(len(self.codes), dtype=bool)
+        matches = np.flatnonzero(self.groups == group)
+        if not len(matches):
+            raise ValueError(f"Unknown {self.group_column} {group!r}")
+        return self.codes == matches[0]
+
+    def simulate(self, policies):
+        """``SimulationResult`` of applying ``policies`` in order to the baseline population."""
+        start = time.perf_counter()
+        arguments = {column: arg for arg, column in INPUT_COLUMNS.items()}
+        for policy in policies:
+            if policy.column not in POLICY_COLUMNS:
+                raise ValueError(f"Policies cannot change {policy.column!r}")
+            if policy.operation not in OPERATIONS:
+                raise ValueError(f"Unknown operation {policy.operation!r}, expected one of {OPERATIONS}")
+
+        # Only policies on rule engine inputs can change a risk
+        scoring_policies = [policy for policy in policies if policy.column in arguments]
+        masks = [self._group_mask(policy.group) for policy in scoring_policies]
+        rows = np.flatnonzero(np.logical_or.reduce(masks)) if masks else np.array([], dtype=np.intp)
+
+        changed_inputs = {}
+        for policy, mask in zip(scoring_policies, masks):
+            arg = arguments[policy.column]
+            values = changed_inputs.get(arg)
+            if values is None:
+                values = changed_inputs[arg] = self.inputs[arg][rows]
+            selected = mask[rows]
+            values[selected] = apply_operation(values[selected], policy.operation, policy.value)
+
+        factors = [factor for factor in RISK_FACTORS if any(arg in changed_inputs for arg in FACTOR_INPUTS[factor])]
+        expected, predicted = self.expected.copy(), self.predicted.copy()
+        if factors and len(rows):
+            inputs = {arg: changed_inputs.get(arg, self.inputs[arg][rows])
+                      for factor in factors for arg in FACTOR_INPUTS[factor]}
+            subset = {factor: self.factors[factor][rows] for factor in RISK_FACTORS}
+            for factor in factors:
+                subset[factor] = compute_risk_factor(factor, **{arg: inputs[arg] for arg in FACTOR_INPUTS[factor]})
+            _, risk = combine_risk_factors(subset)
+            codes, old_risk = self.codes[rows], self.risk[rows]
+            expected += np.bincount(codes, weights=risk - old_risk, minlength=len(self.groups))
+            predicted += np.bincount(codes, weights=(risk > RISK_THRESHOLD).astype(float)
+                                     - (old_risk > RISK_THRESHOLD), minlength=len(self.groups))
+
+        by_group = pd.DataFrame({
+            "Employees": self.employees,
+            "Expected leavers": self.expected,
+            "Simulated expected leavers": expected,
+            "Change": expected - self.expected,
+            "Predicted leavers": self.predicted.astype(int),
+            "Simulated predicted leavers": np.rint(predicted).astype(int),
+        }, index=pd.Index(self.groups, name=self.group_column)).sort_index()
+        return SimulationResult(by_group, len(rows) if factors else 0, factors, time.perf_counter() - start)
+
@@ -0,0 +1,75 @@
+"""KPI latency of AggregateCube roll-ups versus scanning the filtered rows.
+
+Builds a synthetic population (1M rows by default), applies the app's default
+filter selection and times the Interactive Visualizations KPIs (age stats,
+gender and department counts, rotation rates, training correlation) computed
+from the cube and from the rows selected by ``FilterIndex``.
+"""
+import argparse
+
+from common import print_table, synthetic_population, time_call
+from aggregates import AggregateCube
+from filters import FilterIndex
+from schema import apply_schema
+
+KPI_COLUMNS = ["Edad", "Sexo", "Departamento", "Rotación Externa", "Rotación Interna",
+               "Horas de formación recibidas", "Evaluación Desempeño"]
+
+
+def row_kpis(index, selections, age_range):
+    rows = index.select(KPI_COLUMNS, selections, age_range)
+    return (
+        rows['Edad'].mean(), rows['Edad'].min(), rows['Edad'].max(),
+        rows['Sexo'].value_counts(),
+        rows['Departamento'].value_counts(normalize=True),
+        rows['Rotación Externa'].value_counts(),
+        rows['Rotación Interna'].value_counts(),
+        rows.groupby('Departamento', observed=True)['Rotación Externa'].mean(),
+        rows[['Horas de formación recibidas', 'Evaluación Desempeño']].corr().iloc[0, 1],
+    )
+
+
+def cube_kpis(cube, selections, age_range):
+    kpis = cube.rollup(selections, age_range)
+    return (
+        kpis.mean('Edad'), kpis.min('Edad'), kpis.max('Edad'),
+        kpis.value_counts('Sexo'),
+        kpis.value_counts('Departamento', normalize=True),
+        kpis.binary_counts('Rotación Externa'),
+        kpis.binary_counts('Rotación Interna'),
+        kpis.group_mean('Rotación Externa', 'Departamento'),
+        kpis.corr('Horas de formación recibidas', 'Evaluación Desempeño'),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    df = apply_schema(synthetic_population(args.rows))
+    index = FilterIndex(df)
+    build_time, _ = time_call(lambda: AggregateCube(df), repeat=1)
+    cube = AggregateCube(df)
+
+    selections = {
+        "Departamento": index.values("Departamento")[:5],
+        "Sexo": index.values("Sexo"),
+        "Categoría laboral": index.values("Categoría laboral")[:3],
+    }
+    age_range = (25, 55)
+
+    rows = []
+    for name, function in [
+        ("AggregateCube roll-up", lambda: cube_kpis(cube, selections, age_range)),
+        ("FilterIndex.select + pandas", lambda: row_kpis(index, selections, age_range)),
+    ]:
+        median, best = time_call(function, repeat=7)
+        rows.append((name, f"{median * 1e3:.3f}", f"{best * 1e3:.3f}"))
+
+    print(f"{args.rows:,} rows, cube of {cube.n_cells:,} cells built in {build_time:.3f}s\n")
+    print_table(rows, ["KPIs", "median (ms)", "best (ms)"])
+
+
+if __name__ == "__main__":
+    main()
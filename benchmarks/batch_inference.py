@@ -0,0 +1,72 @@
+"""Batch scoring throughput: scikit-learn versus the flat forest engine.
+
+Scores batches of 1 to 100,000 employees with the RandomForest's
+``predict_proba``, the NumPy block engine and the compiled (numba) engine,
+and reports rows per second. Uses the saved RandomForest and a larger forest
+fitted on a resampled population; every engine must give exactly
+scikit-learn's probabilities. The compiled kernel is compiled (or loaded
+from its cache) before timing; it runs on every core, scikit-learn on one.
+"""
+import argparse
+import warnings
+
+import joblib
+import numpy as np
+
+from common import MODEL_PATH, load_reference, print_table, synthetic_population, time_call
+from forest_artifact import FlatForest
+from forest_engine import NUMBA, NUMPY, compiled_kernel
+from turnover_model import InferenceSession
+
+BATCH_SIZES = [1, 100, 1_000, 10_000, 100_000]
+
+
+def larger_forest(n_trees, n_rows):
+    from training import make_model, prepare_data
+
+    prepared = prepare_data(synthetic_population(n_rows))
+    model = make_model("Random Forest", n_estimators=n_trees).fit(prepared.X_train, prepared.y_train)
+    return {"model": model, "scaler": prepared.scaler, "features": prepared.features}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--trees", type=int, default=300, help="trees of the larger forest")
+    parser.add_argument("--rows", type=int, default=20_000, help="rows the larger forest is fitted on")
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    reference = load_reference()
+    population = synthetic_population(max(BATCH_SIZES))
+    backends = [NUMPY] + ([NUMBA] if compiled_kernel() is not None else [])
+    if len(backends) == 1:
+        print("numba is not installed: timing the NumPy engine only")
+
+    rows = []
+    packages = [("saved model", joblib.load(MODEL_PATH)),
+                (f"{args.trees} trees", larger_forest(args.trees, args.rows))]
+    for label, package in packages:
+        model = package["model"]
+        engine = FlatForest.from_sklearn(model).engine
+        X = np.ascontiguousarray(InferenceSession(package, reference).feature_matrix(population), dtype=np.float32)
+        for backend in backends:
+            # Compile (or load the cached kernel) and check the probabilities on the largest batch
+            assert np.array_equal(engine.predict_proba(X, backend=backend), model.predict_proba(X))
+
+        for size in BATCH_SIZES:
+            batch = X[:size]
+            # Repeat small batches so every timing covers at least 1,000 rows
+            number = max(1, 1_000 // size)
+            sklearn_seconds, _ = time_call(lambda: model.predict_proba(batch), args.repeat, number)
+            row = [label, f"{size:,}", f"{size / sklearn_seconds:,.0f}"]
+            for backend in backends:
+                seconds, _ = time_call(lambda: engine.predict_proba(batch, backend=backend), args.repeat, number)
+                row.append(f"{size / seconds:,.0f} ({sklearn_seconds / seconds:.1f}x)")
+            rows.append(row)
+
+    print_table(rows, ["forest", "batch rows", "sklearn (rows/s)", *[f"{backend} (rows/s)" for backend in backends]])
+
+
+if __name__ == "__main__":
+    main()
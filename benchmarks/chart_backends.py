@@ -0,0 +1,97 @@
+"""Server time and payload size of the matplotlib and Vega-Lite chart backends.
+
+For every chart of the Interactive Visualizations page, times the matplotlib
+path (draw + PNG at the app's dpi) against building the Vega-Lite spec and
+serializing it to JSON, and reports the bytes each backend sends to the
+browser. Uses data_cleaned.csv by default, or a synthetic population with
+``--rows``.
+"""
+import argparse
+import io
+import json
+import warnings
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from common import load_reference, print_table, synthetic_population, time_call
+from aggregates import AggregateCube
+import charts
+from schema import apply_schema
+import vega_charts
+
+ROW_CHARTS = [
+    "salary_by_department", "age_vs_tenure", "tenure_by_department", "performance_by_department",
+    "training_vs_performance", "training_by_department", "training_regression",
+]
+
+HISTOGRAM_CHARTS = {
+    "age_distribution": "Edad",
+    "salary_distribution": "Salario Anual Actual 2020",
+    "tenure_distribution": "Antigüedad Años",
+    "performance_distribution": "Evaluación Desempeño",
+    "training_distribution": "Horas de formación recibidas",
+}
+
+
+def chart_inputs(df):
+    """Keyword arguments of each chart, as the app passes them."""
+    kpis = AggregateCube(df).rollup()
+    inputs = {name: {"data": df} for name in ROW_CHARTS}
+    for name, column in HISTOGRAM_CHARTS.items():
+        inputs[name] = {"histogram": kpis.histogram(column)}
+    inputs["gender_distribution"] = {"gender_counts": kpis.value_counts("Sexo")}
+    inputs["department_distribution"] = {"dept_counts": kpis.value_counts("Departamento")}
+    inputs["external_rotation"] = {"rotation_counts": kpis.binary_counts("Rotación Externa")}
+    inputs["internal_rotation"] = {"rotation_counts": kpis.binary_counts("Rotación Interna")}
+    inputs["rotation_by_department"] = {
+        "dept_rotation": kpis.group_mean("Rotación Externa", "Departamento") * 100
+    }
+    return inputs
+
+
+def render_png(plot_function, **kwargs):
+    # Same settings as create_figure in views/visualizations.py
+    fig, ax = plt.subplots(figsize=(10, 6))
+    plot_function(ax=ax, **kwargs)
+    plt.tight_layout()
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=200, bbox_inches="tight")
+    plt.close(fig)
+    return buf.getvalue()
+
+
+def render_spec(spec_function, **kwargs):
+    return json.dumps(spec_function(**kwargs), ensure_ascii=False).encode()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=None, help="synthetic population size")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    warnings.filterwarnings("ignore")
+
+    df = apply_schema(synthetic_population(args.rows) if args.rows else load_reference())
+
+    rows = []
+    totals = [0.0, 0, 0.0, 0]
+    for name, kwargs in chart_inputs(df).items():
+        png_time, _ = time_call(lambda: render_png(getattr(charts, name), **kwargs), repeat=args.repeat)
+        spec_time, _ = time_call(lambda: render_spec(getattr(vega_charts, name), **kwargs), repeat=args.repeat)
+        png_bytes = len(render_png(getattr(charts, name), **kwargs))
+        spec_bytes = len(render_spec(getattr(vega_charts, name), **kwargs))
+        totals = [totals[0] + png_time, totals[1] + png_bytes, totals[2] + spec_time, totals[3] + spec_bytes]
+        rows.append((name, f"{png_time * 1e3:.1f}", f"{png_bytes / 1024:.1f}",
+                     f"{spec_time * 1e3:.1f}", f"{spec_bytes / 1024:.1f}"))
+    rows.append(("total", f"{totals[0] * 1e3:.1f}", f"{totals[1] / 1024:.1f}",
+                 f"{totals[2] * 1e3:.1f}", f"{totals[3] / 1024:.1f}"))
+
+    print(f"{len(df):,} rows\n")
+    print_table(rows, ["Chart", "matplotlib (ms)", "PNG (KiB)", "Vega-Lite (ms)", "spec (KiB)"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Shared helpers for the benchmark scripts.
+
+Run the scripts from the repository root, e.g. ``python benchmarks/prediction_latency.py``.
+"""
+import os
+import statistics
+import sys
+import time
+
+import pandas as pd
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_DIR = os.path.join(REPO_DIR, "app")
+DATA_PATH = os.path.join(REPO_DIR, "notebook", "data_cleaned.csv")
+MODEL_PATH = os.path.join(REPO_DIR, "models", "modelo_rotacion_externa_random_forest.pkl")
+
+# Make the app modules importable the same way Streamlit does
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
+
+
+def load_reference():
+    return pd.read_csv(DATA_PATH)
+
+
+def synthetic_population(n_rows, seed=42):
+    """Resample data_cleaned.csv to ``n_rows`` employees with unique IDs."""
+    reference = load_reference()
+    population = reference.sample(n=n_rows, replace=True, random_state=seed).reset_index(drop=True)
+    population["ID Empleado"] = range(1, n_rows + 1)
+    return population
+
+
+def time_call(function, repeat=5, number=1):
+    """Return (median, best) seconds per call of ``function`` over ``repeat`` rounds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        timings.append((time.perf_counter() - start) / number)
+    return statistics.median(timings), min(timings)
+
+
+def print_table(rows, headers):
+    widths = [max(len(str(value)) for value in column) for column in zip(headers, *rows)]
+    line = "  ".join(f"{{:<{width}}}" for width in widths)
+    print(line.format(*headers))
+    print(line.format(*("-" * width for width in widths)))
+    for row in rows:
+        print(line.format(*row))
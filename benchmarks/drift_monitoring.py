@@ -0,0 +1,66 @@
+"""Drift statistics per scored batch: streaming bin counts versus keeping every row.
+
+Feeds batches of a resampled population (with a shifted ``Edad`` to have
+some drift) to ``DriftMonitor`` and, for comparison, recomputes the exact
+two-sample KS statistic (scipy) over all rows scored so far, as a monitor
+that stores the rows would. Reports the time per batch and the memory the
+state holds after each batch, and the largest gap between the binned and the
+exact KS statistics.
+"""
+import argparse
+import time
+import warnings
+
+import numpy as np
+
+from common import MODEL_PATH, load_reference, print_table, synthetic_population
+from drift_monitor import monitor_for_session, monitored_columns
+from forest_artifact import load_model_package
+from turnover_model import InferenceSession
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batches", type=int, default=20)
+    parser.add_argument("--batch-rows", type=int, default=50_000)
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+    from scipy.stats import ks_2samp
+
+    reference = load_reference()
+    session = InferenceSession(load_model_package(MODEL_PATH), reference)
+    monitor = monitor_for_session(session, reference)
+    reference_columns = monitored_columns(session, reference, session.predict_proba(reference))
+
+    population = synthetic_population(args.batch_rows)
+    population["Edad"] += 5
+    batch = monitored_columns(session, population, session.predict_proba(population))
+
+    kept = {column: [] for column in batch}
+    rows = []
+    for index in range(1, args.batches + 1):
+        start = time.perf_counter()
+        monitor.update(batch)
+        summary = monitor.summary()
+        streaming_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        exact = {}
+        for column, values in batch.items():
+            kept[column].append(values)
+            exact[column] = ks_2samp(reference_columns[column], np.concatenate(kept[column])).statistic
+        exact_seconds = time.perf_counter() - start
+
+        ks_error = max(abs(exact[stats.column] - stats.ks) for stats in summary)
+        state_bytes = sum(values.nbytes for values in monitor.totals.values())
+        kept_bytes = sum(sum(values.nbytes for values in arrays) for arrays in kept.values())
+        if index == 1 or index == args.batches or index & (index - 1) == 0:
+            rows.append((index, f"{monitor.rows:,}", f"{streaming_seconds * 1e3:.1f}", f"{exact_seconds * 1e3:.1f}",
+                         f"{ks_error:.4f}", f"{state_bytes / 1e3:.1f}", f"{kept_bytes / 1e6:.1f}"))
+
+    print_table(rows, ["batch", "rows scored", "monitor (ms)", "exact KS over all rows (ms)", "KS error",
+                       "monitor state (KB)", "kept rows (MB)"])
+
+
+if __name__ == "__main__":
+    main()
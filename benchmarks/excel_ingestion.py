@@ -0,0 +1,47 @@
+"""Loading an .xlsx HR export: ``pd.read_excel`` versus the columnar cache.
+
+Writes a synthetic workbook shaped like ``notebook/data.xlsx`` (20k rows by
+default) and times ``pd.read_excel`` with openpyxl and calamine, building the
+cache with each reader, and loading it once built (the common case while the
+workbook is unchanged).
+"""
+import argparse
+import os
+import tempfile
+import warnings
+
+import pandas as pd
+
+from common import print_table, synthetic_population, time_call
+from excel_cache import CALAMINE, OPENPYXL, available_reader, build_excel_cache, read_excel_cached
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    readers = [OPENPYXL] + ([CALAMINE] if available_reader() == CALAMINE else [])
+    with tempfile.TemporaryDirectory() as directory:
+        xlsx_path = os.path.join(directory, "data.xlsx")
+        cache_path = xlsx_path + ".arrow"
+        synthetic_population(args.rows).to_excel(xlsx_path, index=False)
+
+        rows = []
+        for reader in readers:
+            median, _ = time_call(lambda: pd.read_excel(xlsx_path, engine=reader), repeat=args.repeat)
+            rows.append((f"pd.read_excel ({reader})", f"{median * 1e3:.0f}"))
+        for reader in readers:
+            median, _ = time_call(lambda: build_excel_cache(xlsx_path, cache_path, reader=reader), repeat=args.repeat)
+            rows.append((f"build cache ({reader})", f"{median * 1e3:.0f}"))
+        median, _ = time_call(lambda: read_excel_cached(xlsx_path), repeat=args.repeat)
+        rows.append(("read_excel_cached (cache built)", f"{median * 1e3:.0f}"))
+
+    print(f"{args.rows:,} rows, {os.cpu_count()} CPUs\n")
+    print_table(rows, ["step", "time (ms)"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Per-employee RandomForest explanations: one at a time versus batched and cached.
+
+Explains a resampled population with the path contributions of the saved
+RandomForest: employee by employee through scikit-learn's ``decision_path``
+(as a per-request explainer would, on a sample and extrapolated), in one
+batch with a cold ``AttributionCache``, and again with the cache warm, as a
+rerun of the "why" view does. All three must give the same contributions.
+"""
+import argparse
+import time
+import warnings
+
+import joblib
+import numpy as np
+
+from common import MODEL_PATH, load_reference, print_table, synthetic_population, time_call
+from attributions import RISK_SCORE_COLUMN, AttributionCache
+from turnover_model import InferenceSession
+
+SIZES = [1_000, 10_000, 50_000]
+
+
+def decision_path_contributions(model, row, leave_column):
+    # One employee, tree by tree: the change in the leaving probability at every split on its path
+    contributions = np.zeros(len(row))
+    for estimator in model.estimators_:
+        tree = estimator.tree_
+        value = tree.value[:, 0, :] / tree.value[:, 0, :].sum(axis=1, keepdims=True)
+        path = estimator.decision_path(row[np.newaxis, :].astype(np.float32)).indices
+        np.add.at(contributions, tree.feature[path[:-1]], value[path[1:], leave_column] - value[path[:-1], leave_column])
+    return contributions / len(model.estimators_)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--sample", type=int, default=50, help="employees explained one at a time")
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    package = joblib.load(MODEL_PATH)
+    session = InferenceSession(package, load_reference())
+    leave_column = list(session.model.classes_).index(1)
+
+    rows = []
+    for size in SIZES:
+        population = synthetic_population(size)
+        matrix = session.feature_matrix(population)
+
+        start = time.perf_counter()
+        one_by_one = np.array([decision_path_contributions(session.model, row, leave_column)
+                               for row in matrix[:args.sample]])
+        per_employee = (time.perf_counter() - start) / args.sample
+
+        cache = AttributionCache(session)
+        start = time.perf_counter()
+        explanations = cache.explain(population)
+        cold = time.perf_counter() - start
+        warm, _ = time_call(lambda: cache.explain(population), args.repeat)
+
+        contributions = explanations.drop(columns=[RISK_SCORE_COLUMN]).to_numpy()
+        assert np.allclose(contributions[:args.sample], one_by_one, atol=1e-12)
+        assert np.allclose(explanations[RISK_SCORE_COLUMN], session.predict_proba(population), atol=1e-12)
+        rows.append((f"{size:,}", f"{per_employee * size:.2f}", f"{cold:.3f}", f"{warm:.3f}"))
+
+    print_table(rows, ["employees", "one at a time (s, extrapolated)", "batched, cold cache (s)",
+                       "batched, warm cache (s)"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Filter latency of FilterIndex versus the original copy-and-mask block.
+
+Builds a synthetic population (1M rows by default), applies the app's default
+filter selection and times the combined bitmap, the boolean mask, the
+materialization of one chart's columns and the original ``df.copy()`` plus
+four boolean-indexing passes.
+"""
+import argparse
+
+from common import print_table, synthetic_population, time_call
+from filters import FilterIndex
+from schema import apply_schema
+
+
+def original_filter(df, dept_filter, age_range, gender_filter, category_filter):
+    filtered_df = df.copy()
+    filtered_df = filtered_df[filtered_df['Departamento'].isin(dept_filter)]
+    filtered_df = filtered_df[(filtered_df['Edad'] >= age_range[0]) & (filtered_df['Edad'] <= age_range[1])]
+    filtered_df = filtered_df[filtered_df['Sexo'].isin(gender_filter)]
+    filtered_df = filtered_df[filtered_df['Categoría laboral'].isin(category_filter)]
+    return filtered_df
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    df = apply_schema(synthetic_population(args.rows))
+    build_time, _ = time_call(lambda: FilterIndex(df), repeat=1)
+    index = FilterIndex(df)
+
+    selections = {
+        "Departamento": index.values("Departamento")[:5],
+        "Sexo": index.values("Sexo"),
+        "Categoría laboral": index.values("Categoría laboral")[:3],
+    }
+    age_range = (25, 55)
+    tenure_columns = ["Antigüedad Años", "Edad", "Sexo", "Departamento"]
+
+    cases = [
+        ("FilterIndex.bitmap", lambda: index.bitmap(selections, age_range)),
+        ("FilterIndex.mask", lambda: index.mask(selections, age_range)),
+        ("FilterIndex.select (Tenure Analysis columns)", lambda: index.select(tenure_columns, selections, age_range)),
+        ("copy + 4 boolean passes (original)", lambda: original_filter(
+            df, selections["Departamento"], age_range, selections["Sexo"], selections["Categoría laboral"])),
+    ]
+    rows = []
+    for name, function in cases:
+        median, best = time_call(function, repeat=7)
+        rows.append((name, f"{median * 1e3:.3f}", f"{best * 1e3:.3f}"))
+
+    print(f"{args.rows:,} rows, index built in {build_time:.3f}s, "
+          f"{index.count(selections, age_range):,} rows selected\n")
+    print_table(rows, ["Operation", "median (ms)", "best (ms)"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Histogram + KDE cost: sns.histplot(kde=True) over rows vs cube roll-ups.
+
+Builds a synthetic population (1M rows by default), applies the app's default
+filter selection and, for each histogram column, times drawing
+``sns.histplot(..., kde=True)`` from the filtered rows against rolling up
+the cube's fine-bin counts, summarizing them into bins and a binned KDE and
+drawing the result with ``charts``.
+"""
+import argparse
+import warnings
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+from common import print_table, synthetic_population, time_call
+from aggregates import AggregateCube
+import charts
+from filters import FilterIndex
+from histograms import HISTOGRAM_BINS
+from schema import apply_schema
+
+HISTOGRAM_CHARTS = {
+    "Edad": charts.age_distribution,
+    "Salario Anual Actual 2020": charts.salary_distribution,
+    "Antigüedad Años": charts.tenure_distribution,
+    "Evaluación Desempeño": charts.performance_distribution,
+    "Horas de formación recibidas": charts.training_distribution,
+}
+
+
+def draw_rows(values, bins):
+    fig, ax = plt.subplots()
+    sns.histplot(values, bins=bins, kde=True, ax=ax)
+    plt.close(fig)
+
+
+def draw_summary(kpis, column):
+    fig, ax = plt.subplots()
+    HISTOGRAM_CHARTS[column](ax, kpis.histogram(column))
+    plt.close(fig)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    warnings.filterwarnings("ignore")
+
+    df = apply_schema(synthetic_population(args.rows))
+    index = FilterIndex(df)
+    build_time, _ = time_call(lambda: AggregateCube(df), repeat=1)
+    cube = AggregateCube(df)
+
+    selections = {
+        "Departamento": index.values("Departamento")[:5],
+        "Sexo": index.values("Sexo"),
+        "Categoría laboral": index.values("Categoría laboral")[:3],
+    }
+    age_range = (25, 55)
+    rows = index.select(list(HISTOGRAM_BINS), selections, age_range)
+
+    table = []
+    for column, bins in HISTOGRAM_BINS.items():
+        summary_time, _ = time_call(lambda: cube.rollup(selections, age_range).histogram(column), repeat=args.repeat)
+        cube_time, _ = time_call(lambda: draw_summary(cube.rollup(selections, age_range), column), repeat=args.repeat)
+        row_time, _ = time_call(lambda: draw_rows(rows[column], bins), repeat=args.repeat)
+        table.append((column, f"{summary_time * 1e3:.2f}", f"{cube_time * 1e3:.1f}", f"{row_time * 1e3:.1f}"))
+
+    print(f"{args.rows:,} rows, {len(rows):,} selected, cube built in {build_time:.3f}s\n")
+    print_table(table, ["Column", "roll-up + KDE (ms)", "cube chart (ms)", "sns.histplot (ms)"])
+
+
+if __name__ == "__main__":
+    main()
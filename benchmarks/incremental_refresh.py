@@ -0,0 +1,69 @@
+"""Incremental refresh of the dashboard dataset versus rebuilding it.
+
+Builds a synthetic population (1M rows by default) and applies HR deltas of
+changed records, new hires and leavers two ways: ``DatasetStore.apply_changes``
+(rows, bitmaps and cube cells of the delta only) and the full path the app
+used before (edit the frame with pandas, then rebuild ``FilterIndex`` and
+``AggregateCube``). Both end with the same dataset.
+"""
+import argparse
+import statistics
+import time
+
+import numpy as np
+import pandas as pd
+
+from common import load_reference, print_table, synthetic_population
+from aggregates import AggregateCube
+from dataset_store import ID_COLUMN, DatasetStore
+from filters import FilterIndex
+from schema import apply_schema
+
+
+def make_delta(df, reference, n_changed, n_new, n_leavers, rng):
+    """Changed records (salary raise), new hires and leaver IDs drawn from ``df``."""
+    ids = df[ID_COLUMN].to_numpy()
+    picked = rng.choice(len(df), size=n_changed + n_leavers, replace=False)
+    changed = df.take(picked[:n_changed]).copy()
+    changed["Salario Anual Actual 2020"] = changed["Salario Anual Actual 2020"] + 500
+    hires = reference.sample(n_new, replace=True, random_state=int(rng.integers(2**31))).copy()
+    hires[ID_COLUMN] = np.arange(ids.max() + 1, ids.max() + 1 + n_new)
+    upserts = pd.concat([changed.astype(object), hires.astype(object)], ignore_index=True)
+    return upserts, ids[picked[n_changed:]]
+
+
+def full_rebuild(df, upserts, leavers):
+    upserts = apply_schema(upserts.infer_objects())
+    kept = df[~df[ID_COLUMN].isin(leavers) & ~df[ID_COLUMN].isin(upserts[ID_COLUMN])]
+    data = pd.concat([kept, upserts], ignore_index=True)
+    return data, FilterIndex(data), AggregateCube(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    reference = load_reference()
+    store = DatasetStore(apply_schema(synthetic_population(args.rows)))
+    rng = np.random.default_rng(0)
+
+    rows = []
+    for n_changed, n_new, n_leavers in [(10, 5, 5), (100, 50, 50), (1_000, 500, 500), (10_000, 5_000, 5_000)]:
+        incremental, rebuild = [], []
+        for _ in range(args.repeat):
+            upserts, leavers = make_delta(store.df, reference, n_changed, n_new, n_leavers, rng)
+            start = time.perf_counter()
+            full_rebuild(store.df, upserts, leavers)
+            rebuild.append(time.perf_counter() - start)
+            incremental.append(store.apply_changes(upserts, leavers).seconds)
+        rows.append((f"{n_changed:,} / {n_new:,} / {n_leavers:,}",
+                     f"{statistics.median(incremental) * 1e3:.0f}", f"{statistics.median(rebuild) * 1e3:.0f}"))
+
+    print(f"{args.rows:,} rows\n")
+    print_table(rows, ["changed / new / leavers", "apply_changes (ms)", "full rebuild (ms)"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Cost of the rerun instrumentation on the app's hot paths.
+
+Times sections the app profiles (a filtered selection with its KPI roll-up,
+rule engine scoring of one employee and of a batch), bare and inside a
+``span``: with profiling off, on with timings only, and on with
+``tracemalloc`` tracing allocations for the peak memory, as the app runs it.
+"""
+import argparse
+import os
+import tracemalloc
+
+from common import load_reference, print_table, synthetic_population, time_call
+from dataset_store import DatasetStore
+from instrumentation import ENABLE_VARIABLE, finish_rerun, span, start_rerun
+from turnover_scoring import score_turnover
+
+SELECTIONS = {"Departamento": ["Departamento 2", "Departamento 3"], "Sexo": ["Hombre", "Mujer"]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    population = synthetic_population(args.rows)
+    store = DatasetStore(population)
+    _, filter_index, aggregate_cube = store.snapshot()
+    employee = load_reference().head(1)
+
+    def filter_and_rollup():
+        filter_index.select(["Salario Anual Actual 2020", "Departamento"], selections=SELECTIONS)
+        aggregate_cube.rollup(SELECTIONS)
+
+    sections = {
+        "filter + KPI roll-up": (filter_and_rollup, 20),
+        "rule engine, 1 employee": (lambda: score_turnover(employee), 50),
+        f"rule engine, {args.rows:,} employees": (lambda: score_turnover(population), 3),
+    }
+
+    def in_span(function):
+        def run():
+            with span("section"):
+                function()
+        return run
+
+    def profiled_run(function, number, profiling, trace_memory=False):
+        # Each timing is one rerun with the section profiled in it
+        os.environ[ENABLE_VARIABLE] = "1" if profiling else ""
+        profile = start_rerun("benchmark", trace_memory)
+        try:
+            return time_call(in_span(function), repeat=5, number=number)[0]
+        finally:
+            finish_rerun(profile)
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+
+    rows = []
+    for name, (function, number) in sections.items():
+        bare, _ = time_call(function, repeat=5, number=number)
+        off = profiled_run(function, number, profiling=False)
+        timings = profiled_run(function, number, profiling=True)
+        traced = profiled_run(function, number, profiling=True, trace_memory=True)
+        rows.append((name, f"{bare * 1e3:.3f}", f"{off * 1e3:.3f}", f"{timings * 1e3:.3f}",
+                     f"{traced * 1e3:.3f}", f"{traced / bare:.2f}x"))
+
+    print_table(rows, ["section", "bare (ms)", "profiling off (ms)", "timings (ms)", "timings + tracemalloc (ms)",
+                       "traced / bare"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Media bytes each page sends on its first paint: original PNGs and video vs WebP variants.
+
+Lists, per page, the media a new session receives before anything is
+clicked, as the original files and as the variants of ``media_assets``
+(the sidebar image is on every page; the demo video now waits for its
+button). Also times building the variants from a copy of the images (a
+cold start) and looking them up once they exist.
+"""
+import os
+import shutil
+import tempfile
+
+from common import APP_DIR, print_table, time_call
+from media_assets import APP_IMAGES, DISPLAY_WIDTH, SIDEBAR_WIDTH, THUMBNAIL_WIDTH, build_all, variant
+
+SIDEBAR = [("funko.png", SIDEBAR_WIDTH)]
+
+# Media on the first paint of each page: (file, variant width), a width of None being sent as is
+PAGES = {
+    "Home & Objectives": ([], []),
+    "Project Overview": ([("dashboard.png", None)], [("dashboard.png", DISPLAY_WIDTH)]),
+    "Power BI Dashboards": (
+        [("general_analysis.png", None), ("labor_analysis.png", None), ("summary.png", None), ("clip.mp4", None)],
+        [("general_analysis.png", THUMBNAIL_WIDTH), ("labor_analysis.png", THUMBNAIL_WIDTH),
+         ("summary.png", THUMBNAIL_WIDTH)],
+    ),
+}
+
+
+def media_size(directory, name, width):
+    path = os.path.join(directory, name)
+    return os.path.getsize(path if width is None else variant(path, width))
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        for name in APP_IMAGES:
+            shutil.copy2(os.path.join(APP_DIR, name), directory)
+        cold, _ = time_call(lambda: build_all(directory), repeat=1)
+        warm, _ = time_call(lambda: build_all(directory), repeat=5, number=10)
+
+        rows = []
+        for page, (before, after) in PAGES.items():
+            before_bytes = sum(os.path.getsize(os.path.join(APP_DIR, name)) for name, _ in [*SIDEBAR, *before])
+            after_bytes = sum(media_size(directory, name, width) for name, width in after)
+            after_bytes += sum(media_size(directory, name, width) for name, width in SIDEBAR)
+            rows.append((page, f"{before_bytes / 1024:,.0f}", f"{after_bytes / 1024:,.0f}",
+                         f"{before_bytes / after_bytes:.0f}x"))
+
+    print_table(rows, ["page", "original media (KiB)", "variants (KiB)", "smaller"])
+    print()
+    print(f"Building every variant: {cold * 1e3:,.0f} ms cold, {warm * 1e3:.2f} ms once built")
+
+
+if __name__ == "__main__":
+    main()
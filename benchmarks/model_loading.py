@@ -0,0 +1,95 @@
+"""Cold-start model loading: pickled package versus the flat forest artifact.
+
+Loads each model in fresh processes, as a new app worker does, and reports
+the time of the load call and the resident memory it adds. pandas and
+pyarrow are imported first, as the app already has them; the scikit-learn
+imports the pickle needs are part of its load. Uses the saved RandomForest and a larger forest fitted on a
+resampled population; both must give the same probabilities from either
+file.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import warnings
+
+import joblib
+import numpy as np
+
+from common import APP_DIR, MODEL_PATH, load_reference, print_table, synthetic_population
+from forest_artifact import build_forest_artifact, load_forest_package
+from turnover_model import InferenceSession
+
+LOAD_SCRIPT = """
+import json, os, sys, time, warnings
+import pandas, pyarrow.feather
+sys.path.insert(0, {app_dir!r})
+warnings.simplefilter("ignore")
+
+def rss():
+    with open("/proc/self/statm") as handle:
+        return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+before = rss()
+start = time.perf_counter()
+{load}
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, rss() - before]))
+"""
+LOADERS = {
+    "joblib.load (.pkl)": "import joblib; package = joblib.load({path!r})",
+    "load_forest_package (.arrow)": "from forest_artifact import load_forest_package; "
+                                    "package = load_forest_package({path!r})",
+}
+
+
+def cold_load(loader, path, repeat):
+    script = LOAD_SCRIPT.format(app_dir=APP_DIR, load=LOADERS[loader].format(path=path))
+    runs = [json.loads(subprocess.run([sys.executable, "-c", script], check=True, capture_output=True,
+                                      text=True).stdout) for _ in range(repeat)]
+    return statistics.median(run[0] for run in runs), statistics.median(run[1] for run in runs)
+
+
+def larger_forest(n_trees, n_rows):
+    from training import make_model, prepare_data
+
+    prepared = prepare_data(synthetic_population(n_rows))
+    model = make_model("Random Forest", n_estimators=n_trees).fit(prepared.X_train, prepared.y_train)
+    return {"model": model, "scaler": prepared.scaler, "features": prepared.features}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--trees", type=int, default=500, help="trees of the larger forest")
+    parser.add_argument("--rows", type=int, default=50_000, help="rows the larger forest is fitted on")
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    reference = load_reference()
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        packages = [("saved model", joblib.load(MODEL_PATH)),
+                    (f"{args.trees} trees, {args.rows:,} rows", larger_forest(args.trees, args.rows))]
+        for label, package in packages:
+            pkl_path = os.path.join(directory, f"{len(rows)}.pkl")
+            joblib.dump(package, pkl_path)
+            artifact_path = build_forest_artifact(pkl_path)
+            flat = load_forest_package(artifact_path)
+            expected = InferenceSession(package, reference).predict_proba(reference)
+            assert np.array_equal(InferenceSession(flat, reference).predict_proba(reference), expected)
+
+            nodes = len(flat["model"].threshold)
+            for loader, path in zip(LOADERS, (pkl_path, artifact_path)):
+                seconds, memory = cold_load(loader, path, args.repeat)
+                rows.append((label, f"{nodes:,}", loader, f"{os.path.getsize(path) / 1e6:.1f}",
+                             f"{seconds * 1e3:.1f}", f"{memory / 1e6:.1f}"))
+
+    print_table(rows, ["forest", "nodes", "load", "file (MB)", "load (ms)", "added RSS (MB)"])
+
+
+if __name__ == "__main__":
+    main()
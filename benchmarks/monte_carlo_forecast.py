@@ -0,0 +1,76 @@
+"""Monte Carlo workforce forecast: month-by-month loops versus vectorized runs.
+
+Forecasts headcount, FTE and salary cost per department over 36 months
+from the rule engine's probabilities, for the full population and a
+resampled larger one. The loop baseline steps every run month by month
+(vectorized over employees only) and is timed on a sample of runs and
+extrapolated. The vectorized forecast runs in this process and on process
+pools of 2, 4, ... workers (up to the usable cores); every worker count
+must give the same bands for the same seed.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from common import load_reference, print_table, synthetic_population
+from forecast import forecast_inputs, rule_engine_probabilities, simulate
+from training import default_workers
+
+MONTHS = 36
+
+
+def loop_forecast(inputs, probabilities, runs, seed):
+    # One run at a time, one month at a time
+    rng = np.random.default_rng(seed)
+    monthly = 1 - (1 - probabilities) ** (1 / 12)
+    n_groups = len(inputs.groups)
+    staffing = np.empty((runs, len(inputs.weights), n_groups, inputs.months + 1))
+    for run in range(runs):
+        present = np.ones(len(probabilities), dtype=bool)
+        for month in range(inputs.months + 1):
+            if month:
+                present &= rng.random(len(probabilities)) >= monthly
+            for metric, weights in enumerate(inputs.weights):
+                staffing[run, metric, :, month] = np.bincount(inputs.group, weights=weights * present,
+                                                              minlength=n_groups)
+    return staffing
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10_000)
+    parser.add_argument("--rows", type=int, default=20_000, help="employees of the larger population")
+    parser.add_argument("--loop-runs", type=int, default=100, help="runs the loop baseline is timed on")
+    args = parser.parse_args()
+
+    worker_counts = [1]
+    while worker_counts[-1] * 2 <= default_workers():
+        worker_counts.append(worker_counts[-1] * 2)
+
+    rows = []
+    populations = [("data_cleaned.csv", load_reference()), (f"{args.rows:,} employees", synthetic_population(args.rows))]
+    for label, population in populations:
+        probabilities = rule_engine_probabilities(population)
+        inputs = forecast_inputs(population, probabilities, MONTHS)
+
+        start = time.perf_counter()
+        loop_forecast(inputs, probabilities, args.loop_runs, 0)
+        loop_seconds = (time.perf_counter() - start) / args.loop_runs * args.runs
+        row = [label, f"{args.runs:,}", f"{loop_seconds:.1f}"]
+
+        reference = None
+        for workers in worker_counts:
+            forecast = simulate(inputs, args.runs, workers=workers)
+            if reference is None:
+                reference = forecast.bands
+            assert forecast.bands.equals(reference)
+            row.append(f"{forecast.seconds:.2f}")
+        rows.append(row)
+
+    print_table(rows, ["population", "runs", "month-by-month loop (s, extrapolated)",
+                       *[f"vectorized, {workers} worker{'s' if workers > 1 else ''} (s)" for workers in worker_counts]])
+
+
+if __name__ == "__main__":
+    main()
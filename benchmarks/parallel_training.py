@@ -0,0 +1,47 @@
+"""Wall-clock time of training the turnover models serially versus on a process pool.
+
+Runs the notebook's LogisticRegression / RandomForest / GradientBoosting fits
+and 5-fold cross-validation (``training.train_models``) one after another in
+one process, as the notebook does, and on pools of 2, 4, ... workers up to
+the usable cores, on data_cleaned.csv and on a resampled population. Every
+run must give the same scores.
+"""
+import argparse
+import time
+import warnings
+
+from common import load_reference, print_table, synthetic_population
+from training import default_workers, prepare_data, train_models
+
+
+def timed_training(prepared, workers):
+    start = time.perf_counter()
+    results = train_models(prepared, workers=workers)
+    return time.perf_counter() - start, {name: result[2:] for name, result in results.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5_000, help="size of the resampled population")
+    parser.add_argument("--workers", type=int, nargs="+", help="pool sizes to time (default: 2, 4, ... cores)")
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    cores = default_workers()
+    worker_counts = args.workers or [count for count in (2, 4, 8, 16, 32, 64) if count < cores] + [cores]
+    rows = []
+    for label, data in [("data_cleaned.csv", load_reference()), (f"{args.rows:,} rows", synthetic_population(args.rows))]:
+        prepared = prepare_data(data)
+        serial, expected = timed_training(prepared, 1)
+        rows.append((label, "serial (notebook)", f"{serial:.2f}", "1.0×"))
+        for workers in [count for count in worker_counts if count > 1]:
+            elapsed, scores = timed_training(prepared, workers)
+            assert scores == expected, f"{workers} workers changed the scores"
+            rows.append((label, f"{workers} workers", f"{elapsed:.2f}", f"{serial / elapsed:.1f}×"))
+
+    print(f"{cores} usable CPUs, {len(prepared.features)} features\n")
+    print_table(rows, ["data", "training", "wall clock (s)", "speed-up"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Per-request latency of the rule engine versus the saved RandomForest.
+
+Times one-employee requests (what the prediction form does on every click)
+and batch scoring for both engines. The model package is loaded and the
+inference session built once, as ``get_inference_session`` does in the app.
+"""
+import argparse
+import time
+import warnings
+
+import joblib
+
+from common import MODEL_PATH, load_reference, print_table, synthetic_population, time_call
+from turnover_model import InferenceSession
+from turnover_scoring import score_turnover
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200, help="single-employee requests per round")
+    parser.add_argument("--batch-rows", type=int, default=100_000, help="rows in the batch scoring test")
+    args = parser.parse_args()
+
+    reference = load_reference()
+
+    start = time.perf_counter()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")  # pickled with an older scikit-learn
+        package = joblib.load(MODEL_PATH)
+    session = InferenceSession(package, reference)
+    cold_start = time.perf_counter() - start
+
+    employee = reference.head(1)
+    batch = synthetic_population(args.batch_rows)
+
+    rows = []
+    for name, scorer in (("Rule engine", score_turnover), ("RandomForest", session.score)):
+        single_median, single_best = time_call(lambda: scorer(employee), number=args.requests)
+        batch_median, _ = time_call(lambda: scorer(batch), repeat=3)
+        rows.append((
+            name,
+            f"{single_median * 1e3:.2f}",
+            f"{single_best * 1e3:.2f}",
+            f"{batch_median:.3f}",
+            f"{args.batch_rows / batch_median:,.0f}",
+        ))
+
+    print(f"Model load + session warm-up: {cold_start:.3f}s (paid once per process)\n")
+    print_table(rows, ["Engine", "1 row median (ms)", "1 row best (ms)",
+                       f"{args.batch_rows:,} rows (s)", "rows/s"])
+
+
+if __name__ == "__main__":
+    main()
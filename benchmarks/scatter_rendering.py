@@ -0,0 +1,59 @@
+"""Scatter chart cost with all points vs a stratified sample vs a density grid.
+
+Builds a synthetic population (200k rows by default) and, for the "Age vs
+Tenure" and "Training Hours vs Performance" charts, times preparing the data
+and rendering it with both chart backends, and reports the payload sent to
+the browser (PNG or Vega-Lite JSON).
+"""
+import argparse
+import warnings
+
+from common import print_table, synthetic_population, time_call
+from chart_backends import render_png, render_spec
+import charts
+from scatter import DENSITY_MODE, SAMPLE_MODE, SCATTER_POINT_LIMIT, prepare_scatter
+from schema import apply_schema
+import vega_charts
+
+SCATTERS = [
+    ("age_vs_tenure", "Edad", "Antigüedad Años", "Sexo"),
+    ("training_vs_performance", "Horas de formación recibidas", "Evaluación Desempeño", "Departamento"),
+]
+
+
+def render(backend, chart_name, plan):
+    name, kwargs = (f"{chart_name}_density", {"density": plan.data}) if plan.kind == "density" \
+        else (chart_name, {"data": plan.data})
+    if backend == "matplotlib":
+        return render_png(getattr(charts, name), **kwargs)
+    return render_spec(getattr(vega_charts, name), **kwargs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--limit", type=int, default=SCATTER_POINT_LIMIT)
+    args = parser.parse_args()
+    warnings.filterwarnings("ignore")
+
+    df = apply_schema(synthetic_population(args.rows))
+    modes = [("all points", args.rows, SAMPLE_MODE), ("stratified sample", args.limit, SAMPLE_MODE),
+             ("density", args.limit, DENSITY_MODE)]
+
+    rows = []
+    for chart_name, x, y, hue in SCATTERS:
+        for label, limit, mode in modes:
+            prepare_time, _ = time_call(lambda: prepare_scatter(df, x, y, hue, limit, mode), repeat=3)
+            plan = prepare_scatter(df, x, y, hue, limit, mode)
+            for backend in ("matplotlib", "vega-lite"):
+                render_time, _ = time_call(lambda: render(backend, chart_name, plan), repeat=1)
+                payload = len(render(backend, chart_name, plan))
+                rows.append((chart_name, label, backend, f"{prepare_time * 1e3:.1f}",
+                             f"{render_time * 1e3:.0f}", f"{payload / 1024:,.1f}"))
+
+    print(f"{args.rows:,} rows, point limit {args.limit:,}\n")
+    print_table(rows, ["Chart", "Mode", "Backend", "prepare (ms)", "render (ms)", "payload (KiB)"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Cold-start import time and per-rerun time of the app's pages.
+
+Cold start: in a fresh interpreter per page, imports Streamlit, then the app
+shell (``resources`` and ``views``, what ``app.py`` imports), then the page's
+module, and compares with importing every page module up front, as the single
+``app.py`` script did. Per rerun: runs the app in Streamlit's ``AppTest``,
+opens each page once (its first visit) and then reruns it ``--reruns`` times,
+plus the page modes in ``PAGE_MODES``. A page that raises stops the run.
+"""
+import argparse
+import json
+import logging
+import subprocess
+import sys
+import time
+import warnings
+
+from common import APP_DIR, REPO_DIR, print_table, time_call
+from views import PAGES
+
+# Page modes walked after their page, as (page, {radio label: option})
+PAGE_MODES = [
+    ("🔮 ML Predictions", {"Prediction mode:": "Explain employees", "Prediction engine:": "RandomForest model"}),
+]
+
+IMPORT_SCRIPT = """
+import json, sys, time
+sys.path.insert(0, {app_dir!r})
+start = time.perf_counter()
+import streamlit
+streamlit_seconds = time.perf_counter() - start
+start = time.perf_counter()
+import resources, views
+shell_seconds = time.perf_counter() - start
+start = time.perf_counter()
+for module in {modules!r}:
+    views.page_module(module)
+print(json.dumps([streamlit_seconds, shell_seconds, time.perf_counter() - start]))
+"""
+
+
+def cold_import(pages):
+    script = IMPORT_SCRIPT.format(app_dir=APP_DIR, modules=list(pages))
+    output = subprocess.run([sys.executable, "-c", script], cwd=REPO_DIR, capture_output=True, text=True, check=True)
+    return json.loads(output.stdout.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="fresh interpreters per measurement")
+    parser.add_argument("--reruns", type=int, default=10)
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    def best_of(pages):
+        return min((cold_import(pages) for _ in range(args.repeat)), key=sum)
+
+    eager = best_of(PAGES)
+    rows = [("all pages up front", f"{eager[0] * 1e3:.0f}", f"{eager[1] * 1e3:.0f}", f"{eager[2] * 1e3:.0f}",
+             f"{sum(eager) * 1e3:.0f}")]
+    for page in PAGES:
+        streamlit_seconds, shell_seconds, page_seconds = best_of([page])
+        rows.append((page, f"{streamlit_seconds * 1e3:.0f}", f"{shell_seconds * 1e3:.0f}", f"{page_seconds * 1e3:.0f}",
+                     f"{(streamlit_seconds + shell_seconds + page_seconds) * 1e3:.0f}"))
+    print("Cold start imports (fresh interpreter, best of", args.repeat, "runs)")
+    print_table(rows, ["page", "streamlit (ms)", "app shell (ms)", "page modules (ms)", "total (ms)"])
+
+    from streamlit.testing.v1 import AppTest
+
+    # The sidebar menu's empty label logs a warning with a stack trace on every run
+    logging.disable(logging.WARNING)
+
+    app = AppTest.from_file(f"{APP_DIR}/app.py", default_timeout=600)
+    start = time.perf_counter()
+    app.run()
+    rows = [("first run (🏠 Home & Objectives)", f"{(time.perf_counter() - start) * 1e3:.0f}", "")]
+
+    def visit(label, select):
+        start = time.perf_counter()
+        select()
+        first_visit = time.perf_counter() - start
+        if app.exception:
+            raise RuntimeError(f"{label} raised: {app.exception[0].message}")
+        rerun, _ = time_call(app.run, repeat=args.reruns)
+        rows.append((label, f"{first_visit * 1e3:.0f}", f"{rerun * 1e3:.1f}"))
+
+    def select_mode(page, options):
+        app.sidebar.radio[0].set_value(page).run()
+        for radio in app.main.radio:
+            if radio.label in options:
+                radio.set_value(options[radio.label])
+        app.run()
+
+    for page in PAGES:
+        visit(page, lambda: app.sidebar.radio[0].set_value(page).run())
+    for page, options in PAGE_MODES:
+        visit(f"{page}: {', '.join(options.values())}", lambda: select_mode(page, options))
+    print()
+    print("AppTest page runs")
+    print_table(rows, ["page", "first visit (ms)", "rerun, median (ms)"])
+
+
+if __name__ == "__main__":
+    main()
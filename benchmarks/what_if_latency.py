@@ -0,0 +1,64 @@
+"""What-if policy simulation: re-scoring everyone versus the incremental simulator.
+
+Applies policy sets to a resampled population of 500,000 employees and
+computes the expected leavers per department, first by changing a copy of
+the frame and scoring it again with ``score_turnover``, then with
+``WhatIfSimulator.simulate``, which re-evaluates only the touched factors
+on the selected rows. Both must give the same totals.
+"""
+import argparse
+
+import numpy as np
+
+from common import print_table, synthetic_population, time_call
+from turnover_scoring import score_turnover
+from what_if import ADD, CAP, GROUP_COLUMN, PERCENT, Policy, WhatIfSimulator, apply_operation
+
+SCENARIOS = {
+    "+5% salary, Departamento 3": [Policy("Salario Anual Actual 2020", PERCENT, 5, "Departamento 3")],
+    "+5% salary, everyone": [Policy("Salario Anual Actual 2020", PERCENT, 5)],
+    "cap Horas Jornada at 37.5": [Policy("Horas Jornada", CAP, 37.5)],
+    "salary, sanctions and tenure": [Policy("Salario Anual Actual 2020", PERCENT, 5),
+                                     Policy("Neglicencias/Sanciones", CAP, 1, "Departamento 5"),
+                                     Policy("Antigüedad Años", ADD, 1)],
+}
+
+
+def full_rescore(population, policies):
+    changed = population.copy()
+    for policy in policies:
+        rows = (np.ones(len(changed), dtype=bool) if policy.group is None
+                else (changed[GROUP_COLUMN] == policy.group).to_numpy())
+        changed[policy.column] = changed[policy.column].astype(float)
+        changed.loc[rows, policy.column] = apply_operation(changed.loc[rows, policy.column], policy.operation,
+                                                           policy.value)
+    scores = score_turnover(changed)
+    return scores["risk_score"].groupby(changed[GROUP_COLUMN]).sum()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    population = synthetic_population(args.rows)
+    baseline_seconds, _ = time_call(lambda: WhatIfSimulator(population), 1)
+    simulator = WhatIfSimulator(population)
+
+    rows = []
+    for label, policies in SCENARIOS.items():
+        expected = full_rescore(population, policies)
+        result = simulator.simulate(policies)
+        assert np.allclose(result.by_group["Simulated expected leavers"], expected.reindex(result.by_group.index))
+        full_seconds, _ = time_call(lambda: full_rescore(population, policies), args.repeat)
+        simulated_seconds, _ = time_call(lambda: simulator.simulate(policies), args.repeat)
+        rows.append((label, f"{result.affected_rows:,}", len(result.factors), f"{full_seconds * 1e3:,.0f}",
+                     f"{simulated_seconds * 1e3:,.1f}"))
+
+    print(f"Baseline scores of {args.rows:,} employees: {baseline_seconds * 1e3:,.0f} ms (once per dataset version)")
+    print_table(rows, ["policies", "rows re-scored", "factors", "full re-score (ms)", "simulator (ms)"])
+
+
+if __name__ == "__main__":
+    main()